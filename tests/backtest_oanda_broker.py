@@ -1,9 +1,37 @@
 import unittest
 
 from trading.backtest.backtest_oanda_broker import BacktestBroker
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class FakeCandleCache(object):
+    def __init__(self, candle_store):
+        self.candle_store = candle_store
+        self.requests = []
+
+    def get_history(self, api, instrument, granularity, count, end=None):
+        self.requests.append((instrument, granularity, count))
+        return self.candle_store.slice(0, count)
 
 
 class BacktestOandaBrokerTests(unittest.TestCase):
+    def setUp(self):
+        candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': i,
+             u'time': u'2016-06-24T19:{minute:02d}:00.000000Z'.format(minute=i)}
+            for i in range(0, 50)
+        ]
+        self.candle_cache = FakeCandleCache(CandleStore.from_candles(candles, INSTRUMENT_EUR_USD,
+                                                                     GRANULARITY_TEN_MINUTE))
+
+        base_pair = {'currency': 'usd', 'starting_units': 0}
+        quote_pair = {'currency': 'eur', 'starting_units': 0}
+        self.broker = BacktestBroker(INSTRUMENT_EUR_USD, base_pair, quote_pair, candle_cache=self.candle_cache)
+        # Requests go to the candle cache, the API client is never called
+        self.broker._oanda = object()
+
     def test_representation(self):
         pass
 
@@ -11,16 +39,30 @@ class BacktestOandaBrokerTests(unittest.TestCase):
         pass
 
     def test_get_current_price_data(self):
-        pass
+        self.broker.get_backtest_price_data(30, GRANULARITY_TEN_MINUTE)
+
+        self.assertEqual(self.broker.get_current_price_data()['prices'][0]['ask'], 1.5)
+        self.assertEqual(self.broker.get_current_price_data(tick=3)['prices'][0]['ask'], 4.5)
 
     def test_get_historical_price_data(self):
-        pass
+        self.broker.get_backtest_price_data(30, GRANULARITY_TEN_MINUTE)
+
+        historical_data = self.broker.get_historical_price_data(count=10, granularity=GRANULARITY_TEN_MINUTE, tick=5)
+        self.assertEqual(len(historical_data['candles']), 10)
+        self.assertEqual(historical_data['candles'][0]['closeAsk'], 6.5)
+        self.assertEqual(historical_data['instrument'], INSTRUMENT_EUR_USD)
 
     def test_internal_get_current_price_data(self):
         pass
 
     def test_get_backtest_price_data(self):
-        pass
+        # Same argument order as BacktestDataBroker, the instrument defaults to the account instrument
+        self.broker.get_backtest_price_data(30, GRANULARITY_TEN_MINUTE)
+        self.broker.get_backtest_price_data(20, GRANULARITY_TEN_MINUTE, INSTRUMENT_EUR_USD)
+
+        self.assertEqual(self.candle_cache.requests, [(INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE, 30),
+                                                      (INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE, 20)])
+        self.assertEqual(len(self.broker.candle_store), 20)
 
     def test_get_order(self):
         pass
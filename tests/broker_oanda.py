@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+
+from trading.broker import oanda
+from trading.broker.oanda import OandaBroker
+from trading.candles import download
+from trading.candles.download import get_current_time
+from trading.candles.timestamps import format_candle_time
+from trading.constants.granularity import GRANULARITY_HOUR
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from tests.helpers import FakeOandaAPI, HOUR
+
+
+class OandaBrokerTests(unittest.TestCase):
+    def setUp(self):
+        last_hour = get_current_time() // HOUR * HOUR
+        self.now = last_hour + HOUR // 2
+        candles = [{u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i,
+                    u'openBid': 0.9 + i, u'highBid': 1.9 + i, u'lowBid': 0.4 + i, u'closeBid': 1.4 + i,
+                    u'volume': i, u'complete': i < 59, u'time': format_candle_time(last_hour - (59 - i) * HOUR)}
+                   for i in range(0, 60)]
+
+        self.broker = OandaBroker(INSTRUMENT_EUR_USD)
+        self.broker._oanda = FakeOandaAPI(candles)
+
+    def test_get_historical_price_data(self):
+        single_request = self.broker.get_historical_price_data(40, GRANULARITY_HOUR)
+        self.assertEqual(len(self.broker._oanda.requests), 1)
+
+        # Histories beyond the request cap are paged, the response keeps the single request format
+        self.broker._oanda.requests = []
+        with mock.patch.object(oanda, 'MAX_CANDLES_PER_REQUEST', 10), \
+                mock.patch.object(download, 'get_current_time', return_value=self.now):
+            paged_requests = self.broker.get_historical_price_data(40, GRANULARITY_HOUR)
+
+        # 40 candles widened by the sparse history factor are 60 hours, 9 hours per page of 10 candles
+        self.assertEqual(len(self.broker._oanda.requests), 7)
+        self.assertTrue(all(request['start'] is not None for request in self.broker._oanda.requests))
+        self.assertEqual(len(paged_requests['candles']), 40)
+        self.assertEqual(paged_requests, single_request)
+        self.assertEqual(paged_requests['candles'], self.broker._oanda.candles[-40:])
@@ -0,0 +1,85 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from trading.candles.binary import convert_json_file, load_candle_file, write_candle_file, read_candle_buffer, \
+    write_candle_buffer, calc_candle_buffer_size, iter_candle_file_chunks
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.store import CandleStore, CANDLE_FIELDS
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class CandleBinaryTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': i,
+             u'time': u'2016-06-24T19:{minute:02d}:00.000000Z'.format(minute=i)}
+            for i in range(0, 50)
+        ]
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_load_candle_file(self):
+        file_name = os.path.join(self.directory, 'eur_usd.candles')
+        write_candle_file(file_name, self.store)
+
+        mapped_store = load_candle_file(file_name)
+
+        self.assertEqual(mapped_store.instrument, INSTRUMENT_EUR_USD)
+        self.assertEqual(mapped_store.granularity, GRANULARITY_TEN_MINUTE)
+        self.assertEqual(len(mapped_store), 50)
+        self.assertEqual(os.path.getsize(file_name), calc_candle_buffer_size(50))
+
+        for field in CANDLE_FIELDS:
+            self.assertEqual(mapped_store.column(field).tolist(), self.store.column(field).tolist())
+
+        with self.assertRaises(ValueError):
+            mapped_store.column(CANDLE_FIELDS[1])[0] = 0
+
+    def test_candle_buffer(self):
+        buffer = bytearray(calc_candle_buffer_size(len(self.store)))
+        write_candle_buffer(buffer, self.store)
+
+        self.assertEqual(read_candle_buffer(buffer).candles(), self.store.candles())
+
+        with self.assertRaises(CandleFormatException):
+            read_candle_buffer(bytearray(calc_candle_buffer_size(1)))
+
+    def test_convert_json_file(self):
+        json_file = os.path.join(self.directory, 'M10.json')
+        candle_file = os.path.join(self.directory, 'M10.candles')
+
+        with open(json_file, 'w') as f:
+            json.dump({'candles': self.candles}, f)
+
+        num_candles = convert_json_file(json_file, candle_file, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.assertEqual(num_candles, 50)
+        self.assertEqual(load_candle_file(candle_file).candle(49), self.store.candle(49))
+
+    def test_convert_data_file_export(self):
+        candles = [{u'openAsk': 0.947, u'highAsk': 0.948, u'lowAsk': 0.946, u'closeAsk': 0.947 + i / 10000.0,
+                    u'volume': str(i), u'time': u'04:{minute:02d}'.format(minute=i), u'date': u'2001.01.02'}
+                   for i in range(0, 30)]
+
+        json_file = os.path.join(self.directory, 'M1_2001.json')
+        candle_file = os.path.join(self.directory, 'M1_2001.candles')
+
+        with open(json_file, 'w') as f:
+            json.dump({'candles': candles}, f)
+
+        convert_json_file(json_file, candle_file, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.assertEqual(load_candle_file(candle_file).candles(), candles)
+        self.assertEqual([candle for chunk in iter_candle_file_chunks(candle_file, 7) for candle in chunk.candles()],
+                         candles)
+
+        buffer = bytearray(calc_candle_buffer_size(len(candles)))
+        write_candle_buffer(buffer, load_candle_file(candle_file))
+        self.assertEqual(read_candle_buffer(buffer).candle(0), candles[0])
@@ -0,0 +1,80 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from trading.candles.cache import CandleCache
+from trading.constants.granularity import GRANULARITY_HOUR
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from tests.helpers import FakeOandaAPI, make_candle, FIRST_CANDLE_TIME, HOUR
+
+
+class CandleCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.candle_cache = CandleCache(self.cache_dir, page_size=10)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_get_history(self):
+        api = FakeOandaAPI([make_candle(hour) for hour in range(0, 50)])
+        end = FIRST_CANDLE_TIME + 49 * HOUR
+
+        candle_store = self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 25, end)
+
+        self.assertEqual(candle_store.candles(), api.candles[25:])
+        self.assertEqual(len(api.requests), 5)
+        self.assertEqual(len(self.candle_cache.load(INSTRUMENT_EUR_USD, GRANULARITY_HOUR)), 25)
+
+        api.candles.extend(make_candle(hour) for hour in range(50, 55))
+        api.requests = []
+        end = FIRST_CANDLE_TIME + 54 * HOUR
+
+        candle_store = self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 20, end)
+
+        self.assertEqual(candle_store.candles(), api.candles[35:])
+        self.assertEqual(api.requests, [{'count': 500, 'start': u'2016-06-03T01:00:00.000000Z',
+                                         'end': u'2016-06-03T06:00:00.000000Z'}])
+
+        api.requests = []
+        candle_store = self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 40, end)
+
+        self.assertEqual(candle_store.candles(), api.candles[15:])
+        self.assertEqual(len(api.requests), 3)
+        self.assertEqual(len(self.candle_cache.load(INSTRUMENT_EUR_USD, GRANULARITY_HOUR)), 40)
+        # Head pages are fetched concurrently, the newest one ends just before the first cached candle
+        self.assertEqual(max(request['end'] for request in api.requests[1:]), u'2016-06-02T00:59:59.999999Z')
+
+    def test_get_history_before_cached_range(self):
+        api = FakeOandaAPI([make_candle(hour) for hour in range(0, 50)])
+        self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 25, FIRST_CANDLE_TIME + 49 * HOUR)
+
+        candle_store = self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 5,
+                                                     FIRST_CANDLE_TIME + 10 * HOUR)
+
+        self.assertEqual(candle_store.candles(), api.candles[6:11])
+        # The gap up to the cached range is filled, the cache stays one contiguous range
+        self.assertEqual(self.candle_cache.load(INSTRUMENT_EUR_USD, GRANULARITY_HOUR).candles(), api.candles[6:])
+
+    def test_get_history_unchanged_cache(self):
+        api = FakeOandaAPI([make_candle(hour) for hour in range(0, 50)])
+        end = FIRST_CANDLE_TIME + 49 * HOUR
+        self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 25, end)
+
+        with mock.patch.object(self.candle_cache, 'save') as save:
+            candle_store = self.candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 20, end)
+
+        self.assertEqual(candle_store.candles(), api.candles[30:])
+        self.assertFalse(save.called)
+
+    def test_get_history_short_broker_history(self):
+        api = FakeOandaAPI([make_candle(hour) for hour in range(0, 5)])
+        candle_cache = CandleCache(self.cache_dir)
+
+        candle_store = candle_cache.get_history(api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 25,
+                                                FIRST_CANDLE_TIME + 4 * HOUR)
+
+        self.assertEqual(candle_store.candles(), api.candles)
+        # One range with the candles, then empty ranges doubling in length until 30 days without history
+        self.assertEqual(len(api.requests), 6)
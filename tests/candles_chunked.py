@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from trading.candles.binary import write_candle_file, iter_candle_file_chunks
+from trading.candles.chunked import ChunkedCandleStore
+from trading.candles.exceptions import CandleLookbackException
+from trading.candles.store import CandleStore
+from trading.candles.stream import iter_json_candle_stores
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class ChunkedCandleStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': i,
+             u'time': u'2016-06-24T{hour:02d}:{minute:02d}:00.000000Z'.format(hour=i // 60, minute=i % 60)}
+            for i in range(0, 100)
+        ]
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.candle_file = os.path.join(self.directory, 'eur_usd.candles')
+        write_candle_file(self.candle_file, self.store)
+
+        self.json_file = os.path.join(self.directory, 'eur_usd.json')
+        with open(self.json_file, 'w') as f:
+            json.dump({'candles': self.candles}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_iter_chunks(self):
+        file_chunks = list(iter_candle_file_chunks(self.candle_file, 30, count=95))
+        json_chunks = list(iter_json_candle_stores(self.json_file, 30, 95, INSTRUMENT_EUR_USD,
+                                                   GRANULARITY_TEN_MINUTE))
+
+        for chunks in (file_chunks, json_chunks):
+            self.assertEqual([len(chunk) for chunk in chunks], [30, 30, 30, 5])
+            self.assertEqual(CandleStore.concatenate(chunks).candles(), self.store.candles(0, 95))
+
+        self.assertEqual(file_chunks[0].instrument, INSTRUMENT_EUR_USD)
+
+    def test_sliding_window(self):
+        data_window = 40
+        chunked_store = ChunkedCandleStore(iter_candle_file_chunks(self.candle_file, 25), data_window,
+                                           INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        for tick in range(0, 60):
+            window = chunked_store.window(tick, tick + data_window)
+
+            self.assertEqual(list(window), self.store.candles(tick, tick + data_window))
+            self.assertEqual(chunked_store.candle(tick), self.store.candle(tick))
+            self.assertLessEqual(len(chunked_store.store), data_window + 25)
+
+        self.assertEqual(len(chunked_store.window(90, 110)), 10)
+
+        with self.assertRaises(CandleLookbackException):
+            chunked_store.window(0, data_window)
+
+        with self.assertRaises(IndexError):
+            chunked_store.candle(100)
@@ -0,0 +1,81 @@
+import threading
+import unittest
+
+from pymongo import UpdateOne
+
+from trading.candles.collection import make_candle_documents, make_candle_key, make_time_range_query, \
+    make_upsert_operations, ingest_candle_batches
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class FakeCandleCollection(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = []
+        self.indexes = []
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+    def bulk_write(self, operations, ordered=True):
+        with self.lock:
+            self.operations.extend(operations)
+
+
+class FakeDatabase(object):
+    def __init__(self):
+        self.candles = FakeCandleCollection()
+
+
+class CandleCollectionTests(unittest.TestCase):
+    def test_make_candle_documents(self):
+        candles = [
+            {u'id': u'1', u'closeAsk': 1.11195, u'time': u'2016-06-24T19:20:00.000000Z'},
+            {u'closeAsk': 1.11197, u'pattern': u'buy', u'date': {u'year': 2016, u'month': 6, u'day': 24,
+                                                                  u'hour': u'19', u'minute': u'30'}}
+        ]
+
+        documents = make_candle_documents(candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.assertEqual(documents[0], {u'closeAsk': 1.11195, u'time': 1466796000000000000,
+                                        u'instrument': INSTRUMENT_EUR_USD, u'granularity': GRANULARITY_TEN_MINUTE})
+        self.assertEqual(documents[1]['time'], 1466796600000000000)
+        self.assertEqual(documents[1]['pattern'], u'buy')
+
+        key = make_candle_key(INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE, 1466796000000000000)
+        self.assertEqual(make_upsert_operations(documents),
+                         [UpdateOne(key, {'$set': documents[0]}, upsert=True),
+                          UpdateOne(dict(key, time=1466796600000000000), {'$set': documents[1]}, upsert=True)])
+
+    def test_make_time_range_query(self):
+        query = make_time_range_query(INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE, start=10)
+
+        self.assertEqual(query, {'instrument': INSTRUMENT_EUR_USD, 'granularity': GRANULARITY_TEN_MINUTE,
+                                 'time': {'$gte': 10}})
+        self.assertNotIn('time', make_time_range_query(INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE))
+
+    def test_ingest_candle_batches(self):
+        db = FakeDatabase()
+        candles = [{u'closeAsk': 1.0, u'time': u'2016-06-24T{hour:02d}:00:00.000000Z'.format(hour=hour)}
+                   for hour in range(0, 24)]
+        candle_batches = [candles[i:i + 5] for i in range(0, 24, 5)]
+
+        ingestion = ingest_candle_batches(db, candle_batches, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE,
+                                          num_workers=3)
+
+        self.assertEqual(ingestion['num_candles'], 24)
+        self.assertEqual(ingestion['start_time'], 1466726400000000000)
+        self.assertEqual(ingestion['end_time'], 1466809200000000000)
+
+        # Batches are written concurrently, in any order, as upserts on the candle key
+        expected_operations = make_upsert_operations(make_candle_documents(candles, INSTRUMENT_EUR_USD,
+                                                                           GRANULARITY_TEN_MINUTE))
+        self.assertEqual(len(db.candles.operations), 24)
+        for operation in expected_operations:
+            self.assertIn(operation, db.candles.operations)
+
+        db.candles.operations = []
+        ingest_candle_batches(db, candle_batches, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.assertEqual(db.candles.operations, expected_operations)
@@ -0,0 +1,49 @@
+import unittest
+
+from trading.candles.download import download_history, download_latest, download_latest_candles, split_time_range
+from trading.constants.granularity import GRANULARITY_HOUR
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from tests.helpers import FakeOandaAPI, make_candle, FIRST_CANDLE_TIME, HOUR
+
+
+class CandleDownloadTests(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeOandaAPI([make_candle(hour) for hour in range(0, 200) if hour % 24 < 20], latency=0.02,
+                                max_count=10)
+
+    def test_split_time_range(self):
+        pages = split_time_range(0, 25 * HOUR, GRANULARITY_HOUR, page_size=10)
+
+        self.assertEqual(pages, [(0, 9 * HOUR), (9 * HOUR + 1, 18 * HOUR + 1), (18 * HOUR + 2, 25 * HOUR)])
+
+    def test_download_history(self):
+        end = FIRST_CANDLE_TIME + 199 * HOUR
+
+        candle_store = download_history(self.api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, FIRST_CANDLE_TIME, end,
+                                        page_size=10, max_workers=4)
+
+        self.assertEqual(candle_store.candles(), self.api.candles)
+        self.assertEqual(len(self.api.requests), 23)
+        self.assertGreater(self.api.max_active_requests, 1)
+        self.assertLessEqual(self.api.max_active_requests, 4)
+
+    def test_download_latest(self):
+        end = FIRST_CANDLE_TIME + 199 * HOUR
+
+        candle_store = download_latest(self.api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 50, end, page_size=10)
+
+        self.assertEqual(candle_store.candles(), self.api.candles[-50:])
+
+        candle_store = download_latest(self.api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 500, end, page_size=10)
+
+        self.assertEqual(candle_store.candles(), self.api.candles)
+
+    def test_download_latest_candles(self):
+        self.api.candles = [dict(candle, openBid=candle['openAsk'] - 0.1, complete=True) for candle in self.api.candles]
+        end = FIRST_CANDLE_TIME + 199 * HOUR
+
+        candles = download_latest_candles(self.api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 50, end, page_size=10)
+
+        self.assertEqual(candles, self.api.candles[-50:])
+        self.assertEqual(download_latest_candles(self.api, INSTRUMENT_EUR_USD, GRANULARITY_HOUR, 500, end,
+                                                 page_size=10), self.api.candles)
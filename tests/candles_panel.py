@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.panel import CandlePanel
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD, INSTRUMENT_USD_CAD
+from trading.constants.price_data import CANDLE_TIME, PRICE_ASK_CLOSE, VOLUME
+
+
+def make_candles(minutes, price):
+    return [
+        {u'openAsk': price + minute, u'highAsk': price + minute + 0.5, u'lowAsk': price + minute - 0.5,
+         u'closeAsk': price + minute + 0.25, u'volume': minute,
+         u'time': u'2016-06-24T19:{minute:02d}:00.000000Z'.format(minute=minute)}
+        for minute in minutes
+    ]
+
+
+class CandlePanelTests(unittest.TestCase):
+    def setUp(self):
+        self.eur_usd = CandleStore.from_candles(make_candles(range(0, 50, 10), 1.0), INSTRUMENT_EUR_USD,
+                                                GRANULARITY_TEN_MINUTE)
+        self.usd_cad = CandleStore.from_candles(make_candles([10, 20, 40, 50], 2.0), INSTRUMENT_USD_CAD,
+                                                GRANULARITY_TEN_MINUTE)
+
+    def test_from_candle_stores(self):
+        panel = CandlePanel.from_candle_stores([self.eur_usd, self.usd_cad])
+
+        self.assertEqual(len(panel), 3)
+        self.assertEqual(panel.instruments, [INSTRUMENT_EUR_USD, INSTRUMENT_USD_CAD])
+        self.assertEqual(panel.granularity, GRANULARITY_TEN_MINUTE)
+
+        expected_times = [self.eur_usd.column(CANDLE_TIME)[i] for i in (1, 2, 4)]
+        self.assertEqual(panel.column(CANDLE_TIME).tolist(), expected_times)
+
+        self.assertEqual(panel.column(PRICE_ASK_CLOSE).tolist(), [[11.25, 12.25], [21.25, 22.25], [41.25, 42.25]])
+        self.assertEqual(panel.column(VOLUME).dtype, np.int64)
+        self.assertEqual(panel.instrument_column(PRICE_ASK_CLOSE, INSTRUMENT_USD_CAD).tolist(),
+                         [12.25, 22.25, 42.25])
+        self.assertEqual(panel.column(PRICE_ASK_CLOSE, 1).shape, (2, 2))
+
+        with self.assertRaises(ValueError):
+            panel.column(PRICE_ASK_CLOSE)[0, 0] = 0.0
+
+    def test_from_candle_stores_instruments(self):
+        panel = CandlePanel.from_candle_stores([self.usd_cad, self.usd_cad], instruments=['a', 'b'])
+        self.assertEqual(len(panel), len(self.usd_cad))
+        self.assertEqual(panel.instruments, ['a', 'b'])
+
+        with self.assertRaises(CandleFormatException):
+            CandlePanel.from_candle_stores([self.usd_cad], instruments=['a', 'b'])
+
+        self.assertEqual(len(CandlePanel.from_candle_stores([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
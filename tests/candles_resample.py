@@ -0,0 +1,94 @@
+import unittest
+
+from trading.candles.exceptions import CandleResampleException
+from trading.candles.resample import resample_candles, CandleResampler
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE, GRANULARITY_HOUR, GRANULARITY_FOUR_HOUR, \
+    GRANULARITY_DAY
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class CandleResampleTests(unittest.TestCase):
+    def setUp(self):
+        # Starts at 23:30 so the first hour holds three candles and the series crosses a day
+        self.candles = []
+        for i in range(0, 30):
+            minutes = 23 * 60 + 30 + 10 * i
+            day, minutes = divmod(minutes, 24 * 60)
+            self.candles.append({
+                u'openAsk': 1.0 + i, u'highAsk': 2.0 + i + (i % 4), u'lowAsk': 0.5 + i - (i % 3),
+                u'closeAsk': 1.5 + i, u'volume': i,
+                u'time': u'2016-06-{day:02d}T{hour:02d}:{minute:02d}:00.000000Z'
+                    .format(day=24 + day, hour=minutes // 60, minute=minutes % 60)
+            })
+
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+    def test_resample_candles(self):
+        hourly = resample_candles(self.store, GRANULARITY_HOUR)
+
+        groups = [self.candles[0:3]] + [self.candles[i:i + 6] for i in range(3, 30, 6)]
+
+        self.assertEqual(len(hourly), len(groups))
+        self.assertEqual(hourly.candle(0)['time'], u'2016-06-24T23:00:00.000000Z')
+        self.assertEqual(hourly.candle(1)['time'], u'2016-06-25T00:00:00.000000Z')
+
+        for index, group in enumerate(groups):
+            candle = hourly.candle(index)
+
+            self.assertEqual(candle['openAsk'], group[0]['openAsk'])
+            self.assertEqual(candle['closeAsk'], group[-1]['closeAsk'])
+            self.assertEqual(candle['highAsk'], max(c['highAsk'] for c in group))
+            self.assertEqual(candle['lowAsk'], min(c['lowAsk'] for c in group))
+            self.assertEqual(candle['volume'], sum(c['volume'] for c in group))
+
+        self.assertEqual(len(resample_candles(self.store, GRANULARITY_DAY, alignment=0)), 2)
+        self.assertEqual(len(resample_candles(hourly, GRANULARITY_FOUR_HOUR, alignment=0)), 3)
+
+        with self.assertRaises(CandleResampleException):
+            resample_candles(hourly, GRANULARITY_TEN_MINUTE)
+
+    def test_resample_broker_alignment(self):
+        # Periods start at 17:00 New York time, 21:00 UTC in summer and 22:00 UTC in winter
+        for month, boundary_hour in ((6, 21), (1, 22)):
+            candles = [
+                {u'openAsk': 1.0, u'highAsk': 2.0, u'lowAsk': 0.5, u'closeAsk': 1.5, u'volume': 1,
+                 u'time': u'2016-{month:02d}-{day:02d}T{hour:02d}:00:00.000000Z'
+                    .format(month=month, day=13 + hour // 24, hour=hour % 24)}
+                for hour in range(18, 48)
+            ]
+            hourly = CandleStore.from_candles(candles, INSTRUMENT_EUR_USD, GRANULARITY_HOUR)
+
+            daily = resample_candles(hourly, GRANULARITY_DAY)
+
+            self.assertEqual([candle['time'] for candle in daily.candles()],
+                             [u'2016-{month:02d}-{day:02d}T{hour:02d}:00:00.000000Z'
+                                  .format(month=month, day=day, hour=boundary_hour) for day in (12, 13, 14)])
+            self.assertEqual([candle['volume'] for candle in daily.candles()],
+                             [boundary_hour - 18, 24, 24 - boundary_hour])
+
+            four_hour = resample_candles(hourly, GRANULARITY_FOUR_HOUR)
+
+            self.assertEqual(four_hour.candle(0)['time'], u'2016-{month:02d}-13T{hour:02d}:00:00.000000Z'
+                             .format(month=month, hour=boundary_hour - 4))
+            self.assertEqual(four_hour.candle(1)['time'], u'2016-{month:02d}-13T{hour:02d}:00:00.000000Z'
+                             .format(month=month, hour=boundary_hour))
+
+    def test_resampler_cache(self):
+        resampler = CandleResampler()
+
+        hourly = resampler.resample(self.store, GRANULARITY_HOUR)
+
+        self.assertIs(resampler.resample(self.store, GRANULARITY_HOUR), hourly)
+        self.assertIs(resampler.resample(self.store, GRANULARITY_TEN_MINUTE), self.store)
+        self.assertIsNot(resampler.resample(self.store.slice(0, 10), GRANULARITY_HOUR), hourly)
+
+        # Same size and time range, different prices
+        revised_candles = [dict(candle, closeAsk=candle['closeAsk'] + 1) for candle in self.candles]
+        revised_store = CandleStore.from_candles(revised_candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+        revised_hourly = resampler.resample(revised_store, GRANULARITY_HOUR)
+
+        self.assertEqual(revised_hourly.candle(0)['closeAsk'], hourly.candle(0)['closeAsk'] + 1)
+        self.assertIs(resampler.resample(CandleStore.from_candles(revised_candles, INSTRUMENT_EUR_USD,
+                                                                  GRANULARITY_TEN_MINUTE), GRANULARITY_HOUR),
+                      revised_hourly)
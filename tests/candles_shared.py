@@ -0,0 +1,67 @@
+import multiprocessing
+import unittest
+
+from trading.candles.shared import SharedCandleDataset, attach_candle_dataset
+from trading.candles.store import CandleStore, CANDLE_FIELDS
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from trading.constants.price_data import PRICE_ASK_CLOSE
+
+
+def sum_closing_prices(dataset_name):
+    dataset = attach_candle_dataset(dataset_name)
+    closing_prices = float(dataset.candle_store.column(PRICE_ASK_CLOSE).sum())
+    dataset.close()
+    return closing_prices
+
+
+class SharedCandleDatasetTests(unittest.TestCase):
+    def setUp(self):
+        self.candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': i,
+             u'time': u'2016-06-24T19:{minute:02d}:00.000000Z'.format(minute=i)}
+            for i in range(0, 50)
+        ]
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+    def test_attach(self):
+        with SharedCandleDataset(self.store) as shared_dataset:
+            dataset = attach_candle_dataset(shared_dataset.name)
+            candle_store = dataset.candle_store
+
+            self.assertEqual(candle_store.instrument, INSTRUMENT_EUR_USD)
+            self.assertEqual(candle_store.granularity, GRANULARITY_TEN_MINUTE)
+
+            for field in CANDLE_FIELDS:
+                self.assertEqual(candle_store.column(field).tolist(), self.store.column(field).tolist())
+
+            with self.assertRaises(ValueError):
+                candle_store.column(PRICE_ASK_CLOSE)[0] = 0
+
+            del candle_store
+            dataset.close()
+
+    def test_attach_data_file_candles(self):
+        candles = [{u'openAsk': 0.947, u'highAsk': 0.948, u'lowAsk': 0.946, u'closeAsk': 0.947, u'volume': u'12',
+                    u'time': u'04:00', u'date': u'2001.01.02'}]
+
+        with SharedCandleDataset(CandleStore.from_candles(candles)) as shared_dataset:
+            dataset = attach_candle_dataset(shared_dataset.name)
+
+            self.assertEqual(dataset.candle_store.candles(), candles)
+            dataset.close()
+
+    def test_worker_processes(self):
+        with SharedCandleDataset(self.store) as shared_dataset:
+            pool = multiprocessing.Pool(2)
+            try:
+                sums = pool.map(sum_closing_prices, [shared_dataset.name] * 4)
+            finally:
+                pool.close()
+                pool.join()
+
+            self.assertEqual(sums, [float(self.store.column(PRICE_ASK_CLOSE).sum())] * 4)
+
+            dataset = attach_candle_dataset(shared_dataset.name)
+            self.assertEqual(len(dataset.candle_store), 50)
+            dataset.close()
@@ -0,0 +1,107 @@
+import datetime
+import unittest
+
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_HIGH, CANDLE_TIME, VOLUME
+from trading.util.transformations import normalize_price_data
+
+
+class CandleStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.candle_data = [
+            {
+                u'highAsk': 1.11271,
+                u'lowAsk': 1.11173,
+                u'complete': True,
+                u'openBid': 1.1122,
+                u'closeAsk': 1.11195,
+                u'closeBid': 1.11177,
+                u'volume': 438,
+                u'openAsk': 1.11239,
+                u'time': u'2016-06-24T19:20:00.000000Z',
+                u'lowBid': 1.11146,
+                u'highBid': 1.11247
+            },
+            {
+                u'highAsk': 1.11226,
+                u'lowAsk': 1.11089,
+                u'complete': True,
+                u'openBid': 1.11183,
+                u'closeAsk': 1.11197,
+                u'closeBid': 1.11174,
+                u'volume': 594,
+                u'openAsk': 1.11197,
+                u'time': u'2016-06-24T19:30:00.000000Z',
+                u'lowBid': 1.11068,
+                u'highBid': 1.112
+            }
+        ]
+
+        self.store = CandleStore.from_candles(self.candle_data, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+    def test_from_candles(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.instrument, INSTRUMENT_EUR_USD)
+        self.assertEqual(self.store.granularity, GRANULARITY_TEN_MINUTE)
+        self.assertEqual(self.store.column(CANDLE_TIME).dtype, np.int64)
+        self.assertEqual(self.store.column(VOLUME).tolist(), [438, 594])
+        self.assertEqual(self.store.nbytes, 2 * 6 * 8)
+
+        with self.assertRaises(CandleFormatException):
+            CandleStore.from_candles([{u'time': u'2016-06-24T19:20:00.000000Z'}])
+
+    def test_split_date_time(self):
+        candles = [{u'highAsk': 0.947, u'lowAsk': 0.947, u'closeAsk': 0.947, u'volume': u'0', u'openAsk': 0.947,
+                    u'time': u'04:17', u'date': u'2001.01.02'}]
+
+        store = CandleStore.from_candles(candles)
+
+        self.assertEqual(store.column(CANDLE_TIME)[0], np.datetime64('2001-01-02T04:17', 'ns').astype(np.int64))
+        self.assertEqual(store.candle(0), candles[0])
+        self.assertEqual(store.window(0, 1)[0], candles[0])
+        self.assertEqual(CandleStore.merge([self.store.slice(0, 0), store]).candle(0), candles[0])
+
+    def test_candle(self):
+        self.assertEqual(self.store.candle(-1), {
+            u'highAsk': 1.11226,
+            u'lowAsk': 1.11089,
+            u'closeAsk': 1.11197,
+            u'volume': 594,
+            u'openAsk': 1.11197,
+            u'time': u'2016-06-24T19:30:00.000000Z'
+        })
+
+        with self.assertRaises(IndexError):
+            self.store.candle(2)
+
+        self.assertEqual(len(self.store.candles(0, 1)), 1)
+
+    def test_column(self):
+        close = self.store.column(PRICE_ASK_CLOSE, 1)
+
+        self.assertEqual(close.tolist(), [1.11197])
+
+        with self.assertRaises(ValueError):
+            close[0] = 0
+
+        self.assertEqual(normalize_price_data(self.store, PRICE_ASK_HIGH).tolist(), [1.11271, 1.11226])
+
+    def test_time_lookup(self):
+        self.assertEqual(self.store.search_time(u'2016-06-24T19:25:00.000000Z'), 1)
+        self.assertEqual(self.store.find_index(u'2016-06-24T19:30:00.000000Z'), 1)
+        self.assertEqual(self.store.find_index(datetime.datetime(2016, 6, 24, 19, 20)), 0)
+        self.assertIsNone(self.store.find_index(u'2016-06-24T19:25:00.000000Z'))
+
+        window = self.store.time_range(u'2016-06-24T19:25:00.000000Z', u'2016-06-24T19:30:00.000000Z')
+        self.assertEqual((window.start, window.end), (1, 2))
+        self.assertEqual(len(self.store.time_range(end=self.store.start_time)), 1)
+
+    def test_from_candles_unordered(self):
+        store = CandleStore.from_candles(self.candle_data[::-1])
+
+        self.assertEqual(store.candles(), self.store.candles())
@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.stream import iter_json_candles, iter_json_candle_batches, load_json_candle_store
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+
+
+class CandleStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': 10 * i,
+             u'time': u'2016-06-24T{hour:02d}:00:00.000000Z'.format(hour=i)}
+            for i in range(0, 24)
+        ]
+
+        self.document_file = os.path.join(self.directory, 'document.json')
+        with open(self.document_file, 'w') as f:
+            json.dump({'instrument': INSTRUMENT_EUR_USD, 'count': 24, 'candles': self.candles,
+                       'granularity': GRANULARITY_TEN_MINUTE}, f, indent=2)
+
+        self.list_file = os.path.join(self.directory, 'list.json')
+        with open(self.list_file, 'w') as f:
+            json.dump(self.candles, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_iter_json_candles(self):
+        for read_size in (1, 7, 4096):
+            self.assertEqual(list(iter_json_candles(self.document_file, read_size)), self.candles)
+            self.assertEqual(list(iter_json_candles(self.list_file, read_size)), self.candles)
+
+        truncated_file = os.path.join(self.directory, 'truncated.json')
+        with open(truncated_file, 'w') as f:
+            f.write(json.dumps({'candles': self.candles})[:-20])
+
+        with self.assertRaises(CandleFormatException):
+            list(iter_json_candles(truncated_file))
+
+    def test_iter_json_candle_batches(self):
+        batches = list(iter_json_candle_batches(self.document_file, batch_size=10))
+
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 4])
+        self.assertEqual(batches[2][-1], self.candles[-1])
+
+    def test_load_json_candle_store(self):
+        candle_store = load_json_candle_store(self.document_file, count=15, instrument=INSTRUMENT_EUR_USD,
+                                              batch_size=4)
+
+        self.assertEqual(len(candle_store), 15)
+        self.assertEqual(candle_store.instrument, INSTRUMENT_EUR_USD)
+        self.assertEqual(candle_store.candle(14)['volume'], 140)
+        self.assertEqual(len(load_json_candle_store(self.list_file)), 24)
+
+    def test_load_unordered_json_candle_store(self):
+        duplicate_candle = dict(self.candles[3], closeAsk=9.0)
+        unordered_file = os.path.join(self.directory, 'unordered.json')
+        with open(unordered_file, 'w') as f:
+            json.dump(self.candles[1:2] + self.candles[:1] + self.candles[2:] + [duplicate_candle], f)
+
+        candle_store = load_json_candle_store(unordered_file, count=5, batch_size=4)
+
+        self.assertEqual(len(candle_store), 5)
+        self.assertEqual(candle_store.candles(), self.candles[:3] + [duplicate_candle, self.candles[4]])
+        self.assertEqual(len(load_json_candle_store(unordered_file)), 24)
+
+    def test_load_json_candle_store_stops_at_count(self):
+        truncated_file = os.path.join(self.directory, 'truncated.json')
+        with open(truncated_file, 'w') as f:
+            f.write(json.dumps({'candles': self.candles})[:-20])
+
+        candle_store = load_json_candle_store(truncated_file, count=5, batch_size=4)
+
+        self.assertEqual(candle_store.candles(), self.candles[:5])
+        with self.assertRaises(CandleFormatException):
+            load_json_candle_store(truncated_file, batch_size=4)
@@ -0,0 +1,56 @@
+import unittest
+
+from trading.candles.store import CandleStore
+from trading.candles.window import CandleWindow
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_LOW
+from trading.util.transformations import normalize_price_data, get_last_candle_data
+
+
+class CandleWindowTests(unittest.TestCase):
+    def setUp(self):
+        candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i, u'volume': i,
+             u'time': u'2016-06-24T{hour:02d}:00:00.000000Z'.format(hour=i)}
+            for i in range(0, 10)
+        ]
+        self.store = CandleStore.from_candles(candles)
+        self.window = self.store.window(2, 6)
+
+    def test_list_access(self):
+        self.assertEqual(len(self.window), 4)
+        self.assertEqual(self.window[0], self.store.candle(2))
+        self.assertEqual(get_last_candle_data(self.window), self.store.candle(5))
+        self.assertEqual(list(self.window), self.store.candles(2, 6))
+        self.assertEqual(len(self.store.window(8, 20)), 2)
+
+        with self.assertRaises(IndexError):
+            self.window[4]
+
+        sub_window = self.window[1:]
+
+        self.assertIsInstance(sub_window, CandleWindow)
+        self.assertEqual((sub_window.start, sub_window.end), (3, 6))
+        self.assertEqual(self.window[::2], [self.store.candle(2), self.store.candle(4)])
+
+    def test_empty_slices(self):
+        candles = list(self.window)
+
+        for index in (slice(2, 1), slice(2, 2), slice(-1, 0), slice(10, 20), slice(3, -3)):
+            sub_window = self.window[index]
+
+            self.assertIsInstance(sub_window, CandleWindow)
+            self.assertEqual(len(sub_window), len(candles[index]))
+            self.assertEqual(list(sub_window), candles[index])
+            self.assertEqual(len(sub_window.column(PRICE_ASK_CLOSE)), len(candles[index]))
+
+        self.assertEqual(self.window[2:1:-1], candles[2:1:-1])
+
+    def test_column(self):
+        close = normalize_price_data(self.window, PRICE_ASK_CLOSE)
+
+        self.assertEqual(close.tolist(), [3.5, 4.5, 5.5, 6.5])
+        self.assertIs(close.base, self.store.column(PRICE_ASK_CLOSE).base)
+        self.assertEqual(self.window.column(PRICE_ASK_LOW)[-1], 5.5)
+
+        with self.assertRaises(ValueError):
+            close[0] = 0
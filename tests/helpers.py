@@ -0,0 +1,83 @@
+import random
+import threading
+import time
+
+from trading.candles.timestamps import parse_candle_time
+
+# Fixtures shared by several test modules
+
+HOUR = 3600 * 10 ** 9
+FIRST_CANDLE_TIME = 1464739200000000000  # 2016-06-01T00:00:00Z
+
+
+def make_candle(hour):
+    return {u'openAsk': 1.0 + hour, u'highAsk': 2.0 + hour, u'lowAsk': 0.5 + hour, u'closeAsk': 1.5 + hour,
+            u'volume': hour, u'time': u'2016-06-{day:02d}T{hour:02d}:00:00.000000Z'.format(day=1 + hour // 24,
+                                                                                          hour=hour % 24)}
+
+
+def make_random_walk_candles(num_candles, seed):
+    """
+    Ten minute candles of a random walk, with a doji about every other candle
+    """
+    random.seed(seed)
+    candles = []
+    close = 1.1
+
+    for i in range(0, num_candles):
+        open_price = close + random.uniform(-0.002, 0.002)
+        close = open_price + random.choice([0.0, random.uniform(-0.004, 0.004)])
+        candles.append({
+            u'openAsk': open_price, u'closeAsk': close,
+            u'highAsk': max(open_price, close) + random.uniform(0.0, 0.002),
+            u'lowAsk': min(open_price, close) - random.uniform(0.0, 0.002),
+            u'volume': i, u'time': u'2016-06-{day:02d}T{hour:02d}:{minute:02d}:00.000000Z'
+            .format(day=1 + i // 144, hour=i % 144 // 6, minute=i % 6 * 10)
+        })
+
+    return candles
+
+
+class FakeOandaAPI(object):
+    """
+    Serves get_history like oandapy.API from an in memory candle list, with artificial latency
+    """
+
+    def __init__(self, candles, latency=0.0, max_count=5000):
+        self.candles = candles
+        self.latency = latency
+        self.max_count = max_count
+        self.requests = []
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self.lock = threading.Lock()
+
+    def get_history(self, instrument, granularity, count=500, start=None, end=None, includeFirst='true'):
+        with self.lock:
+            self.requests.append({'count': count, 'start': start, 'end': end})
+            self.active_requests += 1
+            self.max_active_requests = max(self.max_active_requests, self.active_requests)
+
+        time.sleep(self.latency)
+
+        candles = [(parse_candle_time(candle), candle) for candle in self.candles]
+
+        if start is not None:
+            start_time = parse_candle_time({'time': start})
+            candles = [(t, c) for t, c in candles if t > start_time or (includeFirst == 'true' and t == start_time)]
+        if end is not None:
+            end_time = parse_candle_time({'time': end})
+            candles = [(t, c) for t, c in candles if t <= end_time]
+
+        if start is not None and end is not None:
+            if len(candles) > self.max_count:
+                raise ValueError('Too many candles requested')
+        elif start is not None:
+            candles = candles[:count]
+        else:
+            candles = candles[-count:]
+
+        with self.lock:
+            self.active_requests -= 1
+
+        return {'instrument': instrument, 'granularity': granularity, 'candles': [c for t, c in candles]}
@@ -0,0 +1,112 @@
+import os
+import random
+import unittest
+
+import numpy as np
+
+from trading.indicators.backends import BACKENDS, get_backend, get_default_backend_name
+from trading.indicators.backends.benchmark import BENCHMARK_INDICATORS, benchmark_backends, get_fastest_backends
+from trading.indicators.backends.numpy_backend import NumpyBackend
+from trading.indicators.backends.talib_backend import TalibBackend
+from trading.indicators.exceptions import IndicatorBackendException
+from trading.indicators.overlap_studies import calc_moving_average
+from trading.indicators.volatility_indicators import calc_average_true_range
+
+
+class IndicatorBackendTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(13)
+        self.close = np.array([1.1 + random.randint(-500, 500) / 10000.0 for _ in range(0, 400)])
+        self.high = self.close + np.array([random.randint(0, 40) / 10000.0 for _ in range(0, 400)])
+        self.low = self.close - np.array([random.randint(0, 40) / 10000.0 for _ in range(0, 400)])
+
+        self.environment_backend = os.environ.pop('TRADING_INDICATOR_BACKEND', None)
+
+    def tearDown(self):
+        if self.environment_backend is not None:
+            os.environ['TRADING_INDICATOR_BACKEND'] = self.environment_backend
+        else:
+            os.environ.pop('TRADING_INDICATOR_BACKEND', None)
+
+    def test_backend_parity(self):
+        numpy_backend = get_backend(NumpyBackend.name)
+        talib_backend = get_backend(TalibBackend.name)
+
+        for interval in (1, 2, 3, 14, 99, 400, 401):
+            for indicator, calc_indicator in BENCHMARK_INDICATORS:
+                expected = calc_indicator(talib_backend, self.close, self.high, self.low, interval)
+                result = calc_indicator(numpy_backend, self.close, self.high, self.low, interval)
+
+                self.assertEqual(len(result), len(self.close))
+                np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12, err_msg=indicator)
+
+        # True range is undefined at the first candle, indicators over it skip the leading NaN
+        true_range = talib_backend.true_range(self.high, self.low, self.close)
+        self.assertTrue(np.isnan(true_range[0]))
+
+        for interval in (1, 2, 14, 399, 400):
+            for indicator in ('sma', 'ema', 'stddev', 'rolling_max', 'rolling_min'):
+                expected = getattr(talib_backend, indicator)(true_range, interval)
+                result = getattr(numpy_backend, indicator)(true_range, interval)
+
+                np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12, err_msg=indicator)
+
+    def test_rolling_extremes_missing_data(self):
+        data = self.close.copy()
+        data[[50, 200]] = np.nan
+        windows_with_missing_data = np.zeros(len(data), dtype=bool)
+
+        for interval in (3, 20):
+            windows_with_missing_data[:] = False
+            for missing_point in (50, 200):
+                windows_with_missing_data[missing_point:missing_point + interval] = True
+
+            for indicator in ('rolling_max', 'rolling_min'):
+                expected = getattr(get_backend(TalibBackend.name), indicator)(data, interval)
+                result = getattr(get_backend(NumpyBackend.name), indicator)(data, interval)
+
+                self.assertTrue(np.isnan(result[windows_with_missing_data]).all())
+                np.testing.assert_allclose(result[~windows_with_missing_data], expected[~windows_with_missing_data],
+                                           rtol=0, atol=0, err_msg=indicator)
+
+    def test_exponential_moving_average_long_history(self):
+        # Long enough for several closed form blocks at a short interval
+        data = np.tile(self.close, 25)
+
+        for interval in (2, 5, 30):
+            np.testing.assert_allclose(get_backend(NumpyBackend.name).ema(data, interval),
+                                       get_backend(TalibBackend.name).ema(data, interval), rtol=0, atol=1e-12)
+
+    def test_get_backend(self):
+        self.assertEqual(get_default_backend_name(), TalibBackend.name)
+        self.assertIs(get_backend(), get_backend(TalibBackend.name))
+        self.assertEqual(set(BACKENDS), {NumpyBackend.name, TalibBackend.name})
+
+        os.environ['TRADING_INDICATOR_BACKEND'] = NumpyBackend.name
+        self.assertIsInstance(get_backend(), NumpyBackend)
+
+        with self.assertRaises(IndicatorBackendException):
+            get_backend('fortran')
+
+    def test_indicators_by_backend(self):
+        moving_average = calc_moving_average(self.close, 20)
+        average_true_range = calc_average_true_range(self.close, self.high, self.low, 14)
+
+        os.environ['TRADING_INDICATOR_BACKEND'] = NumpyBackend.name
+        self.assertAlmostEqual(calc_moving_average(self.close, 20), moving_average, places=12)
+        self.assertAlmostEqual(calc_average_true_range(self.close, self.high, self.low, 14), average_true_range,
+                               places=12)
+
+    def test_benchmark_backends(self):
+        results = benchmark_backends(self.close, self.high, self.low, interval=14, repeats=1)
+
+        self.assertEqual(len(results), len(BENCHMARK_INDICATORS) * len(BACKENDS))
+        for result in results:
+            self.assertLess(result['max_difference'], 1e-12)
+            self.assertGreater(result['points_per_second'], 0)
+
+        self.assertEqual(set(get_fastest_backends(results)), set(name for name, _ in BENCHMARK_INDICATORS))
+
+        results = benchmark_backends(self.close[:5], self.high[:5], self.low[:5], interval=14, repeats=1)
+        self.assertTrue(all(result['max_difference'] == 0 for result in results))
+
@@ -0,0 +1,84 @@
+import random
+import unittest
+
+import numpy as np
+
+from trading.indicators.batch import calc_by_column, calc_moving_average_batch, calc_standard_deviation_batch, \
+    calc_average_true_range_batch, calc_chandalier_exits_batch, calc_donchian_channel_batch
+from trading.indicators.misc import calc_chandalier_exits_series, calc_donchian_channel_series
+from trading.indicators.momentum_indicators import calc_relative_strength_index_series, calc_aroon_series
+from trading.indicators.overlap_studies import calc_moving_average_series
+from trading.indicators.price_transformation import calc_standard_deviation_series
+from trading.indicators.volatility_indicators import calc_average_true_range_series
+
+
+class BatchIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(22)
+        self.num_instruments = 5
+
+        close = [[1.1 + i * 0.2 for i in range(0, self.num_instruments)]]
+        for _ in range(0, 299):
+            close.append([price + random.uniform(-0.005, 0.005) for price in close[-1]])
+
+        self.close = np.array(close)
+        self.high = self.close + np.array([[random.uniform(0, 0.003) for _ in row] for row in close])
+        self.low = self.close - np.array([[random.uniform(0, 0.003) for _ in row] for row in close])
+
+    def assertColumnsAlmostEqual(self, batch, expected_columns):
+        self.assertEqual(batch.shape, self.close.shape)
+
+        for i, expected in enumerate(expected_columns):
+            self.assertEqual(np.isnan(batch[:, i]).tolist(), np.isnan(expected).tolist())
+            np.testing.assert_allclose(batch[:, i], expected, rtol=0, atol=1e-12)
+
+    def columns(self, data):
+        return [data[:, i] for i in range(self.num_instruments)]
+
+    def test_moving_average(self):
+        for interval in (1, 2, 40):
+            self.assertColumnsAlmostEqual(calc_moving_average_batch(self.close, interval),
+                                          [calc_moving_average_series(column, interval)
+                                           for column in self.columns(self.close)])
+
+    def test_standard_deviation(self):
+        for interval in (2, 40, 300):
+            self.assertColumnsAlmostEqual(calc_standard_deviation_batch(self.close, interval),
+                                          [calc_standard_deviation_series(column, interval)
+                                           for column in self.columns(self.close)])
+
+    def test_average_true_range(self):
+        expected_columns = [calc_average_true_range_series(close, high, low, 22) for close, high, low in
+                            zip(self.columns(self.close), self.columns(self.high), self.columns(self.low))]
+
+        self.assertColumnsAlmostEqual(calc_average_true_range_batch(self.close, self.high, self.low, 22),
+                                      expected_columns)
+
+    def test_price_channels(self):
+        long_exits, short_exits = calc_chandalier_exits_batch(self.close, self.high, self.low)
+        upper_channels, lower_channels = calc_donchian_channel_batch(self.high, self.low, 20)
+
+        for i in range(self.num_instruments):
+            long_exit, short_exit = calc_chandalier_exits_series(self.close[:, i], self.high[:, i], self.low[:, i])
+            np.testing.assert_allclose(long_exits[:, i], long_exit, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(short_exits[:, i], short_exit, rtol=0, atol=1e-12)
+
+            upper_channel, lower_channel = calc_donchian_channel_series(self.high[:, i], self.low[:, i], 20)
+            np.testing.assert_array_equal(upper_channels[:, i], upper_channel)
+            np.testing.assert_array_equal(lower_channels[:, i], lower_channel)
+
+    def test_calc_by_column(self):
+        self.assertColumnsAlmostEqual(calc_by_column(calc_relative_strength_index_series, self.close, interval=14),
+                                      [calc_relative_strength_index_series(column, 14)
+                                       for column in self.columns(self.close)])
+
+        aroon_down, aroon_up = calc_by_column(calc_aroon_series, self.high, self.low)
+        expected_down, expected_up = calc_aroon_series(self.high[:, 2], self.low[:, 2])
+        np.testing.assert_array_equal(aroon_down[:, 2], expected_down)
+        np.testing.assert_array_equal(aroon_up[:, 2], expected_up)
+
+        self.assertEqual(calc_moving_average_batch(self.close[:, 0], 40).shape, (len(self.close), 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
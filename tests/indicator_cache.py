@@ -0,0 +1,90 @@
+import unittest
+
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW
+from trading.indicators.cache import IndicatorCache, make_series_key
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.misc import calc_chandalier_exits
+from trading.indicators.price_transformation import calc_standard_deviation
+
+
+class IndicatorCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.candles = [
+            {u'openAsk': 1.0 + i, u'highAsk': 2.0 + i, u'lowAsk': 0.5 + i, u'closeAsk': 1.5 + i % 7, u'volume': i,
+             u'time': u'2016-06-24T19:{minute:02d}:00.000000Z'.format(minute=i)}
+            for i in range(0, 50)
+        ]
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+        self.cache = IndicatorCache(max_size=2)
+
+    def test_calc(self):
+        window = self.store.window(10, 30)
+        expected = calc_standard_deviation(window.column(PRICE_ASK_CLOSE), 10)
+
+        self.assertEqual(self.cache.calc(calc_standard_deviation, window, (PRICE_ASK_CLOSE,), 10), expected)
+
+        # Separate stores of the same candles share entries
+        other_store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+        self.assertEqual(self.cache.calc(calc_standard_deviation, other_store.window(10, 30), (PRICE_ASK_CLOSE,), 10),
+                         expected)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        exits = self.cache.calc(calc_chandalier_exits, window, (PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW),
+                                target_interval=5)
+        self.assertEqual(exits, calc_chandalier_exits(window.column(PRICE_ASK_CLOSE), window.column(PRICE_ASK_HIGH),
+                                                      window.column(PRICE_ASK_LOW), target_interval=5))
+
+        with self.assertRaises(TalibIntervalException):
+            self.cache.calc(calc_standard_deviation, window, (PRICE_ASK_CLOSE,), 40)
+
+        self.assertEqual(self.cache.calc(calc_standard_deviation, self.candles[10:30], (PRICE_ASK_CLOSE,), 10),
+                         expected)
+        self.assertEqual(self.cache.stats['misses'], 3)
+
+    def test_series_key(self):
+        self.assertEqual(make_series_key(self.store.window(10, 30)),
+                         make_series_key(CandleStore.from_candles(self.candles[10:30], INSTRUMENT_EUR_USD,
+                                                                  GRANULARITY_TEN_MINUTE)))
+
+        # Same instrument, length and end points but a different interior candle
+        candles = [dict(candle) for candle in self.candles]
+        candles[25][PRICE_ASK_CLOSE] += 1.0
+        other_store = CandleStore.from_candles(candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+
+        self.assertNotEqual(make_series_key(other_store), make_series_key(self.store))
+        self.assertEqual(make_series_key(other_store.window(0, 25)), make_series_key(self.store.window(0, 25)))
+
+        self.assertNotEqual(make_series_key(CandleStore.from_candles(self.candles[:20])),
+                            make_series_key(CandleStore.from_candles(candles[10:30])))
+        self.assertIsNone(make_series_key(self.candles))
+        self.assertIsNone(make_series_key(self.store.window(0, 0)))
+
+    def test_read_only_results(self):
+        window = self.store.window(0, 30)
+        series = self.cache.get_or_calc((make_series_key(window), 'double'),
+                                        lambda: (window.column(PRICE_ASK_CLOSE) * 2,
+                                                 {'low': window.column(PRICE_ASK_LOW) * 2}))
+
+        self.assertFalse(series[0].flags.writeable)
+        self.assertFalse(series[1]['low'].flags.writeable)
+
+        with self.assertRaises(ValueError):
+            series[0][0] = 0.0
+
+    def test_eviction(self):
+        for end in (20, 21, 22):
+            self.cache.calc(calc_standard_deviation, self.store.window(0, end), (PRICE_ASK_CLOSE,), 10)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.evictions, 1)
+
+        self.cache.calc(calc_standard_deviation, self.store.window(0, 22), (PRICE_ASK_CLOSE,), 10)
+        self.cache.calc(calc_standard_deviation, self.store.window(0, 20), (PRICE_ASK_CLOSE,), 10)
+
+        stats = self.cache.stats
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (1, 4, 2))
+        self.assertEqual(stats['hit_rate'], 0.2)
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+import numpy as np
+import talib
+
+from trading.indicators.cycle_indicators import calc_hilbert_transformation_dominant_cycle_period, \
+    calc_hilbert_transformation_dominant_cycle_phase, calc_hilbert_transformation_phasor_components, \
+    calc_hilbert_transformation_sine_wave, calc_hilbert_transformation_trend_vs_cycle_mode, \
+    calc_hilbert_transformation_trend_vs_cycle_mode_series, HILBERT_TRANSFORMATION_PERIOD_LOOKBACK, \
+    HILBERT_TRANSFORMATION_PHASE_LOOKBACK
+from trading.indicators.exceptions import TalibIntervalException
+
+
+class CycleIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(20)
+        self.data = np.array([1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 200)])
+
+    def test_dominant_cycle(self):
+        self.assertEqual(calc_hilbert_transformation_dominant_cycle_period(self.data), talib.HT_DCPERIOD(self.data)[-1])
+        self.assertEqual(calc_hilbert_transformation_dominant_cycle_phase(self.data), talib.HT_DCPHASE(self.data)[-1])
+
+        in_phase, quadrature = talib.HT_PHASOR(self.data)
+        self.assertEqual(calc_hilbert_transformation_phasor_components(self.data), (in_phase[-1], quadrature[-1]))
+
+        sine, lead_sine = talib.HT_SINE(self.data)
+        self.assertEqual(calc_hilbert_transformation_sine_wave(list(self.data)), (sine[-1], lead_sine[-1]))
+
+        with self.assertRaises(TalibIntervalException):
+            calc_hilbert_transformation_dominant_cycle_period(self.data[:HILBERT_TRANSFORMATION_PERIOD_LOOKBACK])
+
+        with self.assertRaises(TalibIntervalException):
+            calc_hilbert_transformation_sine_wave(self.data[:HILBERT_TRANSFORMATION_PHASE_LOOKBACK])
+
+    def test_trend_vs_cycle_mode(self):
+        trend_mode = calc_hilbert_transformation_trend_vs_cycle_mode_series(self.data)
+
+        self.assertTrue(np.isnan(trend_mode[:HILBERT_TRANSFORMATION_PHASE_LOOKBACK]).all())
+        self.assertEqual(trend_mode[HILBERT_TRANSFORMATION_PHASE_LOOKBACK:].tolist(),
+                         talib.HT_TRENDMODE(self.data)[HILBERT_TRANSFORMATION_PHASE_LOOKBACK:].tolist())
+        self.assertIn(calc_hilbert_transformation_trend_vs_cycle_mode(self.data), (0, 1))
+
+        with self.assertRaises(TalibIntervalException):
+            calc_hilbert_transformation_trend_vs_cycle_mode(self.data[:HILBERT_TRANSFORMATION_PHASE_LOOKBACK])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from trading.candles.store import CandleStore
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW
+from trading.indicators.graph import IndicatorGraph, IndicatorNode, average_true_range_node, chandalier_exit_nodes, \
+    moving_average_node, standard_deviation_node, true_range_node
+from trading.indicators.misc import calc_chandalier_exits, calc_chandalier_exits_series
+from trading.indicators.overlap_studies import calc_moving_average
+from trading.indicators.price_transformation import calc_standard_deviation
+from trading.indicators.volatility_indicators import calc_average_true_range
+
+
+class IndicatorGraphTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.candles = []
+        price = 1.1
+
+        for i in range(0, 120):
+            price += random.uniform(-0.003, 0.003)
+            self.candles.append({u'openAsk': price, u'highAsk': price + random.uniform(0, 0.002),
+                                 u'lowAsk': price - random.uniform(0, 0.002), u'closeAsk': price, u'volume': i,
+                                 u'time': u'2016-06-24T{hour:02d}:{minute:02d}:00.000000Z'
+                                 .format(hour=i // 60, minute=i % 60)})
+
+        self.store = CandleStore.from_candles(self.candles)
+
+        long_exit, short_exit = chandalier_exit_nodes(target_interval=22)
+        self.graph = IndicatorGraph({
+            'long_exit': long_exit,
+            'short_exit': short_exit,
+            'atr': average_true_range_node(22),
+            'std': standard_deviation_node(10),
+            'ma': moving_average_node(10)
+        })
+
+    def test_shared_nodes(self):
+        node_keys = [node.key for node in self.graph.nodes]
+
+        self.assertEqual(len(node_keys), len(set(node_keys)))
+        self.assertEqual(node_keys.count(true_range_node().key), 1)
+        self.assertEqual(node_keys.count(average_true_range_node(22).key), 1)
+
+        for i, node in enumerate(self.graph.nodes):
+            for input_node in node.inputs:
+                self.assertLess(node_keys.index(input_node.key), i)
+
+        self.assertEqual(average_true_range_node(22).required_interval, 23)
+        self.assertEqual(self.graph.required_interval, 23)
+        self.assertEqual(IndicatorNode(PRICE_ASK_CLOSE), IndicatorNode(PRICE_ASK_CLOSE))
+
+    def test_calc_series(self):
+        series = self.graph.calc_series(self.store)
+        long_exits, short_exits = calc_chandalier_exits_series(self.store.column(PRICE_ASK_CLOSE),
+                                                               self.store.column(PRICE_ASK_HIGH),
+                                                               self.store.column(PRICE_ASK_LOW), target_interval=22)
+
+        self.assertEqual(series['long_exit'][22:].tolist(), long_exits[22:].tolist())
+        self.assertEqual(series['short_exit'][22:].tolist(), short_exits[22:].tolist())
+
+    def test_calc_latest(self):
+        for end in (23, 40, 120):
+            window = self.store.window(0, end)
+            close = window.column(PRICE_ASK_CLOSE)
+            high = window.column(PRICE_ASK_HIGH)
+            low = window.column(PRICE_ASK_LOW)
+
+            for candle_series in (window, self.candles[:end]):
+                latest = self.graph.calc_latest(candle_series)
+                long_exit, short_exit = calc_chandalier_exits(close, high, low, target_interval=22)
+
+                self.assertAlmostEqual(latest['long_exit'], long_exit, places=12)
+                self.assertAlmostEqual(latest['short_exit'], short_exit, places=12)
+                self.assertAlmostEqual(latest['atr'], calc_average_true_range(close, high, low, 22), places=12)
+                self.assertAlmostEqual(latest['std'], calc_standard_deviation(close, 10), places=12)
+                self.assertAlmostEqual(latest['ma'], calc_moving_average(close, 10), places=12)
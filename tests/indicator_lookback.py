@@ -0,0 +1,71 @@
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from trading.candles.store import CandleStore
+from trading.constants.price_data import PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE
+from trading.indicators.backends.talib_backend import LazyTalib
+from trading.indicators.exceptions import IndicatorBackendException, TalibIntervalException
+from trading.indicators.graph import IndicatorGraph, chandalier_exit_nodes, moving_average_node, \
+    standard_deviation_node
+from trading.indicators.lookback import average_directional_movement_index_required_interval, \
+    average_directional_movement_index_rating_required_interval, candle_patterns_required_interval, \
+    plan_data_window
+from trading.indicators.momentum_indicators import calc_average_directional_movement_index, \
+    calc_average_directional_movement_index_rating
+from trading.indicators.pattern_recognition import PATTERN_NAMES, scan_patterns
+from tests.helpers import make_random_walk_candles
+
+
+class LookbackPlannerTests(unittest.TestCase):
+    def setUp(self):
+        store = CandleStore.from_candles(make_random_walk_candles(200, seed=29))
+        self.open, self.high, self.low, self.close = [store.column(field) for field in
+                                                      (PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE)]
+
+    def test_plan_data_window(self):
+        long_exit, short_exit = chandalier_exit_nodes()
+        graph = IndicatorGraph({'long_exit': long_exit, 'short_exit': short_exit, 'ma': moving_average_node(10)})
+
+        self.assertEqual(plan_data_window([graph]), 23)
+        self.assertEqual(plan_data_window([graph, standard_deviation_node(40)]), 40)
+        self.assertEqual(plan_data_window([moving_average_node(10), 31, graph]), 31)
+
+        with self.assertRaises(ValueError):
+            plan_data_window([])
+
+    def test_directional_movement_required_intervals(self):
+        for interval in (5, 14, 30):
+            for required_interval, calc_indicator in (
+                    (average_directional_movement_index_required_interval(interval),
+                     calc_average_directional_movement_index),
+                    (average_directional_movement_index_rating_required_interval(interval),
+                     calc_average_directional_movement_index_rating)):
+                high, low, close = (self.high[-required_interval:], self.low[-required_interval:],
+                                    self.close[-required_interval:])
+
+                self.assertFalse(np.isnan(calc_indicator(high, low, close, interval)))
+
+                with self.assertRaises(TalibIntervalException):
+                    calc_indicator(high[1:], low[1:], close[1:], interval)
+
+    def test_candle_patterns_required_interval(self):
+        required_interval = candle_patterns_required_interval()
+        self.assertEqual(candle_patterns_required_interval(('doji',)), 11)
+        self.assertGreaterEqual(required_interval, candle_patterns_required_interval(('doji',)))
+
+        # The newest signals of the planned window match those of the full history
+        price_data = [self.open, self.high, self.low, self.close]
+        full_signals = scan_patterns(*price_data)
+        window_signals = scan_patterns(*[data[-required_interval:] for data in price_data])
+
+        self.assertEqual(window_signals[:, -1].tolist(), full_signals[:, -1].tolist())
+        self.assertEqual(len(window_signals), len(PATTERN_NAMES))
+
+    def test_candle_patterns_required_interval_without_talib(self):
+        with mock.patch.dict(sys.modules, {'talib.abstract': None}), \
+                mock.patch('trading.indicators.lookback.talib_abstract', LazyTalib('talib.abstract')):
+            with self.assertRaises(IndicatorBackendException):
+                candle_patterns_required_interval()
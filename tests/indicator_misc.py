@@ -1,7 +1,8 @@
 import random
 import unittest
 
-from trading.indicators.misc import get_period_high, get_period_low, calc_chandalier_exits
+from trading.indicators.misc import get_period_high, get_period_low, calc_chandalier_exits, \
+    calc_chandalier_exits_series
 from trading.indicators.exceptions import TalibIntervalException
 
 
@@ -40,3 +41,16 @@ class MiscIndicatorTests(unittest.TestCase):
 
         with self.assertRaises(TalibIntervalException):
             calc_chandalier_exits(close=close, high=high, low=low, target_interval=100)
+
+    def test_calc_chandalier_exits_series(self):
+        close = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 100)]
+        high = [point + random.uniform(0, 0.01) for point in close]
+        low = [point - random.uniform(0, 0.01) for point in close]
+
+        long_exits, short_exits = calc_chandalier_exits_series(close, high, low, target_interval=22)
+
+        for i in range(22, 100):
+            long_exit, short_exit = calc_chandalier_exits(close[:i + 1], high[:i + 1], low[:i + 1], target_interval=22)
+
+            self.assertAlmostEqual(long_exits[i], long_exit, places=12)
+            self.assertAlmostEqual(short_exits[i], short_exit, places=12)
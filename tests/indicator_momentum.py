@@ -1,9 +1,13 @@
+import math
 import random
 import unittest
 
 from trading.indicators.exceptions import TalibIntervalException
 from trading.indicators.momentum_indicators import calc_average_directional_movement_index, \
-    calc_average_directional_movement_index_rating
+    calc_average_directional_movement_index_rating, calc_average_directional_movement_index_series, \
+    calc_momentum, calc_momentum_series, calc_moving_average_convergence_divergence, \
+    calc_moving_average_convergence_divergence_series, calc_rate_of_change, calc_relative_strength_index, \
+    calc_relative_strength_index_series, calc_stochastic, calc_williams_percent_r_series
 
 
 class MomentumIndicatorTests(unittest.TestCase):
@@ -34,3 +38,40 @@ class MomentumIndicatorTests(unittest.TestCase):
 
         with self.assertRaises(TalibIntervalException):
             calc_average_directional_movement_index_rating(high=high, low=low, close=close, interval=200)
+
+    def test_series(self):
+        one_hundred_data_points = [float(val) for val in range(0, 100)]
+
+        momentum = calc_momentum_series(one_hundred_data_points, interval=10)
+
+        self.assertEqual(len(momentum), 100)
+        self.assertTrue(all(math.isnan(value) for value in momentum[:10]))
+        self.assertEqual(momentum[10:].tolist(), [10.0] * 90)
+        self.assertEqual(calc_momentum(one_hundred_data_points, interval=10), 10.0)
+        self.assertAlmostEqual(calc_rate_of_change(one_hundred_data_points, interval=10), 100.0 * 10 / 89, places=12)
+
+        rsi = calc_relative_strength_index_series(one_hundred_data_points, interval=14)
+        self.assertEqual(rsi[14:].tolist(), [100.0] * 86)
+
+        with self.assertRaises(TalibIntervalException):
+            calc_relative_strength_index(one_hundred_data_points[:14], interval=14)
+
+    def test_series_scalars(self):
+        random.seed(13)
+        close = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 200)]
+        high = [point + random.uniform(0, 0.01) for point in close]
+        low = [point - random.uniform(0, 0.01) for point in close]
+
+        macd, signal, histogram = calc_moving_average_convergence_divergence_series(close)
+        self.assertEqual(calc_moving_average_convergence_divergence(close), (macd[-1], signal[-1], histogram[-1]))
+        self.assertAlmostEqual(histogram[-1], macd[-1] - signal[-1], places=12)
+
+        slow_k, slow_d = calc_stochastic(high, low, close)
+        self.assertTrue(0 <= slow_k <= 100 and 0 <= slow_d <= 100)
+
+        williams_r = calc_williams_percent_r_series(high, low, close, interval=14)
+        expected = -100 * (max(high[-14:]) - close[-1]) / (max(high[-14:]) - min(low[-14:]))
+        self.assertAlmostEqual(williams_r[-1], expected, places=9)
+
+        adx = calc_average_directional_movement_index_series(high, low, close, interval=5)
+        self.assertEqual(len(adx), 200)
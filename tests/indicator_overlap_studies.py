@@ -1,6 +1,7 @@
+import math
 import unittest
 
-from trading.indicators.overlap_studies import calc_moving_average
+from trading.indicators.overlap_studies import calc_moving_average, calc_moving_average_series
 from trading.indicators.exceptions import TalibIntervalException
 
 
@@ -19,3 +20,13 @@ class OverLapStudiesTests(unittest.TestCase):
 
         with self.assertRaises(TalibIntervalException):
             calc_moving_average(one_hundred_data_points, interval=200)
+
+    def test_moving_average_series(self):
+        one_hundred_data_points = [float(val) for val in range(0, 100)]
+
+        ma = calc_moving_average_series(one_hundred_data_points, interval=50)
+
+        self.assertTrue(all(math.isnan(value) for value in ma[:49]))
+
+        for i in range(49, 100):
+            self.assertEqual(ma[i], calc_moving_average(one_hundred_data_points[:i + 1], interval=50))
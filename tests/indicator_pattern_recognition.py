@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+import talib
+
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_TEN_MINUTE
+from trading.constants.instrument import INSTRUMENT_EUR_USD
+from trading.constants.price_data import PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE
+from trading.indicators.cache import indicator_cache
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.pattern_recognition import PATTERN_NAMES, scan_patterns, scan_candle_patterns, calc_doji, \
+    calc_engulfing_pattern
+from tests.helpers import make_random_walk_candles
+
+
+class PatternRecognitionTests(unittest.TestCase):
+    def setUp(self):
+        self.candles = make_random_walk_candles(300, seed=19)
+
+        self.store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+        self.prices = [self.store.column(field)
+                       for field in (PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE)]
+
+    def test_scan_patterns(self):
+        signals = scan_patterns(*self.prices)
+
+        self.assertEqual(signals.shape, (len(PATTERN_NAMES), len(self.store)))
+        self.assertEqual(signals.dtype, np.int8)
+        self.assertTrue(np.all(np.abs(signals) <= 2))
+
+        doji = talib.CDLDOJI(*self.prices)
+        self.assertTrue(np.any(doji))
+        self.assertEqual(signals[PATTERN_NAMES.index('doji')].tolist(), (doji // 100).tolist())
+
+        engulfing = talib.CDLENGULFING(*self.prices)
+        self.assertEqual(scan_patterns(*(self.prices + [('engulfing_pattern',)]))[0].tolist(),
+                         (engulfing // 100).tolist())
+
+        self.assertEqual(calc_doji(*self.prices), doji[-1] // 100)
+        self.assertEqual(calc_engulfing_pattern(*self.prices), engulfing[-1] // 100)
+
+        with self.assertRaises(TalibIntervalException):
+            calc_doji([], [], [], [])
+
+    def test_scan_candle_patterns(self):
+        indicator_cache.clear()
+        pattern_scan = scan_candle_patterns(self.store)
+
+        self.assertEqual(len(pattern_scan), len(self.store))
+        self.assertEqual(pattern_scan.signals.tolist(), scan_patterns(*self.prices).tolist())
+
+        # Scans of the same candles are shared through the indicator cache
+        other_store = CandleStore.from_candles(self.candles, INSTRUMENT_EUR_USD, GRANULARITY_TEN_MINUTE)
+        self.assertIs(scan_candle_patterns(other_store), pattern_scan)
+        self.assertIsNot(scan_candle_patterns(self.store.window(0, 100)), pattern_scan)
+
+        with self.assertRaises(ValueError):
+            pattern_scan.signals[0, 0] = 1
+
+        index = int(np.flatnonzero(pattern_scan.pattern('doji'))[0])
+        features = pattern_scan.candle(index)
+
+        self.assertEqual(sorted(features), sorted(PATTERN_NAMES))
+        self.assertNotEqual(features['doji'], 0)
+        self.assertIn('doji', pattern_scan.matches(index))
+        self.assertEqual(sorted(pattern_scan.matches(index)),
+                         sorted(name for name, signal in features.items() if signal))
+
+        self.assertEqual(scan_candle_patterns(self.candles).candle(index), features)
+
+
+if __name__ == '__main__':
+    unittest.main()
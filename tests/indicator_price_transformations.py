@@ -1,7 +1,9 @@
+import math
+import random
 import unittest
 
 from trading.indicators.exceptions import TalibIntervalException
-from trading.indicators.price_transformation import calc_standard_deviation
+from trading.indicators.price_transformation import calc_standard_deviation, calc_standard_deviation_series
 
 
 class PriceTransformationTests(unittest.TestCase):
@@ -17,3 +19,14 @@ class PriceTransformationTests(unittest.TestCase):
 
         with self.assertRaises(TalibIntervalException):
             self.assertRaises(calc_standard_deviation(one_hundred_data_points, interval=2000))
+
+    def test_standard_deviation_series(self):
+        data = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 200)]
+
+        for interval in (2, 40):
+            sd = calc_standard_deviation_series(data, interval)
+
+            self.assertTrue(all(math.isnan(value) for value in sd[:interval - 1]))
+
+            for i in range(interval - 1, 200):
+                self.assertAlmostEqual(sd[i], calc_standard_deviation(data[:i + 1], interval), places=9)
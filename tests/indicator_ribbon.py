@@ -0,0 +1,98 @@
+import random
+import unittest
+
+import numpy as np
+import talib
+
+from trading.indicators.ribbon import MIN_BLOCK_SIZE, calc_simple_moving_average_ribbon, \
+    calc_standard_deviation_ribbon, calc_exponential_moving_average_ribbon, calc_crossover_sweep
+
+
+class RibbonIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(23)
+        self.data = [1.1]
+        for _ in range(0, 499):
+            self.data.append(self.data[-1] + random.uniform(-0.002, 0.002))
+
+        self.data = np.array(self.data)
+        self.intervals = [2, 5, 13, 40, 200, 500, 501]
+
+    def assertRibbonAlmostEqual(self, ribbon, talib_function):
+        self.assertEqual(ribbon.shape, (len(self.intervals), len(self.data)))
+
+        for row, interval in enumerate(self.intervals):
+            if interval > len(self.data):
+                self.assertTrue(np.isnan(ribbon[row]).all())
+                continue
+
+            expected = talib_function(self.data, timeperiod=interval)
+            self.assertEqual(np.isnan(ribbon[row]).tolist(), np.isnan(expected).tolist())
+            np.testing.assert_allclose(ribbon[row], expected, rtol=0, atol=1e-12)
+
+    def test_simple_moving_average_ribbon(self):
+        self.assertRibbonAlmostEqual(calc_simple_moving_average_ribbon(self.data, self.intervals), talib.SMA)
+
+        ribbon = calc_simple_moving_average_ribbon(list(self.data), [1])
+        np.testing.assert_allclose(ribbon[0], self.data, rtol=0, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            calc_simple_moving_average_ribbon(self.data, [0, 5])
+
+    def test_standard_deviation_ribbon(self):
+        self.assertRibbonAlmostEqual(calc_standard_deviation_ribbon(self.data, self.intervals), talib.STDDEV)
+
+    def test_long_history(self):
+        # Long enough for a single running sum to lose the short window variance to rounding
+        np.random.seed(23)
+        data = 1.1 + np.cumsum(np.random.uniform(-0.002, 0.002, 1000000))
+
+        for interval in (5, 20):
+            np.testing.assert_allclose(calc_simple_moving_average_ribbon(data, [interval])[0],
+                                       talib.SMA(data, timeperiod=interval), rtol=0, atol=1e-9)
+            np.testing.assert_allclose(calc_standard_deviation_ribbon(data, [interval])[0],
+                                       talib.STDDEV(data, timeperiod=interval), rtol=1e-6, atol=1e-12)
+
+    def test_missing_data(self):
+        # Missing points within one block and next to a block boundary of a long history
+        long_data = np.tile(self.data, 20)
+        for clean_data, missing_point in ((self.data, 100), (long_data, MIN_BLOCK_SIZE - 3)):
+            data = clean_data.copy()
+            data[missing_point] = np.nan
+
+            for calc_ribbon in (calc_simple_moving_average_ribbon, calc_standard_deviation_ribbon):
+                ribbon = calc_ribbon(data, self.intervals[:4])
+                expected = calc_ribbon(clean_data, self.intervals[:4])
+
+                for row, interval in enumerate(self.intervals[:4]):
+                    self.assertTrue(np.isnan(ribbon[row, missing_point:missing_point + interval]).all())
+                    self.assertEqual(np.isnan(ribbon[row]).sum(), interval - 1 + interval)
+                    np.testing.assert_allclose(ribbon[row, missing_point + interval:],
+                                               expected[row, missing_point + interval:], rtol=0, atol=1e-12)
+
+    def test_exponential_moving_average_ribbon(self):
+        self.assertRibbonAlmostEqual(calc_exponential_moving_average_ribbon(self.data, self.intervals), talib.EMA)
+
+    def test_crossover_sweep(self):
+        short_intervals = [5, 10]
+        long_intervals = [20, 10, 40]
+        sweep = calc_crossover_sweep(self.data, short_intervals, long_intervals)
+
+        self.assertEqual(sweep.shape, (2, 3, len(self.data)))
+        self.assertEqual(sweep[1, 1, 50], 0.0)
+        self.assertTrue(np.isnan(sweep[0, 2, 38]))
+
+        short_average = talib.SMA(self.data, timeperiod=5)[-1]
+        long_average = talib.SMA(self.data, timeperiod=40)[-1]
+        self.assertAlmostEqual(sweep[0, 2, -1],
+                               100 * (short_average - long_average) / ((short_average + long_average) / 2), places=9)
+
+        exponential_sweep = calc_crossover_sweep(self.data, [5], [20], calc_exponential_moving_average_ribbon)
+        short_average = talib.EMA(self.data, timeperiod=5)[-1]
+        long_average = talib.EMA(self.data, timeperiod=20)[-1]
+        self.assertAlmostEqual(exponential_sweep[0, 0, -1],
+                               100 * (short_average - long_average) / ((short_average + long_average) / 2), places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import math
+import random
+import unittest
+
+from trading.indicators.backends.numpy_backend import calc_rolling_sum_series, calc_van_herk_max_series, \
+    calc_van_herk_min_series
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.misc import get_period_high, get_period_low
+from trading.indicators.rolling import RollingMaximum, RollingMinimum, calc_rolling_max_series, \
+    calc_rolling_min_series
+
+
+class RollingIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.data = [random.randint(0, 50) / 10.0 for _ in range(0, 300)]
+
+    def test_rolling_extremes(self):
+        for interval in (1, 3, 23, 100):
+            rolling_maximum = RollingMaximum(interval)
+            rolling_minimum = RollingMinimum(interval)
+
+            for i, data_point in enumerate(self.data):
+                maximum = rolling_maximum.update(data_point)
+                minimum = rolling_minimum.update(data_point)
+
+                if i + 1 < interval:
+                    self.assertIsNone(maximum)
+                    self.assertIsNone(minimum)
+                else:
+                    self.assertEqual(maximum, get_period_high(self.data[:i + 1], interval))
+                    self.assertEqual(minimum, get_period_low(self.data[:i + 1], interval))
+
+                self.assertLessEqual(len(rolling_maximum.candidates), interval)
+
+        with self.assertRaises(TalibIntervalException):
+            RollingMaximum(5).value
+
+    def test_rolling_extreme_series(self):
+        for interval in (1, 3, 23, 100, 300):
+            maximums = calc_rolling_max_series(self.data, interval)
+            minimums = calc_rolling_min_series(self.data, interval)
+
+            self.assertTrue(all(math.isnan(value) for value in maximums[:interval - 1]))
+
+            for i in range(interval - 1, len(self.data)):
+                self.assertEqual(maximums[i], get_period_high(self.data[:i + 1], interval))
+                self.assertEqual(minimums[i], get_period_low(self.data[:i + 1], interval))
+
+        self.assertTrue(all(math.isnan(value) for value in calc_rolling_max_series(self.data, 301)))
+
+    def test_van_herk_series(self):
+        for interval in (1, 2, 3, 23, 100, 300):
+            self.assertEqual(calc_van_herk_max_series(self.data, interval)[interval - 1:].tolist(),
+                             calc_rolling_max_series(self.data, interval)[interval - 1:].tolist())
+            self.assertEqual(calc_van_herk_min_series(self.data, interval)[interval - 1:].tolist(),
+                             calc_rolling_min_series(self.data, interval)[interval - 1:].tolist())
+
+        self.assertTrue(all(math.isnan(value) for value in calc_van_herk_min_series(self.data, 301)))
+
+    def test_rolling_sum_series(self):
+        for interval in (1, 3, 23, 100, 300):
+            sums = calc_rolling_sum_series(self.data, interval)
+
+            self.assertTrue(all(math.isnan(value) for value in sums[:interval - 1]))
+
+            for i in range(interval - 1, len(self.data)):
+                self.assertAlmostEqual(sums[i], math.fsum(self.data[i + 1 - interval:i + 1]), places=10)
+
+        data = list(self.data)
+        data[150] = float('nan')
+        sums = calc_rolling_sum_series(data, 23)
+        self.assertTrue(all(math.isnan(value) for value in sums[150:173]))
+        self.assertFalse(any(math.isnan(value) for value in sums[22:150]))
+        self.assertFalse(any(math.isnan(value) for value in sums[173:]))
+
+    def test_rolling_columns(self):
+        columns = [self.data, self.data[::-1], [-data_point for data_point in self.data]]
+        data = list(zip(*columns))
+
+        for interval in (1, 23, 300):
+            maximums = calc_van_herk_max_series(data, interval)
+            minimums = calc_van_herk_min_series(data, interval)
+            sums = calc_rolling_sum_series(data, interval)
+
+            self.assertEqual(maximums.shape, (len(self.data), 3))
+
+            for i, column in enumerate(columns):
+                self.assertEqual(maximums[interval - 1:, i].tolist(),
+                                 calc_van_herk_max_series(column, interval)[interval - 1:].tolist())
+                self.assertEqual(minimums[interval - 1:, i].tolist(),
+                                 calc_van_herk_min_series(column, interval)[interval - 1:].tolist())
+                self.assertEqual(sums[interval - 1:, i].tolist(),
+                                 calc_rolling_sum_series(column, interval)[interval - 1:].tolist())
@@ -0,0 +1,140 @@
+import random
+import unittest
+
+import numpy as np
+import talib
+
+from trading.indicators.cycle_indicators import calc_hilbert_transformation_dominant_cycle_period_series, \
+    calc_hilbert_transformation_dominant_cycle_phase_series, calc_hilbert_transformation_phasor_components_series, \
+    calc_hilbert_transformation_sine_wave_series, calc_hilbert_transformation_trend_vs_cycle_mode_series
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.overlap_studies import calc_moving_average
+from trading.indicators.price_transformation import calc_standard_deviation
+from trading.indicators.misc import calc_chandalier_exits
+from trading.indicators.streaming import StreamingMovingAverage, StreamingStandardDeviation, \
+    StreamingAverageTrueRange, StreamingChandalierExits, StreamingDominantCyclePeriod, StreamingDominantCyclePhase, \
+    StreamingPhasorComponents, StreamingSineWave, StreamingTrendVsCycleMode, StreamingOnBalanceVolume, \
+    StreamingChaikinADLine, StreamingChaikinADOscillator
+from trading.indicators.volatility_indicators import calc_average_true_range
+from trading.indicators.volume_indicators import calc_on_balance_volume_series, calc_chaikin_a_d_line_series, \
+    calc_chaikin_a_d_oscillator_series
+
+
+class StreamingIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.close = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 500)]
+        self.high = [price + random.uniform(0, 0.01) for price in self.close]
+        self.low = [price - random.uniform(0, 0.01) for price in self.close]
+        self.volume = [random.randint(0, 100) for _ in self.close]
+
+    def test_moving_average(self):
+        for interval in (2, 10, 40):
+            moving_average = StreamingMovingAverage(interval)
+
+            for i, price in enumerate(self.close):
+                value = moving_average.update(price)
+
+                if i + 1 < interval:
+                    self.assertIsNone(value)
+                else:
+                    self.assertAlmostEqual(value, calc_moving_average(self.close[:i + 1], interval), places=12)
+
+        with self.assertRaises(TalibIntervalException):
+            StreamingMovingAverage(10).value
+
+    def test_standard_deviation(self):
+        for interval in (5, 40, 200):
+            standard_deviation = StreamingStandardDeviation(interval)
+
+            for i, price in enumerate(self.close):
+                value = standard_deviation.update(price)
+
+                if i + 1 >= interval:
+                    self.assertAlmostEqual(value, calc_standard_deviation(self.close[:i + 1], interval), places=9)
+
+    def test_average_true_range(self):
+        interval = 14
+        average_true_range = StreamingAverageTrueRange(interval)
+
+        for i in range(0, len(self.close)):
+            value = average_true_range.update(self.close[i], self.high[i], self.low[i])
+
+            if i < interval:
+                self.assertIsNone(value)
+            else:
+                expected = calc_average_true_range(self.close[:i + 1], self.high[:i + 1], self.low[:i + 1], interval)
+                self.assertAlmostEqual(value, expected, places=12)
+
+    def test_wilder_average_true_range(self):
+        interval = 14
+        average_true_range = StreamingAverageTrueRange(interval, wilder=True)
+
+        for i in range(0, len(self.close)):
+            average_true_range.update(self.close[i], self.high[i], self.low[i])
+
+        expected = talib.ATR(np.asarray(self.high), np.asarray(self.low), np.asarray(self.close), timeperiod=interval)
+        self.assertAlmostEqual(average_true_range.value, expected[-1], places=12)
+
+    def test_chandalier_exits(self):
+        chandalier_exits = StreamingChandalierExits(target_interval=22)
+
+        for i in range(0, len(self.close)):
+            exits = chandalier_exits.update(self.close[i], self.high[i], self.low[i])
+
+            if i < 22:
+                self.assertIsNone(exits)
+            else:
+                expected = calc_chandalier_exits(self.close[:i + 1], self.high[:i + 1], self.low[:i + 1],
+                                                 target_interval=22)
+                self.assertAlmostEqual(exits[0], expected[0], places=12)
+                self.assertAlmostEqual(exits[1], expected[1], places=12)
+
+    def test_hilbert_transform(self):
+        streaming_series = (
+            (StreamingDominantCyclePeriod(), (calc_hilbert_transformation_dominant_cycle_period_series(self.close),)),
+            (StreamingDominantCyclePhase(), (calc_hilbert_transformation_dominant_cycle_phase_series(self.close),)),
+            (StreamingPhasorComponents(), calc_hilbert_transformation_phasor_components_series(self.close)),
+            (StreamingSineWave(), calc_hilbert_transformation_sine_wave_series(self.close)),
+            (StreamingTrendVsCycleMode(), (calc_hilbert_transformation_trend_vs_cycle_mode_series(self.close),))
+        )
+
+        for streaming_indicator, expected_series in streaming_series:
+            for i, data_point in enumerate(self.close):
+                value = streaming_indicator.update(data_point)
+
+                if i < streaming_indicator.lookback:
+                    self.assertIsNone(value)
+                    self.assertTrue(np.isnan(expected_series[0][i]))
+                    continue
+
+                values = value if isinstance(value, tuple) else (value,)
+                for streaming_value, expected in zip(values, expected_series):
+                    self.assertAlmostEqual(streaming_value, expected[i], places=9)
+
+            self.assertEqual(streaming_indicator.count, len(self.close))
+
+        with self.assertRaises(TalibIntervalException):
+            StreamingDominantCyclePhase().value
+
+    def test_volume_indicators(self):
+        on_balance_volume = StreamingOnBalanceVolume()
+        a_d_line = StreamingChaikinADLine()
+        a_d_oscillator = StreamingChaikinADOscillator(fast_interval=3, slow_interval=10)
+
+        expected_on_balance_volume = calc_on_balance_volume_series(self.close, self.volume)
+        expected_a_d_line = calc_chaikin_a_d_line_series(self.high, self.low, self.close, self.volume)
+        expected_a_d_oscillator = calc_chaikin_a_d_oscillator_series(self.high, self.low, self.close, self.volume)
+
+        for i, candle in enumerate(zip(self.close, self.high, self.low, self.volume)):
+            close, high, low, volume = candle
+
+            self.assertEqual(on_balance_volume.update(close, volume), expected_on_balance_volume[i])
+            self.assertAlmostEqual(a_d_line.update(close, high, low, volume), expected_a_d_line[i], places=9)
+
+            oscillator = a_d_oscillator.update(close, high, low, volume)
+            if i < 9:
+                self.assertIsNone(oscillator)
+                self.assertTrue(np.isnan(expected_a_d_oscillator[i]))
+            else:
+                self.assertAlmostEqual(oscillator, expected_a_d_oscillator[i], places=9)
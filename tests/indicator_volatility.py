@@ -1,7 +1,8 @@
+import math
 import random
 import unittest
 
-from trading.indicators.volatility_indicators import calc_average_true_range
+from trading.indicators.volatility_indicators import calc_average_true_range, calc_average_true_range_series
 from trading.indicators.exceptions import TalibIntervalException
 
 
@@ -20,3 +21,16 @@ class MiscIndicatorTests(unittest.TestCase):
 
         with self.assertRaises(TalibIntervalException):
             calc_average_true_range(high=high, low=low, close=close, interval=100)
+
+    def test_calculate_average_true_range_series(self):
+        close = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 200)]
+        high = [point + random.uniform(0, 0.01) for point in close]
+        low = [point - random.uniform(0, 0.01) for point in close]
+
+        atr = calc_average_true_range_series(close, high, low, interval=14)
+
+        self.assertTrue(all(math.isnan(value) for value in atr[:14]))
+
+        for i in range(14, 200):
+            expected = calc_average_true_range(close[:i + 1], high[:i + 1], low[:i + 1], interval=14)
+            self.assertAlmostEqual(atr[i], expected, places=12)
@@ -0,0 +1,58 @@
+import random
+import unittest
+
+import numpy as np
+
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.volume_indicators import calc_on_balance_volume, calc_on_balance_volume_series, \
+    calc_chaikin_a_d_line, calc_chaikin_a_d_line_series, calc_chaikin_a_d_oscillator, \
+    calc_chaikin_a_d_oscillator_series
+
+
+class VolumeIndicatorTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(21)
+        self.close = [1.1 + random.uniform(-0.05, 0.05) for _ in range(0, 100)]
+        self.high = [price + random.uniform(0, 0.01) for price in self.close]
+        self.low = [price - random.uniform(0, 0.01) for price in self.close]
+        self.volume = [random.randint(0, 100) for _ in self.close]
+
+    def test_on_balance_volume(self):
+        expected = [self.volume[0]]
+        for i in range(1, len(self.close)):
+            direction = np.sign(self.close[i] - self.close[i - 1])
+            expected.append(expected[-1] + direction * self.volume[i])
+
+        self.assertEqual(calc_on_balance_volume_series(self.close, self.volume).tolist(), expected)
+        self.assertEqual(calc_on_balance_volume(self.close, self.volume), expected[-1])
+
+        with self.assertRaises(TalibIntervalException):
+            calc_on_balance_volume([], [])
+
+    def test_chaikin_a_d_line(self):
+        a_d_line = 0.0
+        expected = []
+        for close, high, low, volume in zip(self.close, self.high, self.low, self.volume):
+            a_d_line += ((close - low) - (high - close)) / (high - low) * volume
+            expected.append(a_d_line)
+
+        a_d_line_series = calc_chaikin_a_d_line_series(self.high, self.low, self.close, self.volume)
+        for value, expected_value in zip(a_d_line_series, expected):
+            self.assertAlmostEqual(value, expected_value, places=9)
+
+        self.assertEqual(calc_chaikin_a_d_line(self.high, self.low, self.close, self.volume), a_d_line_series[-1])
+
+    def test_chaikin_a_d_oscillator(self):
+        oscillator = calc_chaikin_a_d_oscillator_series(self.high, self.low, self.close, self.volume,
+                                                        fast_interval=3, slow_interval=10)
+
+        self.assertTrue(np.isnan(oscillator[:9]).all())
+        self.assertFalse(np.isnan(oscillator[9:]).any())
+        self.assertEqual(calc_chaikin_a_d_oscillator(self.high, self.low, self.close, self.volume), oscillator[-1])
+
+        with self.assertRaises(TalibIntervalException):
+            calc_chaikin_a_d_oscillator(self.high[:9], self.low[:9], self.close[:9], self.volume[:9])
+
+
+if __name__ == '__main__':
+    unittest.main()
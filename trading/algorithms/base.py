@@ -9,6 +9,10 @@ from trading.constants.order import SIDE_BUY, ORDER_MARKET
 from trading.constants.granularity import GRANULARITY_HOUR
 from trading.constants.interval import INTERVAL_FORTY_CANDLES
 from trading.db import get_database
+from trading.indicators.cache import indicator_cache, make_series_key
+from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.lookback import plan_data_window
+from trading.indicators.pattern_recognition import PATTERN_NAMES, scan_candle_patterns
 from trading.util.log import Logger
 
 
@@ -25,6 +29,9 @@ class Strategy(object):
     data_window = INTERVAL_FORTY_CANDLES
     granularity = GRANULARITY_HOUR
 
+    precomputed_store = None
+    indicator_series = {}
+
     def __init__(self, strategy_id, strategy_config):
         self.strategy_id = strategy_id
         instrument = strategy_config['instrument']
@@ -34,6 +41,10 @@ class Strategy(object):
         self.instrument = instrument
         self.portfolio = Portfolio(instrument, base_pair, quote_pair)
 
+        indicators = self.declare_indicators()
+        if indicators:
+            self.data_window = plan_data_window(indicators)
+
         self.logger.info('Starting Portfolio', data=self.portfolio)
 
     @abstractmethod
@@ -56,6 +67,69 @@ class Strategy(object):
     def allocate_tradeable_amount(self):
         raise NotImplementedError
 
+    def declare_indicators(self):
+        """
+        Indicators analyze_data reads, as IndicatorGraph, IndicatorNode or number of candles
+        data_window is planned from them, brokers then fetch exactly the candles they need
+        :return: list of indicators, empty to keep the class data_window
+        """
+        return []
+
+    def precompute_indicators(self, candle_store):
+        """
+        Used when the full history is known up front, e.g. backtests
+        calc_indicators then computes series once over the store and reads them at the newest candle of each window
+        :param candle_store: CandleStore the tick windows are taken from
+        """
+        self.precomputed_store = candle_store
+        self.indicator_series = {}
+
+    def is_precomputed(self, candle_window):
+        return self.precomputed_store is not None and getattr(candle_window, 'store', None) is self.precomputed_store
+
+    def calc_indicators(self, candle_window, indicator_graph):
+        """
+        Values of the graph outputs at the newest candle of the window
+        Windows over the precomputed store read series computed once over the whole store,
+        other windows evaluate the graph over their last candles
+        Results are shared through the indicator cache with other strategies on the same candles
+        :param indicator_graph: IndicatorGraph of the indicators the strategy needs
+        :return: dictionary of output name to value
+        """
+        if len(candle_window) < indicator_graph.required_interval:
+            raise TalibIntervalException
+
+        if not self.is_precomputed(candle_window):
+            window_key = make_series_key(candle_window)
+            cache_key = (window_key, indicator_graph.key) if window_key is not None else None
+
+            return indicator_cache.get_or_calc(cache_key, lambda: indicator_graph.calc_latest(candle_window))
+
+        if indicator_graph.key not in self.indicator_series:
+            candle_store = self.precomputed_store
+            cache_key = (make_series_key(candle_store), indicator_graph.key)
+            self.indicator_series[indicator_graph.key] = indicator_cache.get_or_calc(
+                cache_key, lambda: indicator_graph.calc_series(candle_store))
+
+        series = self.indicator_series[indicator_graph.key]
+        index = candle_window.end - 1
+
+        return dict((name, values[index]) for name, values in series.items())
+
+    def calc_patterns(self, candle_window, patterns=PATTERN_NAMES):
+        """
+        Candlestick pattern signals at the newest candle of the window
+        Windows over the precomputed store read a single scan of the whole store
+        :return: dictionary of pattern name to signal
+        """
+        if not len(candle_window):
+            raise TalibIntervalException
+
+        if not self.is_precomputed(candle_window):
+            return scan_candle_patterns(candle_window, patterns).candle(-1)
+
+        return scan_candle_patterns(self.precomputed_store, patterns).candle(candle_window.end - 1)
+
     def update_portfolio(self, order_responses):
         self.portfolio.update(order_responses)
 
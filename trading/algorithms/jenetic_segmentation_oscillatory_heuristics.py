@@ -4,14 +4,13 @@ from decimal import Decimal
 from bson import ObjectId
 
 from trading.algorithms.base import Strategy
-from trading.constants.price_data import PRICE_ASK, PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW
+from trading.constants.price_data import PRICE_ASK
 from trading.constants.order import SIDE_BUY, SIDE_SELL, SIDE_STAY
 from trading.constants.granularity import GRANULARITY_TEN_MINUTE
 from trading.constants.interval import INTERVAL_FORTY_CANDLES
-from trading.indicators.misc import calc_chandalier_exits
-from trading.indicators.overlap_studies import calc_moving_average
-from trading.indicators.price_transformation import calc_standard_deviation
-from trading.util.transformations import normalize_price_data, normalize_current_price_data
+from trading.indicators.graph import IndicatorGraph, chandalier_exit_nodes, moving_average_node, \
+    standard_deviation_node
+from trading.util.transformations import normalize_current_price_data
 
 
 class Josh(Strategy):
@@ -22,6 +21,8 @@ class Josh(Strategy):
     long_exit_sensitivity = 10
     short_exit_sensitivity = 5
 
+    indicator_graphs = {}
+
     def __init__(self, config):
         strategy_id = config.get('strategy_id')
 
@@ -58,18 +59,19 @@ class Josh(Strategy):
         historical_candle_data = historical_market_data['candles']
         asking_price = normalize_current_price_data(current_market_data, PRICE_ASK)
 
-        closing_market_data = normalize_price_data(historical_candle_data, PRICE_ASK_CLOSE)
-        high_market_data = normalize_price_data(historical_candle_data, PRICE_ASK_HIGH)
-        low_market_data = normalize_price_data(historical_candle_data, PRICE_ASK_LOW)
+        bollinger_interval = min(INTERVAL_FORTY_CANDLES, len(market_data))
+
+        indicators = self.calc_indicators(historical_candle_data, self.get_indicator_graph(bollinger_interval))
 
-        std = Decimal(calc_standard_deviation(closing_market_data, min(INTERVAL_FORTY_CANDLES, len(market_data))))
+        std = Decimal(indicators['std'])
 
         # Construct the upper and lower Bollinger Bands
-        ma = Decimal(calc_moving_average(closing_market_data, min(INTERVAL_FORTY_CANDLES, len(market_data))))
+        ma = Decimal(indicators['ma'])
         upper = ma + (Decimal(2) * std)
         lower = ma - (Decimal(2) * std)
 
-        long_exit, short_exit = calc_chandalier_exits(closing_market_data, high_market_data, low_market_data)
+        long_exit = indicators['long_exit']
+        short_exit = indicators['short_exit']
 
         self.strategy_data['asking_price'] = asking_price
         self.strategy_data['long_candle_exit'] = long_exit
@@ -77,6 +79,23 @@ class Josh(Strategy):
         self.strategy_data['lower_bound_ma'] = lower
         self.strategy_data['upper_bound_ma'] = upper
 
+    def declare_indicators(self):
+        # analyze_data never uses a Bollinger interval above forty candles
+        return [self.get_indicator_graph(INTERVAL_FORTY_CANDLES)]
+
+    def get_indicator_graph(self, bollinger_interval):
+        if bollinger_interval not in self.indicator_graphs:
+            long_exit, short_exit = chandalier_exit_nodes()
+
+            self.indicator_graphs[bollinger_interval] = IndicatorGraph({
+                'std': standard_deviation_node(bollinger_interval),
+                'ma': moving_average_node(bollinger_interval),
+                'long_exit': long_exit,
+                'short_exit': short_exit
+            })
+
+        return self.indicator_graphs[bollinger_interval]
+
     def make_decision(self):
         asking_price = self.strategy_data['asking_price']
         long_candle_exit = self.strategy_data['long_candle_exit']
@@ -7,6 +7,7 @@ from trading.algorithms.base import Strategy
 from trading.constants.price_data import PRICE_ASK, PRICE_ASK_CLOSE
 from trading.constants.order import SIDE_BUY, SIDE_SELL, SIDE_STAY
 from trading.constants.interval import INTERVAL_TWENTY_CANDLES, INTERVAL_TEN_CANDLES
+from trading.indicators.graph import moving_average_node
 from trading.indicators.overlap_studies import calc_moving_average
 from trading.util.transformations import normalize_price_data, normalize_current_price_data
 
@@ -28,6 +29,9 @@ class MAC(Strategy):
         self.strategy_id = strategy_id
         self.invested = False
 
+    def declare_indicators(self):
+        return [moving_average_node(INTERVAL_TEN_CANDLES), moving_average_node(INTERVAL_TWENTY_CANDLES)]
+
     def calc_units_to_buy(self, current_price):
         base_pair_tradeable = self.portfolio.base_pair.tradeable_units
         num_units = math.floor(base_pair_tradeable / current_price)
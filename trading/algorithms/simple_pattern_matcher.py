@@ -8,8 +8,10 @@ from trading.constants.price_data import PRICE_ASK, PRICE_ASK_CLOSE, PRICE_ASK_O
 from trading.constants.order import SIDE_BUY, SIDE_SELL, SIDE_STAY
 from trading.constants.granularity import GRANULARITY_TEN_MINUTE
 from trading.classifier import RFClassifier
-from trading.constants.interval import INTERVAL_ONE_HUNDRED_CANDLES
+from trading.indicators.lookback import average_directional_movement_index_rating_required_interval, \
+    candle_patterns_required_interval
 from trading.indicators.momentum_indicators import calc_average_directional_movement_index_rating
+from trading.indicators.pattern_recognition import PATTERN_NAMES
 from trading.util.transformations import normalize_price_data, normalize_current_price_data, get_last_candle_data
 
 
@@ -22,8 +24,7 @@ class PatternMatch(Strategy):
 
     _classifier = None
 
-    data_window = INTERVAL_ONE_HUNDRED_CANDLES
-    features = ['close', 'open', 'high', 'low']
+    features = ['close', 'open', 'high', 'low'] + list(PATTERN_NAMES)
     granularity = GRANULARITY_TEN_MINUTE
     required_volume = 10
     required_trend_strength = 25
@@ -41,6 +42,11 @@ class PatternMatch(Strategy):
         self.classifier_config = config['classifier_config']
         self.invested = False
 
+    def declare_indicators(self):
+        # calculate_trend compares the newest low with the low trend_interval candles into the window
+        return [average_directional_movement_index_rating_required_interval(self.trend_interval),
+                self.trend_interval + 1, candle_patterns_required_interval()]
+
     def calc_units_to_buy(self, current_price):
         base_pair_units = self.portfolio.base_pair.tradeable_units
         num_units = math.floor(base_pair_units / current_price)
@@ -87,6 +93,8 @@ class PatternMatch(Strategy):
             'high': current_high,
             'low': current_low
         }
+        X.update(self.calc_patterns(historical_candle_data))
+        self.strategy_data.update(X)
 
         market_prediction = self.classifier.predict(X, format_data=True, unwrap_prediction=True)
         pattern = market_prediction.decision
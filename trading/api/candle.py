@@ -7,7 +7,8 @@ from flask import request
 from flask_restful import Resource
 
 from trading.api import ok, abort
-from trading.api.util import find_chart_start_end_date, find_marked_candles, find_target_candle, make_date_id_map
+from trading.api.util import find_chart_start_end_date, find_marked_candles, find_target_candle_time
+from trading.candles.collection import find_candles, find_candle_range_bounds, make_candle_key
 from trading.db import get_database, transform_son
 
 root = logging.getLogger()
@@ -20,6 +21,15 @@ ch.setFormatter(formatter)
 root.addHandler(ch)
 
 
+def find_chart_candles(db, chart, query=None):
+    if not chart['num_candles']:
+        return []
+
+    candles = find_candles(db, chart['instrument'], chart['granularity'], chart['start_time'], chart['end_time'],
+                           query=query)
+    return [transform_son(candle) for candle in candles]
+
+
 class Candle(Resource):
     def get(self):
         logging.info('At Candle GET Endpoint')
@@ -31,7 +41,7 @@ class Candle(Resource):
             title = chart_data['title']
             y_params = chart_data['y_params']
             x_params = chart_data['x_params']
-            candles = chart_data['candles']
+            candles = find_chart_candles(db, chart_data)
         except Exception as e:
             logging.info('E %s', e)
             traceback.print_exc(file=sys.stdout)
@@ -45,7 +55,6 @@ class Candle(Resource):
         request_data = request.get_json()
         candle = request_data.get('candle')
         pattern = request_data.get('pattern')
-        hours_offset = request_data.get('hours_offset')
         chart_id = request_data.get('chart_id')
 
         db = get_database()
@@ -53,22 +62,21 @@ class Candle(Resource):
         try:
             chart_id = ObjectId(chart_id)
             chart_data = transform_son(db.candle_data.find_one({'_id': chart_id}))
-            date_id_map = make_date_id_map(chart_data['candles'], hours_offset)
-            target_candle = find_target_candle(candle, date_id_map)
-            target_candle_id = target_candle['id']
+            target_candle_time = find_target_candle_time(candle)
 
-            target_candle['pattern'] = pattern
-            query = {'_id': chart_id, 'candles.id': target_candle_id}
-            update = {'$set': {'candles.$': target_candle}}
+            query = make_candle_key(chart_data['instrument'], chart_data['granularity'], target_candle_time)
+            update = {'$set': {'pattern': pattern}}
 
-            print(query, update)
-            db.candle_data.update(query, update)
+            result = db.candles.update_one(query, update)
 
         except Exception as e:
             logging.error('E %s', e)
             traceback.print_exc(file=sys.stdout)
             return abort(status=500)
 
+        if not result.matched_count:
+            return abort(status=404, message='No candle at {date}'.format(date=candle['date']))
+
         return ok(202)
 
 
@@ -85,11 +93,12 @@ class CandleCharts(Resource):
             for chart in charts:
                 chart_id = chart['id']
                 granularity = chart['granularity']
-                candles = chart['candles']
                 instrument = chart['instrument']
-                start_date, end_date = find_chart_start_end_date(candles)
+                bounding_candles = find_candle_range_bounds(db, instrument, granularity, chart['start_time'],
+                                                            chart['end_time'])
+                start_date, end_date = find_chart_start_end_date(bounding_candles)
 
-                num_candles = len(candles)
+                num_candles = chart['num_candles']
                 chart_data[chart_id] = {
                     'instrument': instrument,
                     'granularity': granularity,
@@ -109,8 +118,10 @@ class CandlePattern(Resource):
     def get(self):
         logging.info('At CandlePattern GET Endpoint')
         db = get_database()
-        charts = db.candle_data.find()
-        charts = map(transform_son, charts)
+        charts = [transform_son(chart) for chart in db.candle_data.find()]
+
+        for chart in charts:
+            chart['candles'] = find_chart_candles(db, chart, query={'pattern': {'$exists': True}})
 
         marked_candles = find_marked_candles(charts)
 
@@ -1,3 +1,11 @@
+import datetime
+
+from trading.candles.timestamps import format_candle_time, to_epoch_ns
+
+# Chart dates are displayed shifted from the stored UTC candle times
+CHART_HOURS_OFFSET = -8
+
+
 def find_marked_candles(charts):
     chart_id_candle_map = {}
 
@@ -11,51 +19,24 @@ def find_marked_candles(charts):
 
 
 def find_chart_start_end_date(candles):
-    sorted_candles = sorted(candles, key=lambda t: t['date']['utc'])
+    """
+    :param candles: time ordered candle documents, e.g. the bounding candles of a chart
+    :return: start and end candle times in the broker time format, None for a chart without candles
+    """
+    if not candles or candles[0] is None:
+        return None, None
 
-    start = sorted_candles[0]['date']['utc']
-    end = sorted_candles[-1]['date']['utc']
+    start = format_candle_time(candles[0]['time'])
+    end = format_candle_time(candles[-1]['time'])
 
     return start, end
 
 
-def find_target_candle(target_candle, date_id_map):
-    print 'TARGET_CANDLE', target_candle
-    print('NUM candles', len(date_id_map))
-    target_date = target_candle['date']
-    try:
-        matching_candle = date_id_map[target_date]
-    except KeyError as e:
-        return None
-    return matching_candle
-
-
-def make_date_id_map(candles, hours_offset):
-    date_id_map = {}
-
-    for candle in candles:
-        date = candle['date']
-
-        old_formatted_date = '-'.join([str(date['year']), str(date['month']), str(date['day']), str(date['hour']),
-                                       str(date['minute'])])
-
-        old_hours = int(date['hour'])
-        old_days = int(date['day'])
-        hours_offset = -8
-        new_hours = old_hours + hours_offset
-
-        if new_hours < 0:
-            hours = 24 - abs(new_hours)
-            days = old_days - 1
-        else:
-            hours = new_hours
-            days = old_days
-
-        new_formatted_date = '-'.join([str(date['year']), str(date['month']), str(days), str(hours),
-                                       str(date['minute'])])
-
-        print(old_formatted_date, new_formatted_date)
-
-        date_id_map[new_formatted_date] = candle
+def find_target_candle_time(target_candle, hours_offset=CHART_HOURS_OFFSET):
+    """
+    Epoch nanoseconds of the stored candle behind a chart date ('year-month-day-hour-minute')
+    """
+    year, month, day, hour, minute = [int(part) for part in target_candle['date'].split('-')]
+    target_date = datetime.datetime(year, month, day, hour, minute) - datetime.timedelta(hours=hours_offset)
 
-    return date_id_map
+    return to_epoch_ns(target_date)
@@ -3,11 +3,14 @@ import datetime
 from bson import ObjectId
 
 from trading.broker.base import Broker
+from trading.candles.binary import is_candle_file, load_candle_file, iter_candle_file_chunks
+from trading.candles.chunked import ChunkedCandleStore
+from trading.candles.shared import attach_candle_dataset
+from trading.candles.stream import load_json_candle_store, iter_json_candle_stores
 from trading.constants.interval import INTERVAL_FORTY_CANDLES
 from trading.constants.granularity import GRANULARITY_DAY
 from trading.backtest.account import Account
 from trading.constants.order import SIDE_BUY, SIDE_SELL
-from trading.backtest.util import load_json_file
 from trading.backtest.exceptions import BacktestBrokerException
 
 
@@ -15,10 +18,8 @@ class BacktestDataBroker(Broker):
     name = 'Backtest_Data'
 
     _account_id = None
-    _historic_data = {
-        'candles': [],
-        'meta_data': {}
-    }
+    _candle_store = None
+    _shared_dataset = None
 
     def __init__(self, instrument, base_pair, quote_pair, data_file):
         self.account = Account(instrument, base_pair, quote_pair)
@@ -32,7 +33,7 @@ class BacktestDataBroker(Broker):
 
     def get_current_price_data(self, tick):
         backtest_instrument = self.account.instrument
-        target_candle = self._historic_data['candles'][tick]
+        target_candle = self._candle_store.candle(tick)
         candle_time = target_candle['time']
         closing_asking_price = target_candle['closeAsk']
 
@@ -45,9 +46,9 @@ class BacktestDataBroker(Broker):
         ending_candle = tick + count
 
         historical_data = {
-            'candles': self._historic_data['candles'][starting_candle: ending_candle],
-            'instrument': self._historic_data['meta_data']['instrument'],
-            'granularity': self._historic_data['meta_data']['granularity']
+            'candles': self._candle_store.window(starting_candle, ending_candle),
+            'instrument': self._candle_store.instrument,
+            'granularity': self._candle_store.granularity
         }
 
         if len(historical_data['candles']) < count:
@@ -55,18 +56,43 @@ class BacktestDataBroker(Broker):
         else:
             return historical_data
 
-    def get_backtest_price_data(self, count, granularity):
-        historic_data = load_json_file(self.data_file)
-        candles = historic_data['candles']
+    def get_backtest_price_data(self, count, granularity, instrument=None, chunk_size=None, lookback=0):
+        """
+        :param instrument: instrument of JSON candles, the broker instrument if None
+        :param chunk_size: page through the data file in blocks of chunk_size candles instead of loading it whole
+        :param lookback: candles kept from the previous block in chunked mode, the strategy data window
+        """
+        if instrument is None:
+            instrument = self.instrument
 
-        self._historic_data['meta_data'] = {
-            'instrument': self.instrument,
-            'granularity': granularity
-        }
+        if chunk_size:
+            if is_candle_file(self.data_file):
+                candle_chunks = iter_candle_file_chunks(self.data_file, chunk_size, count)
+            else:
+                candle_chunks = iter_json_candle_stores(self.data_file, chunk_size, count, instrument, granularity)
+
+            print('Chunked Backtest Data, TARGET COUNT:', count, 'CHUNK SIZE:', chunk_size)
+            self._candle_store = ChunkedCandleStore(candle_chunks, lookback, instrument, granularity)
+
+        elif is_candle_file(self.data_file):
+            candle_store = load_candle_file(self.data_file)
 
-        print('Fetched Backtest Data, TARGET COUNT:', count, 'FOUND CANDLES:', len(candles))
-        for i in range(0, min(count, len(candles))):
-            self._historic_data['candles'].append(candles[i])
+            print('Mapped Backtest Data, TARGET COUNT:', count, 'FOUND CANDLES:', len(candle_store))
+            self._candle_store = candle_store.slice(0, count)
+
+        else:
+            candle_store = load_json_candle_store(self.data_file, count, instrument, granularity)
+
+            print('Streamed Backtest Data, TARGET COUNT:', count, 'FOUND CANDLES:', len(candle_store))
+            self._candle_store = candle_store
+
+    def attach_backtest_price_data(self, dataset_name, count=None):
+        """
+        Maps a dataset published with SharedCandleDataset instead of loading candles in this process
+        :param count: number of candles to backtest, all published candles if None
+        """
+        self._shared_dataset = attach_candle_dataset(dataset_name)
+        self._candle_store = self._shared_dataset.candle_store.slice(0, count)
 
     def get_order(self, order_id):
         return {}
@@ -117,6 +143,10 @@ class BacktestDataBroker(Broker):
             'balance': balance
         }
 
+    @property
+    def candle_store(self):
+        return self._candle_store
+
     @property
     def account_id(self):
         if self._account_id is None:
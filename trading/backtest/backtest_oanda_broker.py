@@ -5,6 +5,10 @@ from bson import ObjectId
 from oandapy.oandapy import EndpointsMixin
 
 from trading.broker.base import Broker
+from trading.candles.cache import get_default_candle_cache
+from trading.candles.download import download_latest, MAX_CANDLES_PER_REQUEST
+from trading.candles.store import CandleStore
+from trading.candles.shared import attach_candle_dataset
 from trading.constants.interval import INTERVAL_FORTY_CANDLES
 from trading.constants.granularity import GRANULARITY_DAY
 from trading.backtest.account import Account
@@ -15,35 +19,44 @@ class BacktestBroker(Broker, EndpointsMixin):
 
     _account_id = None
     _oanda = None
-    _historic_data = {
-        'candles': [],
-        'meta_data': {}
-    }
+    _candle_store = None
+    _shared_dataset = None
 
-    def __init__(self, instrument, base_pair, quote_pair):
+    def __init__(self, instrument, base_pair, quote_pair, candle_cache=None):
         self.account = Account(instrument, base_pair, quote_pair)
+        self.candle_cache = candle_cache or get_default_candle_cache()
         self._current_tick = 0
 
     def get_account_information(self):
         account_information = self.get_account_info(self.account_id)
         return account_information
 
-    def get_current_price_data(self, instrument):
-        return self._get_current_price_data()
+    def get_current_price_data(self, tick=None):
+        return self._get_current_price_data(tick)
 
-    def get_historical_price_data(self, instrument, count=INTERVAL_FORTY_CANDLES, granularity=GRANULARITY_DAY):
-        starting_candle = self._current_tick
-        ending_candle = self._current_tick + count
+    def get_historical_price_data(self, count=INTERVAL_FORTY_CANDLES, granularity=GRANULARITY_DAY, tick=None):
+        """
+        Same signature as BacktestDataBroker, so either broker runs under BacktestTradingStrategyRunner
+        :param tick: index of the first candle, the broker's own tick if None
+        """
+        if tick is None:
+            tick = self._current_tick
+
+        starting_candle = tick
+        ending_candle = tick + count
 
         return {
-            'candles': self._historic_data['candles'][starting_candle: ending_candle],
-            'instrument': self._historic_data['meta_data']['instrument'],
-            'granularity': self._historic_data['meta_data']['granularity']
+            'candles': self._candle_store.window(starting_candle, ending_candle),
+            'instrument': self._candle_store.instrument,
+            'granularity': self._candle_store.granularity
         }
 
-    def _get_current_price_data(self):
+    def _get_current_price_data(self, tick=None):
+        if tick is None:
+            tick = self._current_tick
+
         backtest_instrument = self.account.instrument
-        target_candle = self._historic_data['candles'][self._current_tick]
+        target_candle = self._candle_store.candle(tick)
         candle_time = target_candle['time']
         closing_asking_price = target_candle['closeAsk']
 
@@ -51,17 +64,32 @@ class BacktestBroker(Broker, EndpointsMixin):
             'prices': [{'ask': closing_asking_price, 'instrument': backtest_instrument, 'time': candle_time}]
         }
 
-    def get_backtest_price_data(self, instrument, count, granularity):
-        historic_data = self.oanda.get_history(instrument=instrument, count=count, granularity=granularity)
-        candles = historic_data['candles']
-
-        self._historic_data['meta_data'] = {
-            'instrument': historic_data['instrument'],
-            'granularity': historic_data['granularity']
-        }
-
-        for i in range(0, count):
-            self._historic_data['candles'].append(candles[i])
+    def get_backtest_price_data(self, count, granularity, instrument=None):
+        """
+        :param instrument: the account instrument if None
+        """
+        if instrument is None:
+            instrument = self.account.instrument
+        if self.candle_cache is not None:
+            self._candle_store = self.candle_cache.get_history(self.oanda, instrument, granularity, count)
+
+        elif count > MAX_CANDLES_PER_REQUEST:
+            self._candle_store = download_latest(self.oanda, instrument, granularity, count)
+
+        else:
+            historic_data = self.oanda.get_history(instrument=instrument, count=count, granularity=granularity)
+            candles = historic_data['candles']
+
+            self._candle_store = CandleStore.from_candles(candles[:count], historic_data['instrument'],
+                                                          historic_data['granularity'])
+
+    def attach_backtest_price_data(self, dataset_name, count=None):
+        """
+        Maps a dataset published with SharedCandleDataset instead of loading candles in this process
+        :param count: number of candles to backtest, all published candles if None
+        """
+        self._shared_dataset = attach_candle_dataset(dataset_name)
+        self._candle_store = self._shared_dataset.candle_store.slice(0, count)
 
     def get_order(self, order_id):
         return {}
@@ -99,6 +127,10 @@ class BacktestBroker(Broker, EndpointsMixin):
             'balance': balance
         }
 
+    @property
+    def candle_store(self):
+        return self._candle_store
+
     @property
     def account_id(self):
         return os.environ['OANDA_ACCOUNT_ID']
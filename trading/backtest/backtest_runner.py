@@ -4,6 +4,7 @@ from collections import defaultdict
 
 from trading.constants.order import SIDE_SELL
 from trading.constants.price_data import PRICE_ASK
+from trading.indicators.cache import indicator_cache
 from trading.live.exceptions import LiveTradingException, KeyboardInterruptMessage
 from trading.strategy_runner.base import TradingStrategyRunner
 from trading.util.transformations import normalize_current_price_data
@@ -12,11 +13,24 @@ from trading.util.transformations import normalize_current_price_data
 class BacktestTradingStrategyRunner(TradingStrategyRunner):
     order_counts = defaultdict(int)
 
-    def __init__(self, strategy_config, broker, backtest_count):
+    def __init__(self, strategy_config, broker, backtest_count, chunk_size=None, shared_dataset=None):
+        """
+        :param chunk_size: run out of core, holding chunk_size candles plus the strategy data window in memory
+        :param shared_dataset: name of a SharedCandleDataset to map instead of loading candles in this process
+        """
         self.backtest_count = backtest_count
+        self.chunk_size = chunk_size
         super(BacktestTradingStrategyRunner, self).__init__(strategy_config, broker)
 
-        broker.get_backtest_price_data(self.instrument, backtest_count, self.strategy.granularity)
+        if shared_dataset:
+            broker.attach_backtest_price_data(shared_dataset, backtest_count)
+        elif chunk_size:
+            broker.get_backtest_price_data(backtest_count, self.strategy.granularity, self.instrument,
+                                           chunk_size=chunk_size, lookback=self.strategy.data_window)
+        else:
+            broker.get_backtest_price_data(backtest_count, self.strategy.granularity, self.instrument)
+
+        self.precompute_strategy_indicators()
 
     def tick(self):
         while self.tick_num < self.backtest_count:
@@ -68,7 +82,7 @@ class BacktestTradingStrategyRunner(TradingStrategyRunner):
         end_time = time.time()
 
         if self.invested:
-            current_market_data = self.broker.get_current_price_data(instrument=self.instrument, tick=self.tick_num)
+            current_market_data = self.broker.get_current_price_data(tick=self.tick_num)
             asking_price = normalize_current_price_data(current_market_data, target_field=PRICE_ASK)
             sell_order = self.strategy.make_order(asking_price, order_side=SIDE_SELL)
             order_response = self.make_market_order(SIDE_SELL, sell_order)
@@ -88,6 +102,7 @@ class BacktestTradingStrategyRunner(TradingStrategyRunner):
         self.logger.info('Trading Results: Portfolio {portfolio}'.format(portfolio=self.strategy.portfolio))
         self.logger.info('Trading Results: Num Orders {num_orders}'.format(num_orders=self.num_orders))
         self.logger.info('Trading Results: Order Counts {order_counts}'.format(order_counts=self.order_counts))
+        self.logger.info('Indicator Cache: {stats}'.format(stats=indicator_cache.stats))
 
 
 
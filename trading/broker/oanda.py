@@ -3,6 +3,7 @@ import os
 from oandapy.oandapy import EndpointsMixin
 
 from trading.broker.base import Broker
+from trading.candles.download import download_latest_candles, MAX_CANDLES_PER_REQUEST
 from trading.constants.interval import INTERVAL_FORTY_CANDLES
 from trading.constants.granularity import GRANULARITY_DAY
 
@@ -25,6 +26,12 @@ class OandaBroker(Broker, EndpointsMixin):
         return broker_response
 
     def get_historical_price_data(self, count=INTERVAL_FORTY_CANDLES, granularity=GRANULARITY_DAY):
+        if count > MAX_CANDLES_PER_REQUEST:
+            # Same response as a single request, with the candles of every page merged
+            candles = download_latest_candles(self.oanda, self.instrument, granularity, count,
+                                              page_size=MAX_CANDLES_PER_REQUEST)
+            return {'instrument': self.instrument, 'granularity': granularity, 'candles': candles}
+
         broker_response = self.oanda.get_history(instrument=self.instrument, count=count, granularity=granularity)
         return broker_response
 
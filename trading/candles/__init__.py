@@ -0,0 +1,2 @@
+from trading.candles.store import CandleStore, CANDLE_FIELDS
+from trading.candles.window import CandleWindow
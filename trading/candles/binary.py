@@ -0,0 +1,160 @@
+import struct
+
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.store import CandleStore, CANDLE_FIELDS, CANDLE_DTYPES
+from trading.candles.stream import load_json_candle_store
+from trading.candles.timestamps import CANDLE_FORMAT_OANDA, CANDLE_FORMAT_DATA_FILE
+
+CANDLE_FILE_EXTENSION = '.candles'
+CANDLE_FILE_MAGIC = b'ATCANDLE'
+CANDLE_FILE_VERSION = 1
+
+# Magic, version, candle count, instrument, granularity and candle format code padded to 64 bytes.
+# The header is followed by one little-endian 8 byte column per field in CANDLE_FIELDS order
+HEADER_FORMAT = '<8sH6xQ24s8sB7x'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+COLUMN_ITEM_SIZE = 8
+
+# Files written before the candle format was recorded hold 0, Oanda shaped candles
+CANDLE_FORMAT_CODES = {
+    CANDLE_FORMAT_OANDA: 0,
+    CANDLE_FORMAT_DATA_FILE: 1
+}
+CANDLE_FORMATS = dict((code, candle_format) for candle_format, code in CANDLE_FORMAT_CODES.items())
+
+
+def is_candle_file(file_name):
+    return file_name.endswith(CANDLE_FILE_EXTENSION)
+
+
+def calc_candle_buffer_size(num_candles):
+    return HEADER_SIZE + len(CANDLE_FIELDS) * num_candles * COLUMN_ITEM_SIZE
+
+
+def pack_header(num_candles, instrument, granularity, candle_format=CANDLE_FORMAT_OANDA):
+    instrument = (instrument or '').encode('ascii')
+    granularity = (granularity or '').encode('ascii')
+    return struct.pack(HEADER_FORMAT, CANDLE_FILE_MAGIC, CANDLE_FILE_VERSION, num_candles, instrument, granularity,
+                       CANDLE_FORMAT_CODES[candle_format])
+
+
+def unpack_header(header):
+    """
+    :return: tuple of candle count, instrument, granularity and candle format
+    """
+    magic, version, num_candles, instrument, granularity, candle_format_code = struct.unpack(HEADER_FORMAT, header)
+
+    if magic != CANDLE_FILE_MAGIC or version != CANDLE_FILE_VERSION or candle_format_code not in CANDLE_FORMATS:
+        raise CandleFormatException
+
+    instrument = instrument.rstrip(b'\0').decode('ascii') or None
+    granularity = granularity.rstrip(b'\0').decode('ascii') or None
+
+    return num_candles, instrument, granularity, CANDLE_FORMATS[candle_format_code]
+
+
+def _pack_store_header(candle_store):
+    return pack_header(len(candle_store), candle_store.instrument, candle_store.granularity,
+                       candle_store.candle_format)
+
+
+def write_candle_buffer(buffer, candle_store):
+    """
+    Writes a store in the binary candle layout into a writable buffer
+    (bytearray, mmap, shared memory) of at least calc_candle_buffer_size bytes
+    """
+    num_candles = len(candle_store)
+    raw = np.frombuffer(buffer, dtype=np.uint8, count=calc_candle_buffer_size(num_candles))
+
+    raw[:HEADER_SIZE] = np.frombuffer(_pack_store_header(candle_store), dtype=np.uint8)
+
+    offset = HEADER_SIZE
+    for field in CANDLE_FIELDS:
+        column_size = num_candles * COLUMN_ITEM_SIZE
+        column = raw[offset:offset + column_size].view(np.dtype(CANDLE_DTYPES[field]).newbyteorder('<'))
+        column[:] = candle_store.column(field)
+        offset += column_size
+
+
+def read_candle_buffer(buffer):
+    """
+    Builds a store whose columns are zero-copy views over a buffer in the binary candle layout
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+
+    if len(raw) < HEADER_SIZE:
+        raise CandleFormatException
+
+    num_candles, instrument, granularity, candle_format = unpack_header(raw[:HEADER_SIZE].tobytes())
+
+    if len(raw) < calc_candle_buffer_size(num_candles):
+        raise CandleFormatException
+
+    columns = {}
+    offset = HEADER_SIZE
+    for field in CANDLE_FIELDS:
+        column_size = num_candles * COLUMN_ITEM_SIZE
+        columns[field] = raw[offset:offset + column_size].view(np.dtype(CANDLE_DTYPES[field]).newbyteorder('<'))
+        offset += column_size
+
+    return CandleStore(columns, instrument, granularity, candle_format)
+
+
+def write_candle_file(file_name, candle_store):
+    with open(file_name, 'wb') as f:
+        f.write(_pack_store_header(candle_store))
+
+        for field in CANDLE_FIELDS:
+            column = candle_store.column(field)
+            column.astype(column.dtype.newbyteorder('<'), copy=False).tofile(f)
+
+
+def load_candle_file(file_name):
+    """
+    Memory-maps a binary candle file read-only, so loading costs the same for any dataset size
+    and processes reading the same file share one copy in the page cache
+    :param file_name: path to a .candles file
+    :return: CandleStore backed by the page cache
+    """
+    mapped_file = np.memmap(file_name, dtype=np.uint8, mode='r')
+    return read_candle_buffer(mapped_file)
+
+
+def iter_candle_file_chunks(file_name, chunk_size, count=None):
+    """
+    Reads a binary candle file in blocks of at most chunk_size candles with plain file reads,
+    so only the current block is held in memory
+    :param count: maximum number of candles to read, all candles if None
+    :return: generator of CandleStore, first block is earliest
+    """
+    with open(file_name, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise CandleFormatException
+
+        num_candles, instrument, granularity, candle_format = unpack_header(header)
+        total_candles = num_candles if count is None else min(count, num_candles)
+
+        for start in range(0, total_candles, chunk_size):
+            end = min(start + chunk_size, total_candles)
+
+            columns = {}
+            for column_index, field in enumerate(CANDLE_FIELDS):
+                f.seek(HEADER_SIZE + (column_index * num_candles + start) * COLUMN_ITEM_SIZE)
+                columns[field] = np.fromfile(f, dtype=np.dtype(CANDLE_DTYPES[field]).newbyteorder('<'),
+                                             count=end - start)
+
+            yield CandleStore(columns, instrument, granularity, candle_format)
+
+
+def convert_json_file(json_file, candle_file, instrument, granularity):
+    """
+    Converts an exported {'candles': [...]} JSON dataset into a binary candle file
+    :return: number of converted candles
+    """
+    candle_store = load_json_candle_store(json_file, instrument=instrument, granularity=granularity)
+    write_candle_file(candle_file, candle_store)
+
+    return len(candle_store)
@@ -0,0 +1,109 @@
+import os
+import tempfile
+
+from trading.candles.binary import load_candle_file, write_candle_file, CANDLE_FILE_EXTENSION
+from trading.candles.download import download_history, download_latest, get_current_time, MAX_CANDLES_PER_REQUEST
+from trading.candles.store import CandleStore
+
+CANDLE_CACHE_ENVIRONMENT_KEY = 'TRADING_CANDLE_CACHE'
+
+
+class CandleCache(object):
+    """
+    On-disk broker history cache, one binary candle file per instrument and granularity
+    Requests are served from the cached range, only the missing head or tail is downloaded from the broker
+    """
+
+    def __init__(self, cache_dir, page_size=MAX_CANDLES_PER_REQUEST):
+        """
+        :param page_size: most candles per broker request
+        """
+        self.cache_dir = cache_dir
+        self.page_size = page_size
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def get_cache_file(self, instrument, granularity):
+        file_name = '{instrument}_{granularity}{extension}'\
+            .format(instrument=instrument, granularity=granularity, extension=CANDLE_FILE_EXTENSION)
+        return os.path.join(self.cache_dir, file_name)
+
+    def load(self, instrument, granularity):
+        cache_file = self.get_cache_file(instrument, granularity)
+
+        if not os.path.exists(cache_file):
+            return None
+
+        return load_candle_file(cache_file)
+
+    def save(self, candle_store):
+        """
+        Written to a uniquely named temporary file and renamed, readers holding a mapping of the old file
+        are unaffected and concurrent writers never share a temporary file
+        """
+        cache_file = self.get_cache_file(candle_store.instrument, candle_store.granularity)
+        handle, temporary_file = tempfile.mkstemp(suffix=CANDLE_FILE_EXTENSION, dir=self.cache_dir)
+        os.close(handle)
+
+        try:
+            write_candle_file(temporary_file, candle_store)
+            os.replace(temporary_file, cache_file)
+        except Exception:
+            os.remove(temporary_file)
+            raise
+
+    def get_history(self, api, instrument, granularity, count, end=None):
+        """
+        Latest count candles up to end, first candle is earliest
+        The tail is refreshed from the last cached candle, which may have been incomplete when cached,
+        and the head is downloaded when the cache holds fewer than count candles up to end
+        The cache is only rewritten when the downloads changed it and always holds one contiguous range
+        :param api: broker api exposing get_history, e.g. oandapy.API
+        :param end: inclusive epoch nanoseconds, defaults to now
+        :return: CandleStore
+        """
+        if end is None:
+            end = get_current_time()
+
+        cached_store = self.load(instrument, granularity)
+
+        if cached_store is None or not len(cached_store):
+            candle_store = download_latest(api, instrument, granularity, count, end, self.page_size)
+            self.save(candle_store)
+        else:
+            candle_stores = [cached_store]
+
+            if end >= cached_store.end_time:
+                candle_stores.append(download_history(api, instrument, granularity, cached_store.end_time, end,
+                                                      self.page_size))
+
+            candle_store = CandleStore.merge(candle_stores, instrument, granularity)
+            num_candles = candle_store.search_time(end, side='right')
+
+            if num_candles < count:
+                head_end = min(end, cached_store.start_time - 1)
+                candle_stores.insert(0, download_latest(api, instrument, granularity, count - num_candles,
+                                                        head_end, self.page_size))
+
+                # Candles between a request ending before the cached range and the cached range
+                if head_end < cached_store.start_time - 1:
+                    candle_stores.insert(1, download_history(api, instrument, granularity, head_end + 1,
+                                                             cached_store.start_time - 1, self.page_size))
+
+                candle_store = CandleStore.merge(candle_stores, instrument, granularity)
+
+            if candle_store.digest() != cached_store.digest():
+                self.save(candle_store)
+
+        end_index = candle_store.search_time(end, side='right')
+        return candle_store.slice(max(end_index - count, 0), end_index)
+
+
+def get_default_candle_cache():
+    cache_dir = os.environ.get(CANDLE_CACHE_ENVIRONMENT_KEY)
+
+    if cache_dir is None:
+        return None
+
+    return CandleCache(cache_dir)
@@ -0,0 +1,69 @@
+from trading.candles.exceptions import CandleLookbackException
+from trading.candles.store import CandleStore
+
+
+class ChunkedCandleStore(object):
+    """
+    Forward-only view over a candle history larger than memory
+    Holds a single block of candles plus the lookback candles carried over from the previous block,
+    indexes are positions in the full history
+    First candle is earliest
+    """
+
+    def __init__(self, candle_chunks, lookback=0, instrument=None, granularity=None):
+        """
+        :param candle_chunks: iterable of CandleStore blocks in time order, e.g. iter_candle_file_chunks
+        :param lookback: number of candles before the newest requested candle that stay addressable
+        """
+        self.candle_chunks = iter(candle_chunks)
+        self.lookback = lookback
+        self.instrument = instrument
+        self.granularity = granularity
+
+        self.offset = 0
+        self.store = CandleStore.concatenate([], instrument, granularity)
+        self.exhausted = False
+
+    def __repr__(self):
+        representation = 'ChunkedCandleStore Instrument {instrument} Granularity {granularity} Offset {offset} ' \
+                         'Candles {size}'.format(instrument=self.instrument, granularity=self.granularity,
+                                                 offset=self.offset, size=len(self.store))
+        return representation
+
+    def _next_chunk(self):
+        try:
+            candle_chunk = next(self.candle_chunks)
+        except StopIteration:
+            self.exhausted = True
+            return
+
+        num_kept = min(self.lookback, len(self.store))
+        self.offset += len(self.store) - num_kept
+
+        kept_store = self.store.slice(len(self.store) - num_kept)
+        self.store = CandleStore.concatenate([kept_store, candle_chunk], self.instrument, self.granularity)
+
+    def _load(self, end):
+        while self.offset + len(self.store) < end and not self.exhausted:
+            self._next_chunk()
+
+    def _to_block_index(self, index):
+        if index < self.offset:
+            raise CandleLookbackException
+
+        return index - self.offset
+
+    def window(self, start, end):
+        """
+        Window over the candles between start and end, clamped to the end of the history
+        """
+        self._load(end)
+        return self.store.window(self._to_block_index(start), end - self.offset)
+
+    def candle(self, index):
+        self._load(index + 1)
+        return self.store.candle(self._to_block_index(index))
+
+    @property
+    def nbytes(self):
+        return self.store.nbytes
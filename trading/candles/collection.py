@@ -0,0 +1,183 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+from trading.candles.timestamps import parse_candle_times
+
+CANDLE_INDEX_NAME = 'instrument_granularity_time'
+CANDLE_INDEX = [('instrument', ASCENDING), ('granularity', ASCENDING), ('time', ASCENDING)]
+
+
+def ensure_candle_indexes(db):
+    """
+    Candles are keyed by (instrument, granularity, time), time is epoch nanoseconds
+    """
+    db.candles.create_index(CANDLE_INDEX, name=CANDLE_INDEX_NAME, unique=True)
+
+
+def make_candle_key(instrument, granularity, candle_time):
+    return {
+        'instrument': instrument,
+        'granularity': granularity,
+        'time': candle_time
+    }
+
+
+def make_candle_documents(candles, instrument, granularity):
+    """
+    Converts broker or chart candles into candle collection documents
+    All original candle fields are kept, the broker time is replaced by its epoch nanoseconds
+    """
+    candle_times = parse_candle_times(candles)
+    documents = []
+
+    for candle, candle_time in zip(candles, candle_times):
+        document = dict(candle)
+        document.pop('_id', None)
+        document.pop('id', None)
+        document.update(make_candle_key(instrument, granularity, int(candle_time)))
+        documents.append(document)
+
+    return documents
+
+
+def make_time_range_query(instrument, granularity, start=None, end=None):
+    query = {
+        'instrument': instrument,
+        'granularity': granularity
+    }
+
+    time_range = {}
+    if start is not None:
+        time_range['$gte'] = start
+    if end is not None:
+        time_range['$lte'] = end
+
+    if time_range:
+        query['time'] = time_range
+
+    return query
+
+
+def find_candles(db, instrument, granularity, start=None, end=None, query=None, projection=None):
+    """
+    Time range read served by the compound candle index, start and end are inclusive epoch nanoseconds
+    :return: cursor of candle documents, first candle is earliest
+    """
+    candle_query = make_time_range_query(instrument, granularity, start, end)
+    if query:
+        candle_query.update(query)
+
+    return db.candles.find(candle_query, projection).sort('time', ASCENDING)
+
+
+def find_candle_range_bounds(db, instrument, granularity, start=None, end=None):
+    """
+    First and last candle documents of a time range, each found with a single index seek
+    """
+    query = make_time_range_query(instrument, granularity, start, end)
+
+    first_candle = db.candles.find_one(query, sort=[('time', ASCENDING)])
+    last_candle = db.candles.find_one(query, sort=[('time', DESCENDING)])
+
+    return first_candle, last_candle
+
+
+def make_upsert_operations(documents):
+    operations = []
+
+    for document in documents:
+        key = make_candle_key(document['instrument'], document['granularity'], document['time'])
+        operations.append(UpdateOne(key, {'$set': document}, upsert=True))
+
+    return operations
+
+
+def upsert_candle_documents(db, documents):
+    """
+    Unordered bulk upsert on the candle key, re-writing the same candles is idempotent
+    """
+    if documents:
+        db.candles.bulk_write(make_upsert_operations(documents), ordered=False)
+
+
+def ingest_candle_batches(db, candle_batches, instrument, granularity, num_workers=1, logger=None):
+    """
+    Bulk writes batches of broker candles into the candle collection
+    Up to num_workers batches are written concurrently, with at most twice that many batches held in memory
+    :param candle_batches: iterable of candle lists, e.g. iter_json_candle_batches
+    :return: dictionary with the number of candles, their time range and the candles per second
+    """
+    ensure_candle_indexes(db)
+
+    start = time.time()
+    num_candles = 0
+    candle_times = []
+    pending_writes = set()
+
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        for candles in candle_batches:
+            documents = make_candle_documents(candles, instrument, granularity)
+            pending_writes.add(executor.submit(upsert_candle_documents, db, documents))
+
+            batch_times = [document['time'] for document in documents]
+            candle_times = [min(candle_times + batch_times), max(candle_times + batch_times)]
+            num_candles += len(documents)
+
+            if len(pending_writes) >= 2 * num_workers:
+                completed_writes, pending_writes = wait(pending_writes, return_when=FIRST_COMPLETED)
+                for completed_write in completed_writes:
+                    completed_write.result()
+
+            if logger is not None:
+                logger.info('Ingested {num_candles} candles at {rate:.0f} candles/sec'
+                            .format(num_candles=num_candles, rate=num_candles / (time.time() - start)))
+
+        for pending_write in pending_writes:
+            pending_write.result()
+    finally:
+        executor.shutdown(wait=True)
+
+    elapsed = time.time() - start
+
+    return {
+        'num_candles': num_candles,
+        'start_time': candle_times[0] if candle_times else None,
+        'end_time': candle_times[1] if candle_times else None,
+        'candles_per_second': num_candles / elapsed if elapsed else 0.0
+    }
+
+
+def migrate_chart_documents(db):
+    """
+    Moves the candles embedded in chart documents into the candle collection
+    Charts keep their metadata plus the time range and size of their candles
+    Re-running the migration is safe, candles are upserted on their time key
+    :return: number of migrated candles
+    """
+    ensure_candle_indexes(db)
+
+    num_migrated = 0
+    chart_ids = [chart['_id'] for chart in db.candle_data.find({'candles': {'$exists': True}}, {'_id': True})]
+
+    for chart_id in chart_ids:
+        chart = db.candle_data.find_one({'_id': chart_id})
+        candles = chart['candles']
+
+        if candles:
+            documents = make_candle_documents(candles, chart['instrument'], chart['granularity'])
+            upsert_candle_documents(db, documents)
+
+            candle_times = [document['time'] for document in documents]
+            chart_range = {'start_time': min(candle_times), 'end_time': max(candle_times)}
+        else:
+            chart_range = {'start_time': None, 'end_time': None}
+
+        chart_range['num_candles'] = len(candles)
+        db.candle_data.update_one({'_id': chart_id}, {'$set': chart_range, '$unset': {'candles': ''}})
+
+        num_migrated += len(candles)
+
+    return num_migrated
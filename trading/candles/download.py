@@ -0,0 +1,186 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from trading.candles.store import CandleStore
+from trading.candles.timestamps import format_candle_time, parse_candle_times
+from trading.constants.granularity import GRANULARITY_SECONDS
+
+MAX_CANDLES_PER_REQUEST = 5000
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+NANOSECONDS_PER_SECOND = 10 ** 9
+
+# Markets close on weekends, a time range holds fewer candles than its length suggests
+SPARSE_HISTORY_FACTOR = 1.5
+EMPTY_HISTORY_LIMIT = 30 * 86400 * NANOSECONDS_PER_SECOND
+
+
+def get_current_time():
+    return int(time.time() * NANOSECONDS_PER_SECOND)
+
+
+def split_time_range(start, end, granularity, page_size=MAX_CANDLES_PER_REQUEST):
+    """
+    Splits an inclusive epoch nanosecond range into inclusive pages of at most page_size candles
+    :return: list of (page_start, page_end) tuples, first page is earliest
+    """
+    period = GRANULARITY_SECONDS[granularity] * NANOSECONDS_PER_SECOND
+    page_length = max(page_size - 1, 1) * period
+
+    pages = []
+    page_start = start
+    while page_start <= end:
+        page_end = min(page_start + page_length, end)
+        pages.append((page_start, page_end))
+        page_start = page_end + 1
+
+    return pages
+
+
+def fetch_history_candles(api, instrument, granularity, page_start, page_end):
+    """
+    :return: broker candle dictionaries of a single page, unchanged
+    """
+    history = api.get_history(instrument=instrument, granularity=granularity, start=format_candle_time(page_start),
+                              end=format_candle_time(page_end), includeFirst='true')
+    return history['candles']
+
+
+def fetch_history_page(api, instrument, granularity, page_start, page_end):
+    candles = fetch_history_candles(api, instrument, granularity, page_start, page_end)
+    return CandleStore.from_candles(candles, instrument, granularity)
+
+
+def merge_candles(candle_pages):
+    """
+    Time ordered union of lists of broker candles without duplicates, later pages win on equal candle times
+    :return: list of candles, first candle is earliest
+    """
+    candles = [candle for candle_page in candle_pages for candle in candle_page]
+
+    if not candles:
+        return []
+
+    times = parse_candle_times(candles)
+    order = np.argsort(times, kind='mergesort')
+    sorted_times = times[order]
+    is_last = np.concatenate((sorted_times[1:] != sorted_times[:-1], [True]))
+
+    return [candles[index] for index in order[is_last]]
+
+
+def _fetch_pages(fetch_page, api, instrument, granularity, start, end, page_size, max_workers):
+    """
+    Fetches every page of a time range concurrently with a bounded worker pool
+    :return: page results in time order
+    """
+    pages = split_time_range(start, end, granularity, page_size)
+
+    def fetch(page):
+        return fetch_page(api, instrument, granularity, page[0], page[1])
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        return list(executor.map(fetch, pages))
+    finally:
+        executor.shutdown(wait=True)
+
+
+def download_history(api, instrument, granularity, start, end, page_size=MAX_CANDLES_PER_REQUEST,
+                     max_workers=DEFAULT_DOWNLOAD_WORKERS):
+    """
+    Downloads a time range larger than the broker per request candle cap
+    Pages are fetched concurrently by a bounded worker pool and stitched in time order without duplicates
+    :param api: broker api exposing get_history, e.g. oandapy.API
+    :param start: inclusive epoch nanoseconds
+    :param end: inclusive epoch nanoseconds
+    :return: CandleStore, first candle is earliest
+    """
+    page_stores = _fetch_pages(fetch_history_page, api, instrument, granularity, start, end, page_size, max_workers)
+    return CandleStore.merge(page_stores, instrument, granularity)
+
+
+def download_history_candles(api, instrument, granularity, start, end, page_size=MAX_CANDLES_PER_REQUEST,
+                             max_workers=DEFAULT_DOWNLOAD_WORKERS):
+    """
+    download_history keeping the broker candle dictionaries, e.g. bid prices and completeness, unchanged
+    :return: list of candles, first candle is earliest
+    """
+    return merge_candles(_fetch_pages(fetch_history_candles, api, instrument, granularity, start, end, page_size,
+                                      max_workers))
+
+
+def _download_latest(download_range, merge, candles, granularity, count, end):
+    """
+    Widens the downloaded time range backwards from end until count candles are found or the broker
+    has no older history
+    :param download_range: function of an inclusive epoch nanosecond range returning its candles
+    :param merge: function joining older and newer candles
+    :param candles: empty candles the downloads are merged into
+    """
+    if end is None:
+        end = get_current_time()
+
+    period = GRANULARITY_SECONDS[granularity] * NANOSECONDS_PER_SECOND
+
+    range_end = end
+    empty_length = 0
+    sparse_factor = SPARSE_HISTORY_FACTOR
+
+    while len(candles) < count and empty_length < EMPTY_HISTORY_LIMIT:
+        range_length = int((count - len(candles)) * period * sparse_factor)
+        range_start = range_end - range_length
+
+        range_candles = download_range(range_start, range_end)
+
+        if len(range_candles):
+            candles = merge(range_candles, candles)
+            empty_length = 0
+        else:
+            empty_length += range_length
+            sparse_factor *= 2
+
+        range_end = range_start - 1
+
+    return candles
+
+
+def download_latest(api, instrument, granularity, count, end=None, page_size=MAX_CANDLES_PER_REQUEST,
+                    max_workers=DEFAULT_DOWNLOAD_WORKERS):
+    """
+    Downloads the latest count candles up to end, widening the time range until enough candles are found
+    or the broker has no older history
+    :param end: inclusive epoch nanoseconds, defaults to now
+    :return: CandleStore of at most count candles, first candle is earliest
+    """
+    def download_range(range_start, range_end):
+        return download_history(api, instrument, granularity, range_start, range_end, page_size, max_workers)
+
+    def merge(older_store, newer_store):
+        return CandleStore.merge([older_store, newer_store], instrument, granularity)
+
+    candle_store = _download_latest(download_range, merge, CandleStore.concatenate([], instrument, granularity),
+                                    granularity, count, end)
+
+    return candle_store.slice(max(len(candle_store) - count, 0))
+
+
+def download_latest_candles(api, instrument, granularity, count, end=None, page_size=MAX_CANDLES_PER_REQUEST,
+                            max_workers=DEFAULT_DOWNLOAD_WORKERS):
+    """
+    download_latest keeping the broker candle dictionaries unchanged, the same candles as a single
+    get_history response
+    :return: list of at most count candles, first candle is earliest
+    """
+    def download_range(range_start, range_end):
+        return download_history_candles(api, instrument, granularity, range_start, range_end, page_size,
+                                        max_workers)
+
+    def merge(older_candles, newer_candles):
+        return merge_candles([older_candles, newer_candles])
+
+    candles = _download_latest(download_range, merge, [], granularity, count, end)
+
+    return candles[max(len(candles) - count, 0):]
@@ -0,0 +1,28 @@
+
+
+class CandleException(Exception):
+    """
+    Base class for candle storage errors.
+    """
+    pass
+
+
+class CandleFormatException(CandleException):
+    """
+    Candle Format Error.
+    """
+    message = 'Candle Format Error.'
+
+
+class CandleResampleException(CandleException):
+    """
+    Target granularity is not a multiple of the source granularity.
+    """
+    message = 'Candle Resample Error.'
+
+
+class CandleLookbackException(CandleException):
+    """
+    Requested candles are older than the lookback kept in memory.
+    """
+    message = 'Candle Lookback Error.'
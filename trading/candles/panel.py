@@ -0,0 +1,93 @@
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.store import CANDLE_FIELDS, CANDLE_DTYPES
+from trading.constants.price_data import CANDLE_TIME
+
+
+class CandlePanel(object):
+    """
+    Candles of several instruments aligned on a shared clock
+    Every candle field is a time by instrument 2-D array, rows are candle times and columns instruments,
+    so batch indicators compute every instrument in one vectorized call
+    First candle is earliest
+    """
+
+    def __init__(self, times, columns, instruments, granularity=None):
+        times = np.asarray(times, dtype=np.int64)
+        shape = (len(times), len(instruments))
+
+        if any(np.shape(columns[field]) != shape for field in CANDLE_FIELDS if field != CANDLE_TIME):
+            raise CandleFormatException
+
+        self.times = times
+        self.columns = {}
+        for field in CANDLE_FIELDS:
+            if field == CANDLE_TIME:
+                continue
+
+            column = np.asarray(columns[field], dtype=CANDLE_DTYPES[field])
+            column.flags.writeable = False
+            self.columns[field] = column
+
+        self.instruments = list(instruments)
+        self.granularity = granularity
+
+    def __repr__(self):
+        representation = 'CandlePanel Instruments {instruments} Granularity {granularity} Candles {size}'\
+            .format(instruments=self.instruments, granularity=self.granularity, size=len(self))
+        return representation
+
+    def __len__(self):
+        return len(self.times)
+
+    @classmethod
+    def from_candle_stores(cls, candle_stores, instruments=None, granularity=None):
+        """
+        Aligns stores on the candle times present in every store, candles missing from any instrument are dropped
+        :param candle_stores: CandleStore per instrument, all of one granularity
+        :param instruments: column names, the store instruments by default
+        :return: CandlePanel, one column per store in the given order
+        """
+        if instruments is None:
+            instruments = [candle_store.instrument for candle_store in candle_stores]
+
+        if granularity is None and candle_stores:
+            granularity = candle_stores[0].granularity
+
+        if len(instruments) != len(candle_stores):
+            raise CandleFormatException
+
+        times = np.empty(0, dtype=np.int64)
+        if candle_stores:
+            times = candle_stores[0].column(CANDLE_TIME)
+            for candle_store in candle_stores[1:]:
+                times = np.intersect1d(times, candle_store.column(CANDLE_TIME), assume_unique=True)
+
+        indexes = [np.searchsorted(candle_store.column(CANDLE_TIME), times) for candle_store in candle_stores]
+
+        columns = {}
+        for field in CANDLE_FIELDS:
+            if field == CANDLE_TIME:
+                continue
+
+            column = np.empty((len(times), len(candle_stores)), dtype=CANDLE_DTYPES[field])
+            for instrument_index, candle_store in enumerate(candle_stores):
+                column[:, instrument_index] = candle_store.column(field)[indexes[instrument_index]]
+            columns[field] = column
+
+        return cls(times, columns, instruments, granularity)
+
+    def column(self, field, start=None, end=None):
+        """
+        Zero-copy read-only time by instrument slice of a single candle field
+        """
+        if field == CANDLE_TIME:
+            return self.times[start:end]
+        return self.columns[field][start:end]
+
+    def instrument_column(self, field, instrument):
+        """
+        Single instrument series of a candle field
+        """
+        return self.columns[field][:, self.instruments.index(instrument)]
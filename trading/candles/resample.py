@@ -0,0 +1,113 @@
+import datetime
+
+import numpy as np
+import pytz
+
+from trading.candles.exceptions import CandleResampleException
+from trading.candles.store import CandleStore
+from trading.constants.granularity import GRANULARITY_SECONDS, GRANULARITY_FOUR_HOUR, GRANULARITY_DAY
+from trading.constants.price_data import CANDLE_TIME, PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, \
+    PRICE_ASK_CLOSE, VOLUME
+
+NANOSECONDS_PER_SECOND = 10 ** 9
+SECONDS_PER_HOUR = 3600
+
+# Oanda four hour and daily candles start at the forex trading day boundary, 17:00 New York time
+BROKER_TIMEZONE = pytz.timezone('America/New_York')
+BROKER_ALIGNMENT_HOUR = 17
+BROKER_ALIGNED_GRANULARITIES = (GRANULARITY_FOUR_HOUR, GRANULARITY_DAY)
+
+
+def get_broker_alignment(times):
+    """
+    Offsets of 17:00 New York time from UTC midnight at each time, daylight saving changes on the hour
+    so the offset is looked up once per distinct hour
+    :param times: epoch nanoseconds
+    :return: nanosecond offsets
+    """
+    hours, inverse = np.unique(times // (SECONDS_PER_HOUR * NANOSECONDS_PER_SECOND), return_inverse=True)
+    utc_offsets = [datetime.datetime.fromtimestamp(int(hour) * SECONDS_PER_HOUR, BROKER_TIMEZONE).utcoffset()
+                   for hour in hours]
+
+    offsets = np.array([BROKER_ALIGNMENT_HOUR * SECONDS_PER_HOUR - int(utc_offset.total_seconds())
+                        for utc_offset in utc_offsets], np.int64) * NANOSECONDS_PER_SECOND
+    return offsets[inverse]
+
+
+def resample_candles(candle_store, granularity, alignment=None):
+    """
+    Builds OHLCV candles of a coarser granularity with vectorized group reductions over the time column
+    Candles are grouped into periods starting alignment seconds after UTC midnight, the last period may be
+    incomplete. Four hour and daily periods start at 17:00 New York time by default like the broker candles,
+    shorter periods at UTC midnight
+    :param candle_store: CandleStore, first candle is earliest
+    :param granularity: target granularity, a multiple of the store granularity
+    :param alignment: seconds from UTC midnight to a period start, None for the broker alignment
+    :return: CandleStore of the target granularity
+    """
+    try:
+        source_seconds = GRANULARITY_SECONDS[candle_store.granularity]
+        target_seconds = GRANULARITY_SECONDS[granularity]
+    except KeyError:
+        raise CandleResampleException
+
+    if target_seconds < source_seconds or target_seconds % source_seconds:
+        raise CandleResampleException
+
+    times = candle_store.column(CANDLE_TIME)
+
+    if not len(times):
+        return candle_store.slice(0, 0)
+
+    if alignment is not None:
+        offsets = alignment * NANOSECONDS_PER_SECOND
+    elif granularity in BROKER_ALIGNED_GRANULARITIES:
+        offsets = get_broker_alignment(times)
+    else:
+        offsets = 0
+
+    period = target_seconds * NANOSECONDS_PER_SECOND
+    periods = (times - offsets) // period
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(periods)) + 1))
+    ends = np.concatenate((starts[1:], [len(periods)]))
+
+    columns = {
+        CANDLE_TIME: periods[starts] * period + (offsets[starts] if np.ndim(offsets) else offsets),
+        PRICE_ASK_OPEN: candle_store.column(PRICE_ASK_OPEN)[starts],
+        PRICE_ASK_HIGH: np.maximum.reduceat(candle_store.column(PRICE_ASK_HIGH), starts),
+        PRICE_ASK_LOW: np.minimum.reduceat(candle_store.column(PRICE_ASK_LOW), starts),
+        PRICE_ASK_CLOSE: candle_store.column(PRICE_ASK_CLOSE)[ends - 1],
+        VOLUME: np.add.reduceat(candle_store.column(VOLUME), starts)
+    }
+
+    return CandleStore(columns, candle_store.instrument, granularity, candle_store.candle_format)
+
+
+class CandleResampler(object):
+    """
+    Caches resampled series per (instrument, source granularity, target granularity, alignment)
+    A cached series is rebuilt when the content digest of its source store changes
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def resample(self, candle_store, granularity, alignment=None):
+        if granularity == candle_store.granularity:
+            return candle_store
+
+        key = (candle_store.instrument, candle_store.granularity, granularity, alignment)
+        digest = candle_store.digest()
+
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        resampled_store = resample_candles(candle_store, granularity, alignment)
+        self._cache[key] = (digest, resampled_store)
+
+        return resampled_store
+
+    def clear(self):
+        self._cache.clear()
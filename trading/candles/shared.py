@@ -0,0 +1,83 @@
+import os
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from trading.candles.binary import calc_candle_buffer_size, read_candle_buffer, write_candle_buffer
+
+# Segments published by this process stay registered with its resource tracker
+_published_names = set()
+
+
+def _attach_shared_memory(name):
+    """
+    Attaches without handing the segment to this process's resource tracker,
+    which would otherwise unlink it when the first worker exits
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        shared_memory = SharedMemory(name=name)
+
+        if os.name == 'posix' and name not in _published_names:
+            resource_tracker.unregister(shared_memory._name, 'shared_memory')
+
+        return shared_memory
+
+
+class SharedCandleDataset(object):
+    """
+    Publishes a candle store into named shared memory in the binary candle layout
+    Worker processes attach by name and map the columns without copying or parsing
+    The publishing process owns the segment and unlinks it on close
+    """
+
+    def __init__(self, candle_store, name=None):
+        buffer_size = calc_candle_buffer_size(len(candle_store))
+
+        self.shared_memory = SharedMemory(name=name, create=True, size=buffer_size)
+        write_candle_buffer(self.shared_memory.buf, candle_store)
+
+        self.name = self.shared_memory.name
+        _published_names.add(self.name)
+        self.num_candles = len(candle_store)
+
+    def __repr__(self):
+        representation = 'SharedCandleDataset Name {name} Candles {size}'.format(name=self.name, size=self.num_candles)
+        return representation
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+        _published_names.discard(self.name)
+
+
+class AttachedCandleDataset(object):
+    """
+    Read-only view of a published dataset, columns reference the shared segment directly
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.shared_memory = _attach_shared_memory(name)
+        self.candle_store = read_candle_buffer(self.shared_memory.buf)
+
+    def __repr__(self):
+        representation = 'AttachedCandleDataset Name {name} {store}'.format(name=self.name, store=self.candle_store)
+        return representation
+
+    def close(self):
+        """
+        Stores built from this dataset must be released first
+        """
+        self.candle_store = None
+        self.shared_memory.close()
+
+
+def attach_candle_dataset(name):
+    return AttachedCandleDataset(name)
@@ -0,0 +1,226 @@
+import hashlib
+
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.timestamps import CANDLE_FORMAT_DATA_FILE, CANDLE_FORMAT_OANDA, format_candle_time, \
+    format_data_file_time, get_candle_format, parse_candle_times, to_epoch_ns
+from trading.candles.window import CandleWindow
+from trading.constants.price_data import CANDLE_TIME, PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, \
+    PRICE_ASK_CLOSE, VOLUME
+
+PRICE_FIELDS = (PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE)
+CANDLE_FIELDS = (CANDLE_TIME,) + PRICE_FIELDS + (VOLUME,)
+
+CANDLE_DTYPES = {
+    CANDLE_TIME: np.int64,
+    PRICE_ASK_OPEN: np.float64,
+    PRICE_ASK_HIGH: np.float64,
+    PRICE_ASK_LOW: np.float64,
+    PRICE_ASK_CLOSE: np.float64,
+    VOLUME: np.int64
+}
+
+
+class CandleStore(object):
+    """
+    Columnar candle storage, one contiguous array per candle field
+    Candles are ordered by their int64 epoch nanosecond time, which serves as a binary search index
+    Materialized candles keep the shape of the candles the store was built from
+    First candle is earliest
+    """
+
+    def __init__(self, columns, instrument=None, granularity=None, candle_format=CANDLE_FORMAT_OANDA):
+        if set(columns) != set(CANDLE_FIELDS):
+            raise CandleFormatException
+
+        sizes = set(len(column) for column in columns.values())
+        if len(sizes) != 1:
+            raise CandleFormatException
+
+        self.columns = {}
+        for field in CANDLE_FIELDS:
+            column = np.asarray(columns[field], dtype=CANDLE_DTYPES[field])
+            column.flags.writeable = False
+            self.columns[field] = column
+
+        self.instrument = instrument
+        self.granularity = granularity
+        self.candle_format = candle_format
+        self._digest = None
+
+    def __repr__(self):
+        representation = 'CandleStore Instrument {instrument} Granularity {granularity} Candles {size}'\
+            .format(instrument=self.instrument, granularity=self.granularity, size=len(self))
+        return representation
+
+    def __len__(self):
+        return len(self.columns[CANDLE_TIME])
+
+    @classmethod
+    def from_candles(cls, candles, instrument=None, granularity=None, sort=True):
+        """
+        Builds a store from a list of broker candle dictionaries
+        Times are parsed once, candles out of time order are sorted once here
+        :param candles: list of candles
+        :param sort: False keeps the candles in list order, for callers checking the order themselves
+        :return: CandleStore
+        """
+        num_candles = len(candles)
+
+        columns = {CANDLE_TIME: parse_candle_times(candles)}
+
+        try:
+            for field in PRICE_FIELDS:
+                columns[field] = np.fromiter((candle[field] for candle in candles), dtype=np.float64,
+                                             count=num_candles)
+
+            columns[VOLUME] = np.fromiter((int(candle.get(VOLUME, 0)) for candle in candles), dtype=np.int64,
+                                          count=num_candles)
+        except (KeyError, ValueError):
+            raise CandleFormatException
+
+        times = columns[CANDLE_TIME]
+        if sort and num_candles and np.any(times[1:] < times[:-1]):
+            order = np.argsort(times, kind='mergesort')
+            columns = dict((field, column[order]) for field, column in columns.items())
+
+        candle_format = get_candle_format(candles[0]) if num_candles else CANDLE_FORMAT_OANDA
+        return cls(columns, instrument, granularity, candle_format)
+
+    @classmethod
+    def concatenate(cls, candle_stores, instrument=None, granularity=None):
+        """
+        Joins stores in order into a single contiguous store, in the candle format of the first non empty store
+        """
+        columns = {}
+        for field in CANDLE_FIELDS:
+            field_columns = [candle_store.column(field) for candle_store in candle_stores]
+            columns[field] = np.concatenate(field_columns) if field_columns else np.empty(0, CANDLE_DTYPES[field])
+
+        candle_formats = [candle_store.candle_format for candle_store in candle_stores if len(candle_store)]
+        candle_format = candle_formats[0] if candle_formats else CANDLE_FORMAT_OANDA
+        return cls(columns, instrument, granularity, candle_format)
+
+    @classmethod
+    def merge(cls, candle_stores, instrument=None, granularity=None):
+        """
+        Time ordered union of stores without duplicate candles, later stores win on equal candle times
+        """
+        combined_store = cls.concatenate(candle_stores, instrument, granularity)
+        times = combined_store.column(CANDLE_TIME)
+
+        if not len(times):
+            return combined_store
+
+        order = np.argsort(times, kind='mergesort')
+        sorted_times = times[order]
+        is_last = np.concatenate((sorted_times[1:] != sorted_times[:-1], [True]))
+        indexes = order[is_last]
+
+        columns = dict((field, combined_store.column(field)[indexes]) for field in CANDLE_FIELDS)
+        return cls(columns, instrument, granularity, combined_store.candle_format)
+
+    def column(self, field, start=None, end=None):
+        """
+        Zero-copy read-only slice of a single candle field
+        """
+        return self.columns[field][start:end]
+
+    def digest(self, start=None, end=None):
+        """
+        Content digest of the candles between start and end, equal for equal candles in any store
+        The whole store digest is computed once, columns are read-only
+        :return: hex string
+        """
+        if start is None and end is None and self._digest is not None:
+            return self._digest
+
+        digest = hashlib.sha1()
+        for field in CANDLE_FIELDS:
+            digest.update(np.ascontiguousarray(self.column(field, start, end)).data)
+
+        if start is None and end is None:
+            self._digest = digest.hexdigest()
+            return self._digest
+
+        return digest.hexdigest()
+
+    def slice(self, start=None, end=None):
+        """
+        Zero-copy store over a contiguous range of candles
+        """
+        columns = dict((field, self.column(field, start, end)) for field in CANDLE_FIELDS)
+        return CandleStore(columns, self.instrument, self.granularity, self.candle_format)
+
+    def search_time(self, candle_time, side='left'):
+        """
+        O(log n) position of a time in the candle index, as numpy.searchsorted
+        :param candle_time: epoch nanoseconds, naive UTC datetime or broker time string
+        """
+        return int(np.searchsorted(self.columns[CANDLE_TIME], to_epoch_ns(candle_time), side=side))
+
+    def find_index(self, candle_time):
+        """
+        Index of the candle at exactly candle_time, None if there is no such candle
+        """
+        index = self.search_time(candle_time)
+
+        if index < len(self) and self.columns[CANDLE_TIME][index] == to_epoch_ns(candle_time):
+            return index
+        return None
+
+    def time_range(self, start=None, end=None):
+        """
+        Window of the candles between the inclusive start and end times
+        """
+        start_index = 0 if start is None else self.search_time(start)
+        end_index = len(self) if end is None else self.search_time(end, side='right')
+
+        return self.window(start_index, end_index)
+
+    @property
+    def start_time(self):
+        return int(self.columns[CANDLE_TIME][0]) if len(self) else None
+
+    @property
+    def end_time(self):
+        return int(self.columns[CANDLE_TIME][-1]) if len(self) else None
+
+    def window(self, start, end):
+        """
+        Lightweight read-only view referencing the store by offset, clamped like list slicing
+        """
+        start, end, _ = slice(start, end).indices(len(self))
+        return CandleWindow(self, start, max(start, end))
+
+    def candle(self, index):
+        """
+        Materializes a single candle in the broker dictionary format of the source candles
+        Data file candles get back their date and time fields and string volume
+        """
+        columns = self.columns
+
+        candle = {
+            PRICE_ASK_OPEN: float(columns[PRICE_ASK_OPEN][index]),
+            PRICE_ASK_HIGH: float(columns[PRICE_ASK_HIGH][index]),
+            PRICE_ASK_LOW: float(columns[PRICE_ASK_LOW][index]),
+            PRICE_ASK_CLOSE: float(columns[PRICE_ASK_CLOSE][index])
+        }
+
+        if self.candle_format == CANDLE_FORMAT_DATA_FILE:
+            candle['date'], candle[CANDLE_TIME] = format_data_file_time(columns[CANDLE_TIME][index])
+            candle[VOLUME] = str(columns[VOLUME][index])
+        else:
+            candle[CANDLE_TIME] = format_candle_time(columns[CANDLE_TIME][index])
+            candle[VOLUME] = int(columns[VOLUME][index])
+
+        return candle
+
+    def candles(self, start=None, end=None):
+        indexes = range(len(self))[start:end]
+        return [self.candle(index) for index in indexes]
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
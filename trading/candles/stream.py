@@ -0,0 +1,221 @@
+import json
+
+from trading.candles.exceptions import CandleFormatException
+from trading.candles.store import CandleStore
+from trading.constants.price_data import CANDLE_TIME
+from trading.util.log import Logger
+
+READ_SIZE = 64 * 1024
+DEFAULT_BATCH_SIZE = 10000
+
+CANDLES_KEY = 'candles'
+WHITESPACE = ' \t\n\r'
+
+
+class JsonStreamReader(object):
+    """
+    Incrementally decodes values from a JSON document, holding at most one value and one read in memory
+    """
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, f, read_size=READ_SIZE):
+        self.f = f
+        self.read_size = read_size
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+    def _fill(self):
+        data = self.f.read(self.read_size)
+
+        if not data:
+            self.exhausted = True
+            return False
+
+        self.buffer = self.buffer[self.position:] + data
+        self.position = 0
+        return True
+
+    def next_char(self):
+        """
+        Consumes and returns the next non whitespace character, '' at the end of the document
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.buffer):
+                char = self.buffer[self.position]
+                self.position += 1
+                return char
+
+            if not self._fill():
+                return ''
+
+    def peek_char(self):
+        char = self.next_char()
+        if char:
+            self.position -= 1
+        return char
+
+    def expect(self, expected_char):
+        if self.next_char() != expected_char:
+            raise CandleFormatException
+
+    def decode_value(self):
+        self.peek_char()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                if not self._fill():
+                    raise CandleFormatException
+                continue
+
+            # A value ending exactly at the buffer boundary may be a truncated number
+            if end == len(self.buffer) and not self.exhausted and self._fill():
+                continue
+
+            self.position = end
+            return value
+
+    def iter_array(self):
+        """
+        Yields the items of the array starting at the current position
+        """
+        self.expect('[')
+
+        if self.peek_char() == ']':
+            self.next_char()
+            return
+
+        while True:
+            yield self.decode_value()
+
+            separator = self.next_char()
+            if separator == ']':
+                return
+            elif separator != ',':
+                raise CandleFormatException
+
+
+def _iter_document_candles(reader):
+    first_char = reader.peek_char()
+
+    if first_char == '[':
+        for candle in reader.iter_array():
+            yield candle
+        return
+
+    reader.expect('{')
+
+    if reader.peek_char() == '}':
+        return
+
+    while True:
+        key = reader.decode_value()
+        reader.expect(':')
+
+        if key == CANDLES_KEY:
+            for candle in reader.iter_array():
+                yield candle
+        else:
+            reader.decode_value()
+
+        separator = reader.next_char()
+        if separator == '}':
+            return
+        elif separator != ',':
+            raise CandleFormatException
+
+
+def iter_json_candles(file_name, read_size=READ_SIZE):
+    """
+    Streams candles from a {'candles': [...]} document or a top level candle list
+    without materializing the whole list
+    :param file_name: path to JSON candle export
+    :return: generator of candle dictionaries, first candle is earliest
+    """
+    with open(file_name) as f:
+        reader = JsonStreamReader(f, read_size)
+
+        for candle in _iter_document_candles(reader):
+            yield candle
+
+
+def iter_json_candle_batches(file_name, batch_size=DEFAULT_BATCH_SIZE, read_size=READ_SIZE):
+    """
+    Streams lists of at most batch_size candles
+    """
+    batch = []
+
+    for candle in iter_json_candles(file_name, read_size):
+        batch.append(candle)
+
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def iter_json_candle_stores(file_name, chunk_size=DEFAULT_BATCH_SIZE, count=None, instrument=None,
+                            granularity=None):
+    """
+    Streams a JSON candle export as stores of at most chunk_size candles
+    :param count: maximum number of candles to read, all candles if None
+    :return: generator of CandleStore, first block is earliest
+    """
+    num_candles = 0
+
+    for batch in iter_json_candle_batches(file_name, chunk_size):
+        if count is not None:
+            batch = batch[:count - num_candles]
+
+        yield CandleStore.from_candles(batch, instrument, granularity)
+        num_candles += len(batch)
+
+        if count is not None and num_candles >= count:
+            return
+
+
+def load_json_candle_store(file_name, count=None, instrument=None, granularity=None,
+                           batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Builds a CandleStore from a JSON candle export, holding at most one batch of candle dictionaries
+    A time ordered export is read only until count candles are found. Once an out of order or duplicate
+    candle time shows up the whole export is read, sorted and duplicate candle times are dropped before
+    count candles are kept, the later candle in the file wins on equal times
+    :param count: number of earliest candles to load, all candles if None
+    :return: CandleStore, first candle is earliest
+    """
+    candle_stores = []
+    num_candles = 0
+    last_time = None
+    is_ordered = True
+
+    for batch in iter_json_candle_batches(file_name, batch_size):
+        candle_store = CandleStore.from_candles(batch, instrument, granularity, sort=False)
+        candle_stores.append(candle_store)
+        num_candles += len(candle_store)
+
+        if is_ordered:
+            times = candle_store.column(CANDLE_TIME)
+            is_ordered = not (times[1:] <= times[:-1]).any() and (last_time is None or times[0] > last_time)
+            last_time = times[-1]
+
+            if is_ordered and count is not None and num_candles >= count:
+                break
+
+    candle_store = CandleStore.concatenate(candle_stores, instrument, granularity)
+
+    if not is_ordered:
+        candle_store = CandleStore.merge([candle_store], instrument, granularity)
+
+        if len(candle_store) < num_candles:
+            Logger().info('Dropped duplicate candle times', {'file': file_name,
+                                                             'duplicates': num_candles - len(candle_store)})
+
+    return candle_store.slice(0, count)
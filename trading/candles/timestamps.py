@@ -0,0 +1,111 @@
+import datetime
+
+import numpy as np
+
+from trading.candles.exceptions import CandleFormatException
+from trading.constants.price_data import CANDLE_TIME
+
+CANDLE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+DATA_FILE_DATE_FORMAT = '%Y.%m.%d'
+DATA_FILE_TIME_FORMAT = '%H:%M'
+DATA_FILE_SECONDS_TIME_FORMAT = '%H:%M:%S'
+
+# Shape of the broker candle dictionaries a store was built from
+CANDLE_FORMAT_OANDA = 'oanda'
+CANDLE_FORMAT_DATA_FILE = 'data_file'
+NANOSECONDS_PER_MICROSECOND = 1000
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _to_iso_string(candle):
+    """
+    Normalizes the broker time of a candle into a numpy parseable ISO string
+    Handles Oanda RFC3339 times ('2016-06-24T19:20:00.000000Z'), exported
+    data files that split the date ('2001.01.02') and time ('04:17') fields
+    and chart candles with a date dictionary (year, month, day, hour, minute)
+    """
+    candle_date = candle.get('date')
+
+    if isinstance(candle_date, dict):
+        try:
+            return '{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}'\
+                .format(year=int(candle_date['year']), month=int(candle_date['month']), day=int(candle_date['day']),
+                        hour=int(candle_date['hour']), minute=int(candle_date['minute']))
+        except (KeyError, ValueError):
+            raise CandleFormatException
+
+    try:
+        candle_time = candle[CANDLE_TIME]
+    except KeyError:
+        raise CandleFormatException
+
+    if isinstance(candle_date, str):
+        return candle_date.replace('.', '-') + 'T' + candle_time
+
+    return candle_time.rstrip('Z')
+
+
+def parse_candle_times(candles):
+    """
+    Parses the broker times of a list of candles in a single vectorized pass
+    :param candles: list of candle dictionaries
+    :return: numpy int64 array of epoch nanoseconds
+    """
+    iso_times = [_to_iso_string(candle) for candle in candles]
+
+    try:
+        times = np.array(iso_times, dtype='datetime64[ns]')
+    except ValueError:
+        raise CandleFormatException
+
+    return times.astype(np.int64)
+
+
+def parse_candle_time(candle):
+    return int(parse_candle_times([candle])[0])
+
+
+def to_epoch_ns(value):
+    """
+    Converts an epoch nanosecond int, naive UTC datetime or broker time string into epoch nanoseconds
+    """
+    if isinstance(value, datetime.datetime):
+        delta = value - EPOCH
+        return (delta.days * 86400 + delta.seconds) * 10 ** 9 + delta.microseconds * NANOSECONDS_PER_MICROSECOND
+
+    if isinstance(value, str):
+        return parse_candle_time({CANDLE_TIME: value})
+
+    return int(value)
+
+
+def get_candle_format(candle):
+    """
+    Exported data files split the date ('2001.01.02') and time ('04:17') fields, every other candle is Oanda shaped
+    """
+    if isinstance(candle.get('date'), str):
+        return CANDLE_FORMAT_DATA_FILE
+    return CANDLE_FORMAT_OANDA
+
+
+def _to_datetime(epoch_ns):
+    return EPOCH + datetime.timedelta(microseconds=int(epoch_ns) // NANOSECONDS_PER_MICROSECOND)
+
+
+def format_candle_time(epoch_ns):
+    """
+    Formats epoch nanoseconds in the Oanda RFC3339 candle time format
+    """
+    return _to_datetime(epoch_ns).strftime(CANDLE_TIME_FORMAT)
+
+
+def format_data_file_time(epoch_ns):
+    """
+    Formats epoch nanoseconds as the date and time fields of an exported data file
+    :return: tuple of date and time strings
+    """
+    candle_time = _to_datetime(epoch_ns)
+    time_format = DATA_FILE_SECONDS_TIME_FORMAT if candle_time.second else DATA_FILE_TIME_FORMAT
+
+    return candle_time.strftime(DATA_FILE_DATE_FORMAT), candle_time.strftime(time_format)
@@ -0,0 +1,59 @@
+class CandleWindow(object):
+    """
+    Read-only view over a contiguous range of candles in a CandleStore
+    Behaves like the broker list of candle dictionaries, while column() gives
+    zero-copy array access to a single field
+    First candle is earliest
+    """
+    __slots__ = ('store', 'start', 'end')
+
+    def __init__(self, store, start, end):
+        self.store = store
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        representation = 'CandleWindow {store} Start {start} End {end}'\
+            .format(store=self.store, start=self.start, end=self.end)
+        return representation
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indexes = range(len(self))[index]
+
+            if indexes.step == 1:
+                return CandleWindow(self.store, self.start + indexes.start,
+                                    self.start + max(indexes.stop, indexes.start))
+
+            return [self.store.candle(self.start + i) for i in indexes]
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError
+
+        return self.store.candle(self.start + index)
+
+    def __iter__(self):
+        for index in range(self.start, self.end):
+            yield self.store.candle(index)
+
+    def column(self, field):
+        return self.store.column(field, self.start, self.end)
+
+    def digest(self):
+        if self.start == 0 and self.end == len(self.store):
+            return self.store.digest()
+        return self.store.digest(self.start, self.end)
+
+    @property
+    def instrument(self):
+        return self.store.instrument
+
+    @property
+    def granularity(self):
+        return self.store.granularity
@@ -1,3 +1,19 @@
 GRANULARITY_DAY = 'D'
 GRANULARITY_TEN_MINUTE = 'M10'
 GRANULARITY_HOUR = 'H1'
+GRANULARITY_MINUTE = 'M1'
+GRANULARITY_FIVE_MINUTE = 'M5'
+GRANULARITY_FIFTEEN_MINUTE = 'M15'
+GRANULARITY_THIRTY_MINUTE = 'M30'
+GRANULARITY_FOUR_HOUR = 'H4'
+
+GRANULARITY_SECONDS = {
+    GRANULARITY_MINUTE: 60,
+    GRANULARITY_FIVE_MINUTE: 300,
+    GRANULARITY_TEN_MINUTE: 600,
+    GRANULARITY_FIFTEEN_MINUTE: 900,
+    GRANULARITY_THIRTY_MINUTE: 1800,
+    GRANULARITY_HOUR: 3600,
+    GRANULARITY_FOUR_HOUR: 14400,
+    GRANULARITY_DAY: 86400
+}
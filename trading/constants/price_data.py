@@ -4,3 +4,4 @@ PRICE_ASK_OPEN = 'openAsk'
 PRICE_ASK_HIGH = 'highAsk'
 PRICE_ASK_LOW = 'lowAsk'
 VOLUME = 'volume'
+CANDLE_TIME = 'time'
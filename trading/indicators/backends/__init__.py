@@ -0,0 +1,41 @@
+import os
+
+from trading.indicators.backends.numpy_backend import NumpyBackend
+from trading.indicators.backends.talib_backend import TalibBackend, talib, talib_abstract
+from trading.indicators.exceptions import IndicatorBackendException
+
+BACKENDS = {
+    TalibBackend.name: TalibBackend,
+    NumpyBackend.name: NumpyBackend
+}
+
+_backends = {}
+
+
+def get_default_backend_name():
+    """
+    TRADING_INDICATOR_BACKEND if set, otherwise TA-Lib when it is installed and numpy when it is not
+    """
+    backend_name = os.environ.get('TRADING_INDICATOR_BACKEND')
+
+    if backend_name is None:
+        backend_name = TalibBackend.name if TalibBackend.is_available() else NumpyBackend.name
+
+    return backend_name
+
+
+def get_backend(backend_name=None):
+    """
+    :param backend_name: name in BACKENDS, the default backend if None
+    :return: IndicatorBackend, one instance per backend
+    """
+    if backend_name is None:
+        backend_name = get_default_backend_name()
+
+    if backend_name not in _backends:
+        if backend_name not in BACKENDS or not BACKENDS[backend_name].is_available():
+            raise IndicatorBackendException('Indicator backend {name} is not available'.format(name=backend_name))
+
+        _backends[backend_name] = BACKENDS[backend_name]()
+
+    return _backends[backend_name]
@@ -0,0 +1,52 @@
+from abc import abstractmethod, ABCMeta
+
+
+class IndicatorBackend(object):
+    """
+    Primitive indicator series shared by the indicator modules
+    Every function takes numpy 64-float arrays, first data point is earliest, and returns an array aligned
+    with its input that is NaN until the indicator is defined
+    """
+    __metaclass__ = ABCMeta
+
+    name = 'Base_Backend'
+
+    def __repr__(self):
+        return 'IndicatorBackend {name}'.format(name=self.name)
+
+    @classmethod
+    def is_available(cls):
+        return True
+
+    @abstractmethod
+    def sma(self, data, interval):
+        raise NotImplementedError
+
+    @abstractmethod
+    def ema(self, data, interval):
+        """
+        Exponential moving average seeded with the simple moving average of the first interval data points
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stddev(self, data, interval):
+        """
+        Population standard deviation of the last interval data points
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def true_range(self, high, low, close):
+        """
+        NaN at the first candle, which has no previous close
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def rolling_max(self, data, interval):
+        raise NotImplementedError
+
+    @abstractmethod
+    def rolling_min(self, data, interval):
+        raise NotImplementedError
@@ -0,0 +1,86 @@
+import time
+
+import numpy as np
+
+from trading.indicators.backends import BACKENDS, get_backend, get_default_backend_name
+
+# Calls of every backend primitive over the same candles, keyed by indicator name
+BENCHMARK_INDICATORS = (
+    ('sma', lambda backend, close, high, low, interval: backend.sma(close, interval)),
+    ('ema', lambda backend, close, high, low, interval: backend.ema(close, interval)),
+    ('stddev', lambda backend, close, high, low, interval: backend.stddev(close, interval)),
+    ('true_range', lambda backend, close, high, low, interval: backend.true_range(high, low, close)),
+    ('rolling_max', lambda backend, close, high, low, interval: backend.rolling_max(high, interval)),
+    ('rolling_min', lambda backend, close, high, low, interval: backend.rolling_min(low, interval)),
+)
+
+
+def _calc_max_difference(result, reference):
+    """
+    Largest absolute difference where both are defined, inf if they are not NaN at the same data points
+    """
+    result_undefined = np.isnan(result)
+    if not np.array_equal(result_undefined, np.isnan(reference)):
+        return np.inf
+
+    if result_undefined.all():
+        return 0.0
+    return float(np.max(np.abs(result[~result_undefined] - reference[~result_undefined])))
+
+
+def benchmark_backends(close, high, low, interval=14, backend_names=None, reference_backend_name=None, repeats=5):
+    """
+    Parity and speed of every available backend on the same price data
+    First data point is earliest
+    :param backend_names: backends to compare, every available backend by default
+    :param reference_backend_name: backend the differences are measured against, the default backend if None
+    :param repeats: runs per indicator, the fastest one is kept
+    :return: list of dictionaries of indicator, backend, max_difference and points_per_second
+    """
+    close = np.asarray(close, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+
+    if backend_names is None:
+        backend_names = sorted(name for name, backend in BACKENDS.items() if backend.is_available())
+
+    if reference_backend_name is None:
+        reference_backend_name = get_default_backend_name()
+
+    reference_backend = get_backend(reference_backend_name)
+
+    results = []
+    for indicator, calc_indicator in BENCHMARK_INDICATORS:
+        reference = calc_indicator(reference_backend, close, high, low, interval)
+
+        for backend_name in backend_names:
+            backend = get_backend(backend_name)
+
+            best_time = np.inf
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                result = calc_indicator(backend, close, high, low, interval)
+                best_time = min(best_time, time.perf_counter() - start_time)
+
+            results.append({
+                'indicator': indicator,
+                'backend': backend_name,
+                'max_difference': _calc_max_difference(result, reference),
+                'points_per_second': len(close) / best_time if best_time > 0 else np.inf
+            })
+
+    return results
+
+
+def get_fastest_backends(results):
+    """
+    :param results: benchmark_backends results
+    :return: dictionary of indicator to the backend with the highest throughput
+    """
+    fastest = {}
+    for result in results:
+        indicator = result['indicator']
+        if indicator not in fastest or result['points_per_second'] > fastest[indicator]['points_per_second']:
+            fastest[indicator] = result
+
+    return dict((indicator, result['backend']) for indicator, result in fastest.items())
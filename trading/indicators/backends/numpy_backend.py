@@ -0,0 +1,197 @@
+import math
+
+import numpy as np
+
+from trading.indicators.backends.base import IndicatorBackend
+
+# Largest growth of the exponential moving average weights within one block of the closed form recurrence
+EMA_BLOCK_SCALE = 1e100
+
+
+def _calc_block_accumulations(data, interval, accumulate, fill_value):
+    """
+    Cuts the data into blocks of interval points along the first axis and accumulates every block
+    forwards and backwards
+    :return: block prefix and block suffix accumulations, aligned with data
+    """
+    num_points = len(data)
+    num_blocks = -(-num_points // interval)
+    other_dimensions = data.shape[1:]
+
+    padded_data = np.full((num_blocks * interval,) + other_dimensions, fill_value)
+    padded_data[:num_points] = data
+    blocks = padded_data.reshape((num_blocks, interval) + other_dimensions)
+
+    prefix = accumulate.accumulate(blocks, axis=1).reshape(padded_data.shape)[:num_points]
+    suffix = accumulate.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded_data.shape)[:num_points]
+
+    return prefix, suffix
+
+
+def _calc_van_herk_extreme_series(data, interval, extreme, fill_value):
+    """
+    van Herk/Gil-Werman rolling extreme: the series is cut into blocks of interval points, every window
+    spans the end of one block and the start of the next, so its extreme is that of a block suffix and
+    a block prefix, both found with a vectorized running extreme
+    Every window holding a NaN is NaN. TA-Lib MAX and MIN only return NaN there when the NaN is compared
+    against their running extreme, so the backends agree on windows without NaNs only
+    2-D data, e.g. time by instrument, is rolled along the first axis for every column at once
+    """
+    data = np.asarray(data, dtype=np.float64)
+    num_points = len(data)
+    rolling_extreme = np.full(data.shape, np.nan)
+
+    if interval < 1 or num_points < interval:
+        return rolling_extreme
+
+    prefix_extreme, suffix_extreme = _calc_block_accumulations(data, interval, extreme, fill_value)
+
+    rolling_extreme[interval - 1:] = extreme(suffix_extreme[:num_points - interval + 1],
+                                             prefix_extreme[interval - 1:num_points])
+    return rolling_extreme
+
+
+def calc_rolling_sum_series(data, interval):
+    """
+    Sum of the last interval data points at every data point, rolled along the first axis
+    Built from block sums like the van Herk extremes, so rounding does not accumulate over long histories
+    and a NaN only affects the windows containing it
+    :return: numpy 64-float array shaped like data, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+    num_points = len(data)
+    rolling_sum = np.full(data.shape, np.nan)
+
+    if interval < 1 or num_points < interval:
+        return rolling_sum
+
+    prefix_sum, suffix_sum = _calc_block_accumulations(data, interval, np.add, 0.0)
+
+    window_ends = np.arange(interval - 1, num_points)
+    # Windows ending on the last point of a block are exactly that block
+    block_windows = (window_ends % interval == interval - 1).reshape((-1,) + (1,) * (data.ndim - 1))
+
+    rolling_sum[interval - 1:] = np.where(block_windows, prefix_sum[interval - 1:],
+                                          suffix_sum[:num_points - interval + 1] + prefix_sum[interval - 1:])
+    return rolling_sum
+
+
+def calc_van_herk_max_series(data, interval):
+    """
+    Numpy only rolling maximum, three vectorized passes whatever the interval
+    """
+    return _calc_van_herk_extreme_series(data, interval, np.maximum, -np.inf)
+
+
+def calc_van_herk_min_series(data, interval):
+    """
+    Numpy only rolling minimum, three vectorized passes whatever the interval
+    """
+    return _calc_van_herk_extreme_series(data, interval, np.minimum, np.inf)
+
+
+def calc_rolling_mean_series(data, interval):
+    return calc_rolling_sum_series(data, interval) / interval
+
+
+def calc_rolling_standard_deviation_series(data, interval):
+    """
+    Population standard deviation of the last interval data points, rolled along the first axis
+    Data points are centred on their mean first, which keeps the sum of squares well conditioned
+    """
+    data = np.asarray(data, dtype=np.float64)
+
+    if not len(data):
+        return np.full(data.shape, np.nan)
+
+    centred_data = data - np.nanmean(data, axis=0)
+
+    mean = calc_rolling_mean_series(centred_data, interval)
+    mean_square = calc_rolling_mean_series(centred_data * centred_data, interval)
+
+    return np.sqrt(np.maximum(mean_square - mean * mean, 0.0))
+
+
+def calc_true_range_series(high, low, close):
+    """
+    True range rolled along the first axis, NaN at the first candle
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    true_range = np.full(close.shape, np.nan)
+    previous_close = close[:-1]
+    true_range[1:] = np.maximum(high[1:], previous_close) - np.minimum(low[1:], previous_close)
+
+    return true_range
+
+
+def calc_exponential_moving_average_series(data, interval):
+    """
+    Exponential moving average seeded with the simple moving average of the first interval data points
+    Leading NaNs, e.g. the first true range, are skipped before seeding as TA-Lib does
+    The recurrence y = w * y_previous + k * x is evaluated in closed form over blocks of data points,
+    y_j = w^(j + 1) * (y_previous + k * sum(w^-(i + 1) * x_i)), with blocks short enough that w^-j stays finite
+    """
+    data = np.asarray(data, dtype=np.float64)
+    num_points = len(data)
+    moving_average = np.full(num_points, np.nan)
+
+    defined_points = np.flatnonzero(~np.isnan(data))
+    first_point = defined_points[0] if len(defined_points) else num_points
+
+    if interval < 1 or num_points - first_point < interval:
+        return moving_average
+
+    smoothing = 2.0 / (interval + 1)
+    if interval == 1:
+        moving_average[:] = data
+        return moving_average
+
+    weight = 1.0 - smoothing
+    block_size = max(int(math.log(EMA_BLOCK_SCALE) / -math.log(weight)), 1)
+    block_powers = weight ** -np.arange(1, block_size + 1, dtype=np.float64)
+
+    seed_end = first_point + interval
+    previous_average = data[first_point:seed_end].mean()
+    moving_average[seed_end - 1] = previous_average
+
+    for block_start in range(seed_end, num_points, block_size):
+        block = data[block_start:block_start + block_size]
+        powers = block_powers[:len(block)]
+
+        weighted_sums = np.cumsum(block * powers)
+        weighted_sums *= smoothing
+        weighted_sums += previous_average
+        weighted_sums /= powers
+
+        moving_average[block_start:block_start + len(block)] = weighted_sums
+        previous_average = weighted_sums[-1]
+
+    return moving_average
+
+
+class NumpyBackend(IndicatorBackend):
+    """
+    Pure numpy indicators, for hosts without the TA-Lib C library
+    """
+    name = 'numpy'
+
+    def sma(self, data, interval):
+        return calc_rolling_mean_series(data, interval)
+
+    def ema(self, data, interval):
+        return calc_exponential_moving_average_series(data, interval)
+
+    def stddev(self, data, interval):
+        return calc_rolling_standard_deviation_series(data, interval)
+
+    def true_range(self, high, low, close):
+        return calc_true_range_series(high, low, close)
+
+    def rolling_max(self, data, interval):
+        return calc_van_herk_max_series(data, interval)
+
+    def rolling_min(self, data, interval):
+        return calc_van_herk_min_series(data, interval)
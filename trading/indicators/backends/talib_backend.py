@@ -0,0 +1,77 @@
+import importlib
+
+import numpy as np
+
+from trading.indicators.backends.base import IndicatorBackend
+from trading.indicators.backends.numpy_backend import NumpyBackend
+from trading.indicators.exceptions import IndicatorBackendException
+
+
+class LazyTalib(object):
+    """
+    Stands in for the talib module or one of its submodules, which is only imported once an indicator needs it
+    Keeps the C library out of the import time of processes that do not use it
+    """
+
+    def __init__(self, module_name='talib'):
+        self._module_name = module_name
+        self._module = None
+
+    def __getattr__(self, name):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._module_name)
+            except ImportError:
+                raise IndicatorBackendException('TA-Lib is not installed')
+
+        return getattr(self._module, name)
+
+
+talib = LazyTalib()
+talib_abstract = LazyTalib('talib.abstract')
+
+
+class TalibBackend(IndicatorBackend):
+    """
+    TA-Lib indicators, TA-Lib rejects intervals below 2 so those use the numpy equivalents
+    """
+    name = 'talib'
+
+    _numpy_backend = NumpyBackend()
+
+    @classmethod
+    def is_available(cls):
+        try:
+            talib.SMA
+        except IndicatorBackendException:
+            return False
+        return True
+
+    def sma(self, data, interval):
+        if interval < 2:
+            return self._numpy_backend.sma(data, interval)
+        return talib.SMA(np.asarray(data, dtype=np.float64), timeperiod=interval)
+
+    def ema(self, data, interval):
+        if interval < 2:
+            return self._numpy_backend.ema(data, interval)
+        return talib.EMA(np.asarray(data, dtype=np.float64), timeperiod=interval)
+
+    def stddev(self, data, interval):
+        if interval < 2:
+            return self._numpy_backend.stddev(data, interval)
+        return talib.STDDEV(np.asarray(data, dtype=np.float64), timeperiod=interval)
+
+    def true_range(self, high, low, close):
+        return talib.TRANGE(np.asarray(high, dtype=np.float64), np.asarray(low, dtype=np.float64),
+                            np.asarray(close, dtype=np.float64))
+
+    def rolling_max(self, data, interval):
+        if interval < 2:
+            return self._numpy_backend.rolling_max(data, interval)
+        return talib.MAX(np.asarray(data, dtype=np.float64), timeperiod=interval)
+
+    def rolling_min(self, data, interval):
+        if interval < 2:
+            return self._numpy_backend.rolling_min(data, interval)
+        return talib.MIN(np.asarray(data, dtype=np.float64), timeperiod=interval)
@@ -0,0 +1,126 @@
+import numpy as np
+
+from trading.constants.interval import TRADING_PERIOD_MONTH
+from trading.indicators.overlap_studies import MOVING_AVERAGE_TIMEPERIOD
+from trading.indicators.backends.numpy_backend import calc_rolling_mean_series, calc_rolling_standard_deviation_series, \
+    calc_true_range_series, calc_van_herk_max_series, calc_van_herk_min_series
+
+# Indicators over time by instrument 2-D arrays, e.g. CandlePanel columns
+# Every function computes all instruments in one vectorized call along the time axis,
+# column i of the result matches the 1-D series function over column i of the inputs
+
+
+def _as_batch(data):
+    data = np.asarray(data, dtype=np.float64)
+
+    if data.ndim == 1:
+        return data.reshape(-1, 1)
+    return data
+
+
+def calc_by_column(series_function, *data, **kwargs):
+    """
+    Applies a 1-D series function to every instrument column, for indicators without a batch version
+    :param series_function: e.g. calc_relative_strength_index_series
+    :param data: time by instrument arrays passed as the leading positional arguments
+    :return: time by instrument array, or a tuple of them for indicators with several outputs
+    """
+    data = [_as_batch(column) for column in data]
+    num_instruments = data[0].shape[1]
+
+    results = [series_function(*[column[:, i] for column in data], **kwargs) for i in range(num_instruments)]
+
+    if results and isinstance(results[0], tuple):
+        return tuple(np.column_stack(outputs) for outputs in zip(*results))
+    return np.column_stack(results) if results else np.empty(data[0].shape)
+
+
+def calc_rolling_mean_batch(data, interval):
+    """
+    Mean of the last interval data points of every instrument
+    :return: time by instrument array, NaN until interval data points
+    """
+    return calc_rolling_mean_series(_as_batch(data), interval)
+
+
+def calc_moving_average_batch(data, interval):
+    """
+    calc_moving_average_series of every instrument
+    :return: time by instrument array, NaN until interval data points
+    """
+    data = _as_batch(data)
+
+    if interval < MOVING_AVERAGE_TIMEPERIOD:
+        return np.full(data.shape, np.nan)
+
+    moving_average = calc_rolling_mean_batch(data, MOVING_AVERAGE_TIMEPERIOD)
+    moving_average[:interval - 1] = np.nan
+
+    return moving_average
+
+
+def calc_standard_deviation_batch(data, interval):
+    """
+    calc_standard_deviation_series of every instrument, population deviation over the last interval data points
+    Data points are centred on their instrument mean first, which keeps the sum of squares well conditioned
+    :return: time by instrument array, NaN until interval data points
+    """
+    return calc_rolling_standard_deviation_series(_as_batch(data), interval)
+
+
+def calc_true_range_batch(high, low, close):
+    """
+    True range of every instrument, as talib.TRANGE
+    :return: time by instrument array, NaN at the first candle
+    """
+    return calc_true_range_series(_as_batch(high), _as_batch(low), _as_batch(close))
+
+
+def calc_average_true_range_batch(close, high, low, interval):
+    """
+    calc_average_true_range_series of every instrument, the mean true range of the last interval candles
+    :return: time by instrument array, NaN until interval + 1 candles
+    """
+    return calc_rolling_mean_batch(calc_true_range_batch(high, low, close), interval)
+
+
+def calc_rolling_max_batch(data, interval):
+    """
+    Maximum of the last interval data points of every instrument
+    :return: time by instrument array, NaN until interval data points
+    """
+    return calc_van_herk_max_series(_as_batch(data), interval)
+
+
+def calc_rolling_min_batch(data, interval):
+    """
+    Minimum of the last interval data points of every instrument
+    :return: time by instrument array, NaN until interval data points
+    """
+    return calc_van_herk_min_series(_as_batch(data), interval)
+
+
+def calc_donchian_channel_batch(high, low, interval):
+    """
+    calc_donchian_channel_series of every instrument
+    :return: upper and lower channel time by instrument arrays, NaN until interval candles
+    """
+    return calc_rolling_max_batch(high, interval), calc_rolling_min_batch(low, interval)
+
+
+def calc_chandalier_exits_batch(close, high, low, volatility_threshold=3, target_interval=TRADING_PERIOD_MONTH):
+    """
+    calc_chandalier_exits_series of every instrument
+    :return: long exit and short exit time by instrument arrays, NaN until target_interval + 1 candles
+    """
+    required_interval = target_interval + 1
+
+    month_high = calc_rolling_max_batch(high, required_interval)
+    month_low = calc_rolling_min_batch(low, required_interval)
+
+    atr = calc_average_true_range_batch(close, high, low, target_interval)
+
+    long_exit = month_high - (atr * volatility_threshold)
+    short_exit = month_low + (atr * volatility_threshold)
+
+    return long_exit, short_exit
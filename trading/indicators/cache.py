@@ -0,0 +1,129 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from trading.util.transformations import normalize_price_data
+
+DEFAULT_INDICATOR_CACHE_SIZE = 4096
+
+
+def make_series_key(candle_series):
+    """
+    Identifies candle data by content rather than object, so strategies holding separate stores
+    of the same candles share cache entries
+    :param candle_series: CandleStore or CandleWindow
+    :return: (instrument, granularity, num candles, digest of every candle field), None if the data can not
+    be identified
+    """
+    if not hasattr(candle_series, 'digest') or not len(candle_series):
+        return None
+
+    return candle_series.instrument, candle_series.granularity, len(candle_series), candle_series.digest()
+
+
+def _freeze(value):
+    """
+    Makes the arrays of a cached result read-only, every caller gets the same objects
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+
+    return value
+
+
+class IndicatorCache(object):
+    """
+    Bounded LRU cache of indicator results keyed by (candle data, function, parameters)
+    Hit and miss counts show how much indicator work the cache saves
+    """
+
+    def __init__(self, max_size=DEFAULT_INDICATOR_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        representation = 'IndicatorCache Size {size} Max Size {max_size} Hits {hits} Misses {misses}'\
+            .format(size=len(self), max_size=self.max_size, hits=self.hits, misses=self.misses)
+        return representation
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_calc(self, key, calc):
+        """
+        :param key: hashable cache key, None to always calculate
+        :param calc: function without arguments returning the value to cache
+        """
+        if key is None or not self.max_size:
+            return calc()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            self.misses += 1
+
+        value = _freeze(calc())
+
+        with self._lock:
+            self._entries[key] = value
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def calc(self, indicator, candle_series, fields, *args, **kwargs):
+        """
+        Calls an indicator function with the given candle fields followed by its parameters, e.g.
+        cache.calc(calc_chandalier_exits, window, (PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW), target_interval=22)
+        :param candle_series: CandleStore, CandleWindow or list of candles
+        :param fields: price fields passed as the leading positional arguments
+        """
+        series_key = make_series_key(candle_series)
+        key = None
+        if series_key is not None:
+            key = (series_key, indicator.__module__, indicator.__name__, tuple(fields), args,
+                   tuple(sorted(kwargs.items())))
+
+        def calc_indicator():
+            price_data = [normalize_price_data(candle_series, field) for field in fields]
+            return indicator(*(price_data + list(args)), **kwargs)
+
+        return self.get_or_calc(key, calc_indicator)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self):
+        lookups = self.hits + self.misses
+
+        return {
+            'size': len(self),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': float(self.hits) / lookups if lookups else 0.0
+        }
+
+
+indicator_cache = IndicatorCache(int(os.environ.get('TRADING_INDICATOR_CACHE_SIZE', DEFAULT_INDICATOR_CACHE_SIZE)))
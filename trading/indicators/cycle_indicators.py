@@ -1,22 +1,93 @@
 import numpy as np
-import talib
 
+from trading.indicators.backends import talib
+from trading.indicators.momentum_indicators import _as_array, _latest
 
-def calc_hilbert_transformation_dominant_cycle_period():
-    pass
+# Data points before the first TA-Lib output, HT_DCPERIOD and HT_PHASOR need fewer than the phase based indicators
+HILBERT_TRANSFORMATION_PERIOD_LOOKBACK = 32
+HILBERT_TRANSFORMATION_PHASE_LOOKBACK = 63
 
 
-def calc_hilbert_transformation_dominant_cycle_phased():
-    pass
+def calc_hilbert_transformation_dominant_cycle_period_series(data):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with data, NaN until the indicator is defined
+    """
+    return talib.HT_DCPERIOD(_as_array(data))
 
 
-def calc_hilbert_transformation_phasor_components():
-    pass
+def calc_hilbert_transformation_dominant_cycle_period(data):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_hilbert_transformation_dominant_cycle_period_series(data))
 
 
-def calc_hilbert_transformation_sine_wave():
-    pass
+def calc_hilbert_transformation_dominant_cycle_phase_series(data):
+    """
+    First data point is earliest
+    :return: numpy 64-float array of degrees aligned with data, NaN until the indicator is defined
+    """
+    return talib.HT_DCPHASE(_as_array(data))
 
 
-def calc_hilbert_transformation_trend_vs_cycle_mode():
-    pass
+def calc_hilbert_transformation_dominant_cycle_phase(data):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_hilbert_transformation_dominant_cycle_phase_series(data))
+
+
+def calc_hilbert_transformation_phasor_components_series(data):
+    """
+    First data point is earliest
+    :return: in phase and quadrature numpy 64-float arrays aligned with data, NaN until the indicator is defined
+    """
+    return talib.HT_PHASOR(_as_array(data))
+
+
+def calc_hilbert_transformation_phasor_components(data):
+    """
+    First data point is earliest
+    :return: newest in phase and quadrature
+    """
+    return _latest(calc_hilbert_transformation_phasor_components_series(data))
+
+
+def calc_hilbert_transformation_sine_wave_series(data):
+    """
+    First data point is earliest
+    :return: sine and lead sine numpy 64-float arrays aligned with data, NaN until the indicator is defined
+    """
+    return talib.HT_SINE(_as_array(data))
+
+
+def calc_hilbert_transformation_sine_wave(data):
+    """
+    First data point is earliest
+    :return: newest sine and lead sine
+    """
+    return _latest(calc_hilbert_transformation_sine_wave_series(data))
+
+
+def calc_hilbert_transformation_trend_vs_cycle_mode_series(data):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with data, 1 trend and 0 cycle mode, NaN until the indicator is defined
+    """
+    data = _as_array(data)
+
+    trend_mode = talib.HT_TRENDMODE(data).astype(np.float64)
+    trend_mode[:HILBERT_TRANSFORMATION_PHASE_LOOKBACK] = np.nan
+
+    return trend_mode
+
+
+def calc_hilbert_transformation_trend_vs_cycle_mode(data):
+    """
+    First data point is earliest
+    :return: newest value, 1 trend and 0 cycle mode
+    """
+    return int(_latest(calc_hilbert_transformation_trend_vs_cycle_mode_series(data)))
@@ -12,3 +12,10 @@ class TalibIntervalException(IndicatorException):
     Talib Interval Range Error.
     """
     message = 'Interval Range Error.'
+
+
+class IndicatorBackendException(IndicatorException):
+    """
+    Unknown or unavailable indicator backend.
+    """
+    message = 'Indicator Backend Error.'
@@ -0,0 +1,176 @@
+import numpy as np
+
+from trading.constants.interval import TRADING_PERIOD_MONTH
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW
+from trading.indicators.backends import get_backend
+from trading.indicators.overlap_studies import calc_moving_average_series
+from trading.indicators.price_transformation import calc_standard_deviation_series
+from trading.indicators.rolling import calc_rolling_max_series, calc_rolling_min_series
+from trading.util.transformations import normalize_price_data
+
+
+class IndicatorNode(object):
+    """
+    Indicator series computed from the series of its input nodes
+    Nodes are identified by name and parameters, so equal nodes declared separately are computed once
+    """
+
+    def __init__(self, name, calc=None, inputs=(), params=(), lookback=0):
+        """
+        :param calc: function of the input series returning a series aligned with them, None for a price field
+        :param lookback: candles before the newest candle needed on top of the inputs' own lookback
+        """
+        self.name = name
+        self.calc = calc
+        self.inputs = tuple(inputs)
+        self.params = tuple(params)
+        self.key = (name,) + self.params
+        self.lookback = lookback + max([node.lookback for node in self.inputs] or [0])
+
+    def __repr__(self):
+        return 'IndicatorNode {key}'.format(key=self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, IndicatorNode) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def required_interval(self):
+        return self.lookback + 1
+
+
+def price_node(field):
+    return IndicatorNode(field)
+
+
+def true_range_node():
+    return IndicatorNode('true_range', lambda high, low, close: get_backend().true_range(high, low, close),
+                         (price_node(PRICE_ASK_HIGH), price_node(PRICE_ASK_LOW), price_node(PRICE_ASK_CLOSE)),
+                         lookback=1)
+
+
+def average_true_range_node(interval):
+    """
+    Mean true range of the last interval candles, as calc_average_true_range
+    """
+    return IndicatorNode('average_true_range', lambda true_range: get_backend().sma(true_range, interval),
+                         (true_range_node(),), (interval,), lookback=interval - 1)
+
+
+def rolling_high_node(interval):
+    return IndicatorNode('rolling_high', lambda high: calc_rolling_max_series(high, interval),
+                         (price_node(PRICE_ASK_HIGH),), (interval,), lookback=interval - 1)
+
+
+def rolling_low_node(interval):
+    return IndicatorNode('rolling_low', lambda low: calc_rolling_min_series(low, interval),
+                         (price_node(PRICE_ASK_LOW),), (interval,), lookback=interval - 1)
+
+
+def moving_average_node(interval, field=PRICE_ASK_CLOSE):
+    return IndicatorNode('moving_average', lambda data: calc_moving_average_series(data, interval),
+                         (price_node(field),), (interval,), lookback=interval - 1)
+
+
+def standard_deviation_node(interval, field=PRICE_ASK_CLOSE):
+    return IndicatorNode('standard_deviation', lambda data: calc_standard_deviation_series(data, interval),
+                         (price_node(field),), (interval,), lookback=interval - 1)
+
+
+def chandalier_exit_nodes(volatility_threshold=3, target_interval=TRADING_PERIOD_MONTH):
+    """
+    Long and short exits of calc_chandalier_exits
+    """
+    month_high = rolling_high_node(target_interval + 1)
+    month_low = rolling_low_node(target_interval + 1)
+    atr = average_true_range_node(target_interval)
+    params = (volatility_threshold, target_interval)
+
+    long_exit = IndicatorNode('chandalier_long_exit', lambda high, atr: high - (atr * volatility_threshold),
+                              (month_high, atr), params)
+    short_exit = IndicatorNode('chandalier_short_exit', lambda low, atr: low + (atr * volatility_threshold),
+                               (month_low, atr), params)
+
+    return long_exit, short_exit
+
+
+class IndicatorGraph(object):
+    """
+    Resolves the indicators a strategy declares into a single evaluation order
+    Shared inputs and intermediates, e.g. the true range behind several ATRs, are computed once per evaluation
+    """
+
+    def __init__(self, outputs):
+        """
+        :param outputs: dictionary of output name to IndicatorNode
+        """
+        self.outputs = dict(outputs)
+        self.nodes = self._resolve(self.outputs[name] for name in sorted(self.outputs))
+        self.key = tuple((name, self.outputs[name].key) for name in sorted(self.outputs))
+
+    def __repr__(self):
+        representation = 'IndicatorGraph Outputs {outputs} Nodes {num_nodes}'\
+            .format(outputs=sorted(self.outputs), num_nodes=len(self.nodes))
+        return representation
+
+    @staticmethod
+    def _resolve(output_nodes):
+        """
+        :return: unique nodes, every node after its inputs
+        """
+        ordered_nodes = []
+        visited = set()
+
+        def visit(node):
+            if node.key in visited:
+                return
+            visited.add(node.key)
+
+            for input_node in node.inputs:
+                visit(input_node)
+
+            ordered_nodes.append(node)
+
+        for output_node in output_nodes:
+            visit(output_node)
+
+        return ordered_nodes
+
+    @property
+    def required_interval(self):
+        """
+        Candles needed for every output to have a value at the newest candle
+        """
+        return max(node.required_interval for node in self.outputs.values())
+
+    def calc_series(self, candle_series):
+        """
+        Output series over all candles, each node evaluated once
+        :param candle_series: CandleStore, CandleWindow or list of candles, first candle is earliest
+        :return: dictionary of output name to numpy 64-float array aligned with the candles
+        """
+        values = {}
+
+        for node in self.nodes:
+            if node.calc is None:
+                values[node.key] = np.asarray(normalize_price_data(candle_series, node.name), dtype=np.float64)
+            else:
+                values[node.key] = node.calc(*[values[input_node.key] for input_node in node.inputs])
+
+        return dict((name, values[node.key]) for name, node in self.outputs.items())
+
+    def calc_latest(self, candle_series):
+        """
+        Output values at the newest candle, only the last required_interval candles are evaluated
+        """
+        if hasattr(candle_series, 'window'):
+            candle_series = candle_series.window(-self.required_interval, len(candle_series))
+        else:
+            candle_series = candle_series[-self.required_interval:]
+
+        return dict((name, series[-1]) for name, series in self.calc_series(candle_series).items())
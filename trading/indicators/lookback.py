@@ -0,0 +1,46 @@
+from trading.indicators.backends import talib_abstract
+from trading.indicators.pattern_recognition import PATTERN_NAMES, _pattern_functions
+
+# Candles an indicator needs to have a value at the newest candle, for sizing the strategy data window
+# Graph indicators know their own required_interval, the functions below cover the indicators computed outside a graph
+
+
+def average_directional_movement_index_required_interval(interval):
+    """
+    As calc_average_directional_movement_index checks it
+    """
+    return interval * 2
+
+
+def average_directional_movement_index_rating_required_interval(interval):
+    """
+    As calc_average_directional_movement_index_rating checks it
+    """
+    return interval * 3
+
+
+def candle_patterns_required_interval(patterns=PATTERN_NAMES):
+    """
+    Candles before every pattern can be found at the newest candle, including the candles TA-Lib averages
+    body and shadow sizes over
+    """
+    return max(talib_abstract.Function(_pattern_functions[pattern]).lookback for pattern in patterns) + 1
+
+
+def get_required_interval(indicator):
+    """
+    :param indicator: IndicatorGraph, IndicatorNode or number of candles
+    """
+    return getattr(indicator, 'required_interval', indicator)
+
+
+def plan_data_window(indicators):
+    """
+    Fewest candles for every indicator a strategy declares to have a value at the newest candle
+    :param indicators: IndicatorGraph, IndicatorNode or number of candles per indicator
+    :return: number of candles
+    """
+    if not indicators:
+        raise ValueError('A data window needs at least one indicator')
+
+    return max(get_required_interval(indicator) for indicator in indicators)
@@ -1,6 +1,9 @@
+import numpy as np
+
 from trading.constants.interval import TRADING_PERIOD_MONTH
 from trading.indicators.exceptions import TalibIntervalException
-from trading.indicators.volatility_indicators import calc_average_true_range
+from trading.indicators.rolling import calc_rolling_max_series, calc_rolling_min_series
+from trading.indicators.volatility_indicators import calc_average_true_range, calc_average_true_range_series
 
 
 def get_period_high(daily_highs, interval):
@@ -55,3 +58,39 @@ def calc_chandalier_exits(close, high, low, volatility_threshold=3,
     short_exit = month_low + (atr * volatility_threshold)
 
     return long_exit, short_exit
+
+
+def calc_donchian_channel_series(high, low, interval):
+    """
+    Highest high and lowest low of the last interval candles at every candle
+    First data point is earliest
+    :return: upper and lower channel numpy 64-float arrays aligned with high, NaN until interval candles
+    """
+    return calc_rolling_max_series(high, interval), calc_rolling_min_series(low, interval)
+
+
+def calc_chandalier_exits_series(close, high, low, volatility_threshold=3,
+                                 target_interval=TRADING_PERIOD_MONTH):
+    """
+    calc_chandalier_exits at every candle, computed in a single pass
+    First data point is earliest
+    :return: long exit and short exit numpy 64-float arrays aligned with close, NaN until target_interval + 1 candles
+    """
+    required_interval = target_interval + 1
+
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    if len(close) < required_interval:
+        return np.full(len(close), np.nan), np.full(len(close), np.nan)
+
+    month_high = calc_rolling_max_series(high, required_interval)
+    month_low = calc_rolling_min_series(low, required_interval)
+
+    atr = calc_average_true_range_series(close, high, low, target_interval)
+
+    long_exit = month_high - (atr * volatility_threshold)
+    short_exit = month_low + (atr * volatility_threshold)
+
+    return long_exit, short_exit
@@ -1,7 +1,28 @@
 import numpy as np
-import talib
 
+from trading.indicators.backends import talib
 from trading.indicators.exceptions import TalibIntervalException
+from trading.indicators.lookback import average_directional_movement_index_required_interval, \
+    average_directional_movement_index_rating_required_interval
+
+
+def _as_array(data):
+    return np.asarray(data, dtype=np.float64)
+
+
+def _latest(series):
+    """
+    Newest value of one or more aligned series, raises TalibIntervalException while the indicator is undefined
+    """
+    if isinstance(series, tuple):
+        values = tuple(values[-1] if len(values) else np.nan for values in series)
+        if any(np.isnan(value) for value in values):
+            raise TalibIntervalException
+        return values
+
+    if not len(series) or np.isnan(series[-1]):
+        raise TalibIntervalException
+    return series[-1]
 
 
 def calc_average_directional_movement_index(high, low, close, interval):
@@ -13,7 +34,7 @@ def calc_average_directional_movement_index(high, low, close, interval):
     :param interval:
     :return:
     """
-    required_interval = interval * 2
+    required_interval = average_directional_movement_index_required_interval(interval)
 
     if len(high) < required_interval or len(low) < required_interval or len(close) < required_interval:
         raise TalibIntervalException
@@ -39,7 +60,7 @@ def calc_average_directional_movement_index_rating(high, low, close, interval):
     :param interval:
     :return:
     """
-    required_interval = interval * 3
+    required_interval = average_directional_movement_index_rating_required_interval(interval)
 
     if len(high) < required_interval or len(low) < required_interval or len(close) < required_interval:
         raise TalibIntervalException
@@ -56,117 +77,468 @@ def calc_average_directional_movement_index_rating(high, low, close, interval):
     return adxr[-1]
 
 
-def calc_absolute_price_oscillator():
-    pass
+def calc_average_directional_movement_index_series(high, low, close, interval):
+    """
+    ADX at every candle over the whole history, computed in a single pass
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ADX(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
+
+
+def calc_average_directional_movement_index_rating_series(high, low, close, interval):
+    """
+    ADXR at every candle over the whole history, computed in a single pass
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ADXR(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
+
+
+def calc_absolute_price_oscillator_series(close, fast_interval=12, slow_interval=26, ma_type=0):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.APO(_as_array(close), fastperiod=fast_interval, slowperiod=slow_interval, matype=ma_type)
+
+
+def calc_absolute_price_oscillator(close, fast_interval=12, slow_interval=26, ma_type=0):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_absolute_price_oscillator_series(close, fast_interval, slow_interval, ma_type))
+
+
+def calc_aroon_series(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: aroon down and aroon up numpy 64-float arrays aligned with high, NaN until the indicator is defined
+    """
+    return talib.AROON(_as_array(high), _as_array(low), timeperiod=interval)
+
+
+def calc_aroon(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: newest aroon down and aroon up
+    """
+    return _latest(calc_aroon_series(high, low, interval))
+
+
+def calc_aroon_oscillator_series(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.AROONOSC(_as_array(high), _as_array(low), timeperiod=interval)
+
+
+def calc_aroon_oscillator(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_aroon_oscillator_series(high, low, interval))
+
+
+def calc_balance_of_power_series(open_price, high, low, close):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with open_price, NaN until the indicator is defined
+    """
+    return talib.BOP(_as_array(open_price), _as_array(high), _as_array(low), _as_array(close))
+
+
+def calc_balance_of_power(open_price, high, low, close):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_balance_of_power_series(open_price, high, low, close))
+
+
+def calc_commodity_channel_index_series(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.CCI(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
+
+
+def calc_commodity_channel_index(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_commodity_channel_index_series(high, low, close, interval))
+
+
+def calc_chande_momentum_oscillator_series(close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.CMO(_as_array(close), timeperiod=interval)
+
+
+def calc_chande_momentum_oscillator(close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_chande_momentum_oscillator_series(close, interval))
+
+
+def calc_directional_movement_index_series(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.DX(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
+
+
+def calc_directional_movement_index(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_directional_movement_index_series(high, low, close, interval))
+
+
+def calc_moving_average_convergence_divergence_series(close, fast_interval=12, slow_interval=26, signal_interval=9):
+    """
+    First data point is earliest
+    :return: macd, signal and histogram numpy 64-float arrays aligned with close, NaN until the indicator is defined
+    """
+    return talib.MACD(_as_array(close), fastperiod=fast_interval, slowperiod=slow_interval,
+                      signalperiod=signal_interval)
+
+
+def calc_moving_average_convergence_divergence(close, fast_interval=12, slow_interval=26, signal_interval=9):
+    """
+    First data point is earliest
+    :return: newest macd, signal and histogram
+    """
+    return _latest(calc_moving_average_convergence_divergence_series(close, fast_interval, slow_interval,
+                                                                     signal_interval))
+
+
+def calc_macd_with_controllable_ma_type_series(close, fast_interval=12, fast_ma_type=0, slow_interval=26,
+                                               slow_ma_type=0, signal_interval=9, signal_ma_type=0):
+    """
+    First data point is earliest
+    :return: macd, signal and histogram numpy 64-float arrays aligned with close, NaN until the indicator is defined
+    """
+    return talib.MACDEXT(_as_array(close), fastperiod=fast_interval, fastmatype=fast_ma_type,
+                         slowperiod=slow_interval, slowmatype=slow_ma_type, signalperiod=signal_interval,
+                         signalmatype=signal_ma_type)
+
+
+def calc_macd_with_controllable_ma_type(close, fast_interval=12, fast_ma_type=0, slow_interval=26, slow_ma_type=0,
+                                        signal_interval=9, signal_ma_type=0):
+    """
+    First data point is earliest
+    :return: newest macd, signal and histogram
+    """
+    return _latest(calc_macd_with_controllable_ma_type_series(close, fast_interval, fast_ma_type, slow_interval,
+                                                              slow_ma_type, signal_interval, signal_ma_type))
+
+
+def calc_money_flow_index_series(high, low, close, volume, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.MFI(_as_array(high), _as_array(low), _as_array(close), _as_array(volume), timeperiod=interval)
+
+
+def calc_money_flow_index(high, low, close, volume, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_money_flow_index_series(high, low, close, volume, interval))
+
 
+def calc_minus_directional_indicator_series(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.MINUS_DI(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
 
-def calc_aroon():
-    pass
 
+def calc_minus_directional_indicator(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_minus_directional_indicator_series(high, low, close, interval))
 
-def calc_aroon_oscillator():
-    pass
 
+def calc_minus_directional_movement_series(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.MINUS_DM(_as_array(high), _as_array(low), timeperiod=interval)
 
-def calc_balance_of_power():
-    pass
 
+def calc_minus_directional_movement(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_minus_directional_movement_series(high, low, interval))
 
-def calc_commodity_channel_index():
-    pass
 
+def calc_momentum_series(close, interval=10):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.MOM(_as_array(close), timeperiod=interval)
 
-def calc_chande_momentum_oscillator():
-    pass
 
+def calc_momentum(close, interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_momentum_series(close, interval))
 
-def calc_directional_movement_index():
-    pass
 
+def calc_plus_directional_indicator_series(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.PLUS_DI(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
 
-def calc_moving_average_convergence_divergence():
-    pass
 
+def calc_plus_directional_indicator(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_plus_directional_indicator_series(high, low, close, interval))
 
-def calc_macd_with_controllable_ma_type():
-    pass
 
+def calc_plus_directional_movement_series(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.PLUS_DM(_as_array(high), _as_array(low), timeperiod=interval)
+
+
+def calc_plus_directional_movement(high, low, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_plus_directional_movement_series(high, low, interval))
+
+
+def calc_percentage_price_oscillator_series(close, fast_interval=12, slow_interval=26, ma_type=0):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.PPO(_as_array(close), fastperiod=fast_interval, slowperiod=slow_interval, matype=ma_type)
+
+
+def calc_percentage_price_oscillator(close, fast_interval=12, slow_interval=26, ma_type=0):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_percentage_price_oscillator_series(close, fast_interval, slow_interval, ma_type))
+
+
+def calc_rate_of_change_series(close, interval=10):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ROC(_as_array(close), timeperiod=interval)
 
-def calc_money_flow_index():
-    pass
+
+def calc_rate_of_change(close, interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_rate_of_change_series(close, interval))
 
 
-def calc_minus_directional_indicator():
-    pass
+def calc_rate_of_change_percentage_series(close, interval=10):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ROCP(_as_array(close), timeperiod=interval)
 
 
-def calc_minus_directional_movement():
-    pass
+def calc_rate_of_change_percentage(close, interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_rate_of_change_percentage_series(close, interval))
 
 
-def calc_momentum():
-    pass
+def calc_rate_of_change_ratio_series(close, interval=10):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ROCR(_as_array(close), timeperiod=interval)
 
 
-def calc_plus_directional_indicator():
-    pass
+def calc_rate_of_change_ratio(close, interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_rate_of_change_ratio_series(close, interval))
 
 
-def calc_plus_directional_movement():
-    pass
+def calc_rate_of_change_100_scale_series(close, interval=10):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ROCR100(_as_array(close), timeperiod=interval)
 
 
-def calc_percetntage_price_oscillator():
-    pass
+def calc_rate_of_change_100_scale(close, interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_rate_of_change_100_scale_series(close, interval))
 
 
-def calc_rate_of_change():
-    pass
+def calc_relative_strength_index_series(close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.RSI(_as_array(close), timeperiod=interval)
 
 
-def calc_rate_of_change_percentage():
-    pass
+def calc_relative_strength_index(close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_relative_strength_index_series(close, interval))
 
 
-def calc_rate_of_change_ration():
-    pass
+def calc_stochastic_series(high, low, close, fastk_interval=5, slowk_interval=3, slowk_ma_type=0, slowd_interval=3,
+                           slowd_ma_type=0):
+    """
+    First data point is earliest
+    :return: slow %K and slow %D numpy 64-float arrays aligned with high, NaN until the indicator is defined
+    """
+    return talib.STOCH(_as_array(high), _as_array(low), _as_array(close), fastk_period=fastk_interval,
+                       slowk_period=slowk_interval, slowk_matype=slowk_ma_type, slowd_period=slowd_interval,
+                       slowd_matype=slowd_ma_type)
 
 
-def calc_rate_of_change_ratio():
-    pass
+def calc_stochastic(high, low, close, fastk_interval=5, slowk_interval=3, slowk_ma_type=0, slowd_interval=3,
+                    slowd_ma_type=0):
+    """
+    First data point is earliest
+    :return: newest slow %K and slow %D
+    """
+    return _latest(calc_stochastic_series(high, low, close, fastk_interval, slowk_interval, slowk_ma_type,
+                                          slowd_interval, slowd_ma_type))
 
 
-def calc_rate_of_change_100_scale():
-    pass
+def calc_stochastic_fast_series(high, low, close, fastk_interval=5, fastd_interval=3, fastd_ma_type=0):
+    """
+    First data point is earliest
+    :return: fast %K and fast %D numpy 64-float arrays aligned with high, NaN until the indicator is defined
+    """
+    return talib.STOCHF(_as_array(high), _as_array(low), _as_array(close), fastk_period=fastk_interval,
+                        fastd_period=fastd_interval, fastd_matype=fastd_ma_type)
 
 
-def calc_relative_strength_index():
-    pass
+def calc_stochastic_fast(high, low, close, fastk_interval=5, fastd_interval=3, fastd_ma_type=0):
+    """
+    First data point is earliest
+    :return: newest fast %K and fast %D
+    """
+    return _latest(calc_stochastic_fast_series(high, low, close, fastk_interval, fastd_interval, fastd_ma_type))
 
 
-def calc_schotastic():
-    pass
+def calc_stochastic_relative_strength_index_series(close, interval=14, fastk_interval=5, fastd_interval=3,
+                                                   fastd_ma_type=0):
+    """
+    First data point is earliest
+    :return: fast %K and fast %D numpy 64-float arrays aligned with close, NaN until the indicator is defined
+    """
+    return talib.STOCHRSI(_as_array(close), timeperiod=interval, fastk_period=fastk_interval,
+                          fastd_period=fastd_interval, fastd_matype=fastd_ma_type)
 
 
-def calc_schotastic_fast():
-    pass
+def calc_stochastic_relative_strength_index(close, interval=14, fastk_interval=5, fastd_interval=3, fastd_ma_type=0):
+    """
+    First data point is earliest
+    :return: newest fast %K and fast %D
+    """
+    return _latest(calc_stochastic_relative_strength_index_series(close, interval, fastk_interval, fastd_interval,
+                                                                  fastd_ma_type))
 
 
-def calc_schotastic_relative_strength_index():
-    pass
+def calc_one_day_rate_of_change_of_a_tripple_smooth_ema_series(close, interval=30):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.TRIX(_as_array(close), timeperiod=interval)
 
 
-def calc_one_day_rate_of_change_of_a_tripple_smooth_ema():
-    pass
+def calc_one_day_rate_of_change_of_a_tripple_smooth_ema(close, interval=30):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_one_day_rate_of_change_of_a_tripple_smooth_ema_series(close, interval))
 
 
-def calc_ultimate_oscillator():
-    pass
+def calc_ultimate_oscillator_series(high, low, close, first_interval=7, second_interval=14, third_interval=28):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.ULTOSC(_as_array(high), _as_array(low), _as_array(close), timeperiod1=first_interval,
+                        timeperiod2=second_interval, timeperiod3=third_interval)
 
 
-def calc_williams_percent_r():
-    pass
+def calc_ultimate_oscillator(high, low, close, first_interval=7, second_interval=14, third_interval=28):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_ultimate_oscillator_series(high, low, close, first_interval, second_interval, third_interval))
 
 
+def calc_williams_percent_r_series(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: numpy 64-float array aligned with high, NaN until the indicator is defined
+    """
+    return talib.WILLR(_as_array(high), _as_array(low), _as_array(close), timeperiod=interval)
 
 
+def calc_williams_percent_r(high, low, close, interval=14):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_williams_percent_r_series(high, low, close, interval))
@@ -1,8 +1,11 @@
 import numpy as np
-import talib
 
+from trading.indicators.backends import get_backend
 from trading.indicators.exceptions import TalibIntervalException
 
+# calc_moving_average averages the last two points of its interval
+MOVING_AVERAGE_TIMEPERIOD = 2
+
 
 def calc_bollinger_bands():
     pass
@@ -41,9 +44,28 @@ def calc_moving_average(data, interval):
 
     data = data[-interval:]
 
-    target_data = np.asarray(data)
+    target_data = np.asarray(data, dtype=np.float64)
+
+    return get_backend().sma(target_data, MOVING_AVERAGE_TIMEPERIOD)[-1]
+
+
+def calc_moving_average_series(data, interval):
+    """
+    calc_moving_average at every data point, computed in a single pass
+    First data point is earliest
+    :param data: list or array of data points
+    :param interval: int representing chosen interval (not granularity)
+    :return: numpy 64-float array aligned with data, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+
+    if interval < MOVING_AVERAGE_TIMEPERIOD:
+        return np.full(len(data), np.nan)
+
+    moving_average = get_backend().sma(data, MOVING_AVERAGE_TIMEPERIOD)
+    moving_average[:interval - 1] = np.nan
 
-    return talib.MA(target_data, timeperiod=2)[-1]
+    return moving_average
 
 
 def calc_moving_average_variable_period():
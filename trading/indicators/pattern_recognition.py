@@ -1,240 +1,415 @@
 import numpy as np
-import talib
 
+from trading.constants.price_data import PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE
+from trading.indicators.backends import talib
+from trading.indicators.cache import indicator_cache, make_series_key
+from trading.indicators.exceptions import TalibIntervalException
+from trading.util.transformations import normalize_price_data
+
+# TA-Lib scores patterns in steps of 100, signals keep the sign and strength in a single byte
+# 1 / -1 bullish / bearish, 2 / -2 confirmed bullish / bearish, 0 no pattern
+PATTERN_SCORE_STEP = 100
+
+# Pattern name and TA-Lib function name, functions are looked up when a scan runs
+PATTERN_FUNCTIONS = (
+    ('two_crows', 'CDL2CROWS'),
+    ('three_black_crows', 'CDL3BLACKCROWS'),
+    ('three_inside_up_down', 'CDL3INSIDE'),
+    ('three_line_strike', 'CDL3LINESTRIKE'),
+    ('three_outside_up_down', 'CDL3OUTSIDE'),
+    ('three_stars_in_the_south', 'CDL3STARSINSOUTH'),
+    ('three_advancing_white_soldiers', 'CDL3WHITESOLDIERS'),
+    ('abandoned_baby', 'CDLABANDONEDBABY'),
+    ('advance_block', 'CDLADVANCEBLOCK'),
+    ('belt_hold', 'CDLBELTHOLD'),
+    ('breakaway', 'CDLBREAKAWAY'),
+    ('closing_marubozu', 'CDLCLOSINGMARUBOZU'),
+    ('concealing_baby_swallow', 'CDLCONCEALBABYSWALL'),
+    ('counterattack', 'CDLCOUNTERATTACK'),
+    ('dark_cloud_cover', 'CDLDARKCLOUDCOVER'),
+    ('doji', 'CDLDOJI'),
+    ('doji_star', 'CDLDOJISTAR'),
+    ('dragonfly_doji', 'CDLDRAGONFLYDOJI'),
+    ('engulfing_pattern', 'CDLENGULFING'),
+    ('evening_doji_star', 'CDLEVENINGDOJISTAR'),
+    ('evening_star', 'CDLEVENINGSTAR'),
+    ('up_down_gap_side_by_side_white_lines', 'CDLGAPSIDESIDEWHITE'),
+    ('gravestone_doji', 'CDLGRAVESTONEDOJI'),
+    ('hammer', 'CDLHAMMER'),
+    ('hanging_man', 'CDLHANGINGMAN'),
+    ('harami_pattern', 'CDLHARAMI'),
+    ('harami_cross_pattern', 'CDLHARAMICROSS'),
+    ('high_wave_candle', 'CDLHIGHWAVE'),
+    ('hikkake_pattern', 'CDLHIKKAKE'),
+    ('modified_hikkake_pattern', 'CDLHIKKAKEMOD'),
+    ('homing_pigeon', 'CDLHOMINGPIGEON'),
+    ('identical_three_crows', 'CDLIDENTICAL3CROWS'),
+    ('in_neck_pattern', 'CDLINNECK'),
+    ('inverted_hammer', 'CDLINVERTEDHAMMER'),
+    ('kicking', 'CDLKICKING'),
+    ('kicking_bull_bear_determined_by_the_longer_marubozu', 'CDLKICKINGBYLENGTH'),
+    ('ladder_bottom', 'CDLLADDERBOTTOM'),
+    ('long_legged_doji', 'CDLLONGLEGGEDDOJI'),
+    ('long_line_candle', 'CDLLONGLINE'),
+    ('marubozu', 'CDLMARUBOZU'),
+    ('matching_low', 'CDLMATCHINGLOW'),
+    ('mat_hold', 'CDLMATHOLD'),
+    ('morning_doji_star', 'CDLMORNINGDOJISTAR'),
+    ('morning_star', 'CDLMORNINGSTAR'),
+    ('on_neck_pattern', 'CDLONNECK'),
+    ('piercing_pattern', 'CDLPIERCING'),
+    ('rickshaw_man', 'CDLRICKSHAWMAN'),
+    ('rising_falling_three_methods', 'CDLRISEFALL3METHODS'),
+    ('separating_lines', 'CDLSEPARATINGLINES'),
+    ('shooting_star', 'CDLSHOOTINGSTAR'),
+    ('short_line_candle', 'CDLSHORTLINE'),
+    ('spinning_top', 'CDLSPINNINGTOP'),
+    ('stalled_pattern', 'CDLSTALLEDPATTERN'),
+    ('stick_sandwich', 'CDLSTICKSANDWICH'),
+    ('takuri', 'CDLTAKURI'),
+    ('tasuki_gap', 'CDLTASUKIGAP'),
+    ('thrusting_pattern', 'CDLTHRUSTING'),
+    ('tristar_pattern', 'CDLTRISTAR'),
+    ('unique_three_river', 'CDLUNIQUE3RIVER'),
+    ('upside_gap_two_crows', 'CDLUPSIDEGAP2CROWS'),
+    ('upside_downside_gap_three_methods', 'CDLXSIDEGAP3METHODS'),
+)
+
+PATTERN_NAMES = tuple(name for name, _ in PATTERN_FUNCTIONS)
+
+_pattern_functions = dict(PATTERN_FUNCTIONS)
+
+
+def _as_array(data):
+    return np.asarray(data, dtype=np.float64)
+
+
+def scan_patterns(open_price, high, low, close, patterns=PATTERN_NAMES):
+    """
+    Evaluates candlestick patterns over a whole price history
+    First data point is earliest
+    :param patterns: pattern names, rows of the result in the same order
+    :return: int8 matrix of pattern signals, one row per pattern and one column per candle
+    """
+    open_price, high, low, close = _as_array(open_price), _as_array(high), _as_array(low), _as_array(close)
+
+    signals = np.zeros((len(patterns), len(close)), dtype=np.int8)
+
+    for row, pattern in enumerate(patterns):
+        scores = getattr(talib, _pattern_functions[pattern])(open_price, high, low, close)
+        signals[row] = scores // PATTERN_SCORE_STEP
+
+    return signals
+
+
+class PatternScan(object):
+    """
+    Read-only pattern signals of every candle in a price history
+    """
+
+    def __init__(self, patterns, signals):
+        signals.flags.writeable = False
+
+        self.patterns = tuple(patterns)
+        self.signals = signals
+        self.rows = dict((pattern, row) for row, pattern in enumerate(self.patterns))
+
+    def __repr__(self):
+        representation = 'PatternScan Patterns {num_patterns} Candles {size}'\
+            .format(num_patterns=len(self.patterns), size=len(self))
+        return representation
 
-def calc_two_crows():
-    pass
+    def __len__(self):
+        return self.signals.shape[1]
 
+    def pattern(self, name):
+        """
+        Signals of a single pattern, one per candle
+        """
+        return self.signals[self.rows[name]]
 
-def calc_three_black_crows():
-    pass
+    def candle(self, index):
+        """
+        Signals of every pattern at a single candle, e.g. classifier features
+        :return: dictionary of pattern name to signal
+        """
+        return dict(zip(self.patterns, self.signals[:, index].tolist()))
 
+    def matches(self, index):
+        """
+        Names of the patterns found at a single candle
+        """
+        return [self.patterns[row] for row in np.flatnonzero(self.signals[:, index])]
 
-def calc_three_inside_up_down():
-    pass
 
+def scan_candle_patterns(candle_series, patterns=PATTERN_NAMES):
+    """
+    Pattern scan of candle data, shared through the indicator cache with every other scan of the same candles
+    :param candle_series: CandleStore, CandleWindow or list of candles
+    :return: PatternScan
+    """
+    patterns = tuple(patterns)
 
-def calc_three_outside_up_down():
-    pass
+    series_key = make_series_key(candle_series)
+    cache_key = (series_key, 'candle_patterns', patterns) if series_key is not None else None
 
+    def calc_pattern_scan():
+        price_data = [normalize_price_data(candle_series, field)
+                      for field in (PRICE_ASK_OPEN, PRICE_ASK_HIGH, PRICE_ASK_LOW, PRICE_ASK_CLOSE)]
+        return PatternScan(patterns, scan_patterns(*(price_data + [patterns])))
 
-def calc_three_stars_in_the_south():
-    pass
+    return indicator_cache.get_or_calc(cache_key, calc_pattern_scan)
 
 
-def calc_three_advancing_white_soldiers():
-    pass
+def _calc_pattern(pattern, open_price, high, low, close):
+    """
+    Signal of a single pattern at the newest candle
+    """
+    if not len(close):
+        raise TalibIntervalException
 
+    return int(scan_patterns(open_price, high, low, close, (pattern,))[0, -1])
 
-def calc_abandoned_baby():
-    pass
 
+def calc_two_crows(open_price, high, low, close):
+    return _calc_pattern('two_crows', open_price, high, low, close)
 
-def calc_advance_block():
-    pass
 
+def calc_three_black_crows(open_price, high, low, close):
+    return _calc_pattern('three_black_crows', open_price, high, low, close)
 
-def calc_belt_hold():
-    pass
 
+def calc_three_inside_up_down(open_price, high, low, close):
+    return _calc_pattern('three_inside_up_down', open_price, high, low, close)
 
-def calc_breakaway():
-    pass
 
+def calc_three_line_strike(open_price, high, low, close):
+    return _calc_pattern('three_line_strike', open_price, high, low, close)
 
-def calc_clsing_marubozu():
-    pass
 
+def calc_three_outside_up_down(open_price, high, low, close):
+    return _calc_pattern('three_outside_up_down', open_price, high, low, close)
 
-def calc_concealing_baby_swallow():
-    pass
 
+def calc_three_stars_in_the_south(open_price, high, low, close):
+    return _calc_pattern('three_stars_in_the_south', open_price, high, low, close)
 
-def calc_counterattack():
-    pass
 
+def calc_three_advancing_white_soldiers(open_price, high, low, close):
+    return _calc_pattern('three_advancing_white_soldiers', open_price, high, low, close)
 
-def calc_dark_cloud_cover():
-    pass
 
+def calc_abandoned_baby(open_price, high, low, close):
+    return _calc_pattern('abandoned_baby', open_price, high, low, close)
 
-def calc_doji():
-    pass
 
+def calc_advance_block(open_price, high, low, close):
+    return _calc_pattern('advance_block', open_price, high, low, close)
 
-def calc_doji_star():
-    pass
 
+def calc_belt_hold(open_price, high, low, close):
+    return _calc_pattern('belt_hold', open_price, high, low, close)
 
-def calc_dragonfly_doji():
-    pass
 
+def calc_breakaway(open_price, high, low, close):
+    return _calc_pattern('breakaway', open_price, high, low, close)
 
-def calc_engulfing_pattern():
-    pass
 
+def calc_closing_marubozu(open_price, high, low, close):
+    return _calc_pattern('closing_marubozu', open_price, high, low, close)
 
-def calc_evening_doji_star():
-    pass
 
+def calc_concealing_baby_swallow(open_price, high, low, close):
+    return _calc_pattern('concealing_baby_swallow', open_price, high, low, close)
 
-def calc_evening_star():
-    pass
 
+def calc_counterattack(open_price, high, low, close):
+    return _calc_pattern('counterattack', open_price, high, low, close)
 
-def calc_up_down_gap_side_by_side_white_lines():
-    pass
 
+def calc_dark_cloud_cover(open_price, high, low, close):
+    return _calc_pattern('dark_cloud_cover', open_price, high, low, close)
 
-def calc_gravestone_doji():
-    pass
 
+def calc_doji(open_price, high, low, close):
+    return _calc_pattern('doji', open_price, high, low, close)
 
-def calc_hammer():
-    pass
 
+def calc_doji_star(open_price, high, low, close):
+    return _calc_pattern('doji_star', open_price, high, low, close)
 
-def calc_hanging_man():
-    pass
 
+def calc_dragonfly_doji(open_price, high, low, close):
+    return _calc_pattern('dragonfly_doji', open_price, high, low, close)
 
-def calc_harami_pattern():
-    pass
 
+def calc_engulfing_pattern(open_price, high, low, close):
+    return _calc_pattern('engulfing_pattern', open_price, high, low, close)
 
-def calc_harami_cross_pattern():
-    pass
 
+def calc_evening_doji_star(open_price, high, low, close):
+    return _calc_pattern('evening_doji_star', open_price, high, low, close)
 
-def calc_high_wave_candle():
-    pass
 
+def calc_evening_star(open_price, high, low, close):
+    return _calc_pattern('evening_star', open_price, high, low, close)
 
-def calc_hikkake_pattern():
-    pass
 
+def calc_up_down_gap_side_by_side_white_lines(open_price, high, low, close):
+    return _calc_pattern('up_down_gap_side_by_side_white_lines', open_price, high, low, close)
 
-def calc_modified_hikkake_pattenr():
-    pass
 
+def calc_gravestone_doji(open_price, high, low, close):
+    return _calc_pattern('gravestone_doji', open_price, high, low, close)
 
-def calc_homing_pigeon():
-    pass
 
+def calc_hammer(open_price, high, low, close):
+    return _calc_pattern('hammer', open_price, high, low, close)
 
-def calc_identical_three_crows():
-    pass
 
+def calc_hanging_man(open_price, high, low, close):
+    return _calc_pattern('hanging_man', open_price, high, low, close)
 
-def calc_in_neck_pattern():
-    pass
 
+def calc_harami_pattern(open_price, high, low, close):
+    return _calc_pattern('harami_pattern', open_price, high, low, close)
 
-def calc_inverted_hammer():
-    pass
 
+def calc_harami_cross_pattern(open_price, high, low, close):
+    return _calc_pattern('harami_cross_pattern', open_price, high, low, close)
 
-def calc_kicking():
-    pass
 
+def calc_high_wave_candle(open_price, high, low, close):
+    return _calc_pattern('high_wave_candle', open_price, high, low, close)
 
-def calc_kicking_bull_bear_determined_by_the_longer_marubozu():
-    pass
 
+def calc_hikkake_pattern(open_price, high, low, close):
+    return _calc_pattern('hikkake_pattern', open_price, high, low, close)
 
-def calc_ladder_botom():
-    pass
 
+def calc_modified_hikkake_pattern(open_price, high, low, close):
+    return _calc_pattern('modified_hikkake_pattern', open_price, high, low, close)
 
-def calc_long_legged_doji():
-    pass
 
+def calc_homing_pigeon(open_price, high, low, close):
+    return _calc_pattern('homing_pigeon', open_price, high, low, close)
 
-def calc_long_line_candle():
-    pass
 
+def calc_identical_three_crows(open_price, high, low, close):
+    return _calc_pattern('identical_three_crows', open_price, high, low, close)
 
-def calc_marubozu():
-    pass
 
+def calc_in_neck_pattern(open_price, high, low, close):
+    return _calc_pattern('in_neck_pattern', open_price, high, low, close)
 
-def calc_matching_low():
-    pass
 
+def calc_inverted_hammer(open_price, high, low, close):
+    return _calc_pattern('inverted_hammer', open_price, high, low, close)
 
-def calc_mat_hold():
-    pass
 
-def calc_morning_doji_star():
-    pass
+def calc_kicking(open_price, high, low, close):
+    return _calc_pattern('kicking', open_price, high, low, close)
 
 
-def calc_morning_star():
-    pass
+def calc_kicking_bull_bear_determined_by_the_longer_marubozu(open_price, high, low, close):
+    return _calc_pattern('kicking_bull_bear_determined_by_the_longer_marubozu', open_price, high, low, close)
 
 
-def calc_on_neck_pattern():
-    pass
+def calc_ladder_bottom(open_price, high, low, close):
+    return _calc_pattern('ladder_bottom', open_price, high, low, close)
 
-def calc_piercing_pattern():
-    pass
 
+def calc_long_legged_doji(open_price, high, low, close):
+    return _calc_pattern('long_legged_doji', open_price, high, low, close)
 
-def calc_rickshaw_man():
-    pass
 
+def calc_long_line_candle(open_price, high, low, close):
+    return _calc_pattern('long_line_candle', open_price, high, low, close)
 
-def calc_rising_falling_three_methods():
-    pass
 
+def calc_marubozu(open_price, high, low, close):
+    return _calc_pattern('marubozu', open_price, high, low, close)
 
-def calc_separating_lines():
-    pass
 
+def calc_matching_low(open_price, high, low, close):
+    return _calc_pattern('matching_low', open_price, high, low, close)
 
-def calc_shooting_star():
-    pass
 
+def calc_mat_hold(open_price, high, low, close):
+    return _calc_pattern('mat_hold', open_price, high, low, close)
 
-def calc_short_line_candle():
-    pass
 
+def calc_morning_doji_star(open_price, high, low, close):
+    return _calc_pattern('morning_doji_star', open_price, high, low, close)
 
-def calc_spinning_top():
-    pass
 
+def calc_morning_star(open_price, high, low, close):
+    return _calc_pattern('morning_star', open_price, high, low, close)
 
-def calc_stalled_pattern():
-    pass
 
+def calc_on_neck_pattern(open_price, high, low, close):
+    return _calc_pattern('on_neck_pattern', open_price, high, low, close)
 
-def calc_stick_sandwich():
-    pass
 
+def calc_piercing_pattern(open_price, high, low, close):
+    return _calc_pattern('piercing_pattern', open_price, high, low, close)
 
-def calc_takuri():
-    pass
 
+def calc_rickshaw_man(open_price, high, low, close):
+    return _calc_pattern('rickshaw_man', open_price, high, low, close)
 
-def calc_tasuki_gap():
-    pass
 
+def calc_rising_falling_three_methods(open_price, high, low, close):
+    return _calc_pattern('rising_falling_three_methods', open_price, high, low, close)
 
-def calc_thrusting_pattern():
-    pass
 
+def calc_separating_lines(open_price, high, low, close):
+    return _calc_pattern('separating_lines', open_price, high, low, close)
 
-def calc_thristar_pattern():
-    pass
 
+def calc_shooting_star(open_price, high, low, close):
+    return _calc_pattern('shooting_star', open_price, high, low, close)
 
-def calc_unique_three_river():
-    pass
 
+def calc_short_line_candle(open_price, high, low, close):
+    return _calc_pattern('short_line_candle', open_price, high, low, close)
 
-def calc_upside_gap_two_gcrows():
-    pass
 
+def calc_spinning_top(open_price, high, low, close):
+    return _calc_pattern('spinning_top', open_price, high, low, close)
 
-def calc_upside_downside_gap_three_methods():
-    pass
+
+def calc_stalled_pattern(open_price, high, low, close):
+    return _calc_pattern('stalled_pattern', open_price, high, low, close)
+
+
+def calc_stick_sandwich(open_price, high, low, close):
+    return _calc_pattern('stick_sandwich', open_price, high, low, close)
+
+
+def calc_takuri(open_price, high, low, close):
+    return _calc_pattern('takuri', open_price, high, low, close)
+
+
+def calc_tasuki_gap(open_price, high, low, close):
+    return _calc_pattern('tasuki_gap', open_price, high, low, close)
+
+
+def calc_thrusting_pattern(open_price, high, low, close):
+    return _calc_pattern('thrusting_pattern', open_price, high, low, close)
+
+
+def calc_tristar_pattern(open_price, high, low, close):
+    return _calc_pattern('tristar_pattern', open_price, high, low, close)
+
+
+def calc_unique_three_river(open_price, high, low, close):
+    return _calc_pattern('unique_three_river', open_price, high, low, close)
+
+
+def calc_upside_gap_two_crows(open_price, high, low, close):
+    return _calc_pattern('upside_gap_two_crows', open_price, high, low, close)
+
+
+def calc_upside_downside_gap_three_methods(open_price, high, low, close):
+    return _calc_pattern('upside_downside_gap_three_methods', open_price, high, low, close)
@@ -1,6 +1,6 @@
 import numpy as np
-import talib
 
+from trading.indicators.backends import get_backend
 from trading.indicators.exceptions import TalibIntervalException
 
 
@@ -25,6 +25,20 @@ def calc_standard_deviation(data, interval):
         raise TalibIntervalException
 
     data = data[-interval:]
-    data = np.asarray(data)
-    stdev = talib.STDDEV(data, timeperiod=interval)
+    data = np.asarray(data, dtype=np.float64)
+    stdev = get_backend().stddev(data, interval)
     return stdev[-1]
+
+
+def calc_standard_deviation_series(data, interval):
+    """
+    calc_standard_deviation at every data point, computed in a single pass
+    First data point is earliest
+    :return: numpy 64-float array aligned with data, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+
+    if len(data) < interval:
+        return np.full(len(data), np.nan)
+
+    return get_backend().stddev(data, interval)
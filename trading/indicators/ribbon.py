@@ -0,0 +1,221 @@
+import numpy as np
+
+from trading.indicators.backends import get_backend
+
+# Indicators over many window lengths of one series, e.g. moving average ribbons and crossover sweeps
+# Results are window by time matrices, row i holds the indicator over intervals[i] at every data point
+
+# Shortest block of the window sum structures, long blocks keep the per block overhead of numpy small
+# while rounding stays bounded by the block length
+MIN_BLOCK_SIZE = 4096
+
+
+def _as_intervals(intervals):
+    intervals = np.asarray(intervals, dtype=np.int64)
+
+    if intervals.ndim != 1 or np.any(intervals < 1):
+        raise ValueError('Intervals must be a list of positive window lengths')
+    return intervals
+
+
+def _to_blocks(data, intervals):
+    """
+    Cuts the data into zero padded blocks at least as long as the longest interval, NaNs are set to 0
+    :return: blocks by block size array and its missing data mask, None and None if no interval fits the data
+    """
+    num_points = len(data)
+    fitting_intervals = intervals[intervals <= num_points]
+
+    if not len(fitting_intervals):
+        return None, None
+
+    block_size = max(int(fitting_intervals.max()), min(MIN_BLOCK_SIZE, num_points))
+    num_blocks = -(-num_points // block_size)
+
+    blocks = np.zeros(num_blocks * block_size)
+    blocks[:num_points] = data
+    blocks = blocks.reshape((num_blocks, block_size))
+
+    missing = np.isnan(blocks)
+    blocks[missing] = 0.0
+
+    return blocks, missing
+
+
+def _calc_block_sums(blocks):
+    """
+    Prefix sums re-anchored at the start of every block, so rounding stays bounded by the block however
+    long the series
+    :return: prefix sums with a leading 0 and suffix sums of every block
+    """
+    prefix_sums = np.zeros((blocks.shape[0], blocks.shape[1] + 1))
+    np.cumsum(blocks, axis=1, out=prefix_sums[:, 1:])
+
+    suffix_sums = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1]
+
+    return prefix_sums, suffix_sums
+
+
+def _calc_window_sums(block_sums, interval, window_sums):
+    """
+    Sums of interval data points into window_sums, indexed by the first data point of the window
+    With blocks at least interval long, a window lies within one block or spans the suffix of one block
+    and the prefix of the next, so every interval costs a single vectorized pass
+    """
+    prefix_sums, suffix_sums = block_sums
+    split = suffix_sums.shape[1] - interval + 1
+
+    np.subtract(prefix_sums[:, interval:], prefix_sums[:, :split], out=window_sums[:, :split])
+    np.add(suffix_sums[:-1, split:], prefix_sums[1:, 1:interval], out=window_sums[:-1, split:])
+
+
+def _iter_ribbon_sums(block_sums, missing, num_points, intervals):
+    """
+    Sums of the last interval data points for every interval from block sum structures over the same blocks
+    :param block_sums: list of _calc_block_sums results, one per series
+    :param missing: missing data mask of the blocks
+    :return: generator of row, interval and the window sums of every series, NaN over windows holding a NaN
+    """
+    num_blocks, block_size = missing.shape
+
+    has_missing = missing.any()
+    if has_missing:
+        missing_counts = np.zeros(num_points + 1, dtype=np.int64)
+        np.cumsum(missing.ravel()[:num_points], out=missing_counts[1:])
+
+    # Windows starting near the end run into the padding, their sums are cut off
+    window_sums = [np.empty((num_blocks, block_size)) for _ in block_sums]
+
+    for row, interval in enumerate(intervals):
+        if interval > num_points:
+            continue
+
+        interval = int(interval)
+        row_sums = []
+        for series_block_sums, series_window_sums in zip(block_sums, window_sums):
+            _calc_window_sums(series_block_sums, interval, series_window_sums)
+            row_sums.append(series_window_sums.ravel()[:num_points - interval + 1])
+
+        if has_missing:
+            window_missing = missing_counts[interval:] > missing_counts[:-interval]
+            for sums in row_sums:
+                sums[window_missing] = np.nan
+
+        yield row, interval, row_sums
+
+
+def calc_simple_moving_average_ribbon(data, intervals):
+    """
+    Simple moving average over every interval, as talib.SMA, from one block sum structure
+    Rounding does not accumulate over long histories and a NaN only affects the windows containing it
+    First data point is earliest
+    :param intervals: list of window lengths, e.g. range(5, 201)
+    :return: numpy 64-float window by time matrix, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+    intervals = _as_intervals(intervals)
+
+    ribbon = np.full((len(intervals), len(data)), np.nan)
+
+    blocks, missing = _to_blocks(data, intervals)
+    if blocks is None:
+        return ribbon
+
+    for row, interval, (sums,) in _iter_ribbon_sums([_calc_block_sums(blocks)], missing, len(data), intervals):
+        np.multiply(sums, 1.0 / interval, out=ribbon[row, interval - 1:])
+
+    return ribbon
+
+
+def calc_standard_deviation_ribbon(data, intervals):
+    """
+    Population standard deviation over every interval, as talib.STDDEV, from block sum structures of the data
+    and its squares
+    Every block is centred on its own mean to keep the difference of squares well conditioned, block suffixes
+    are moved onto the mean of the next block for the windows spanning both
+    First data point is earliest
+    :return: numpy 64-float window by time matrix, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+    intervals = _as_intervals(intervals)
+
+    ribbon = np.full((len(intervals), len(data)), np.nan)
+
+    blocks, missing = _to_blocks(data, intervals)
+    if blocks is None:
+        return ribbon
+
+    block_size = blocks.shape[1]
+    num_defined = block_size - missing.sum(axis=1)
+    num_defined[-1] -= blocks.size - len(data)
+    block_means = blocks.sum(axis=1) / np.maximum(num_defined, 1)
+
+    blocks -= block_means[:, np.newaxis]
+    blocks[missing] = 0.0
+    blocks.ravel()[len(data):] = 0.0
+
+    block_sums = _calc_block_sums(blocks)
+    square_block_sums = _calc_block_sums(blocks * blocks)
+
+    # sum((x - b)^2) = sum((x - a)^2) + 2 * (a - b) * sum(x - a) + n * (a - b)^2
+    shifts = (block_means[:-1] - block_means[1:])[:, np.newaxis]
+    suffix_sizes = np.arange(block_size, 0, -1)
+    suffix_sums, square_suffix_sums = block_sums[1][:-1], square_block_sums[1][:-1]
+
+    square_suffix_sums += 2 * shifts * suffix_sums + suffix_sizes * shifts * shifts
+    suffix_sums += suffix_sizes * shifts
+
+    for row, interval, (sums, square_sums) in _iter_ribbon_sums([block_sums, square_block_sums], missing,
+                                                                len(data), intervals):
+        # interval * variance = sum of squares - sum * sum / interval
+        sums *= sums
+        sums *= 1.0 / interval
+        square_sums -= sums
+
+        variance = ribbon[row, interval - 1:]
+        np.multiply(square_sums, 1.0 / interval, out=variance)
+        np.maximum(variance, 0.0, out=variance)
+        np.sqrt(variance, out=variance)
+
+    return ribbon
+
+
+def calc_exponential_moving_average_ribbon(data, intervals):
+    """
+    Exponential moving average over every interval, as talib.EMA seeded with the simple moving average
+    The recurrence runs once per interval in the indicator backend rather than stepping every interval
+    through time in Python
+    First data point is earliest
+    :return: numpy 64-float window by time matrix, NaN until interval data points
+    """
+    data = np.asarray(data, dtype=np.float64)
+    intervals = _as_intervals(intervals)
+
+    backend = get_backend()
+
+    ribbon = np.full((len(intervals), len(data)), np.nan)
+    for row, interval in enumerate(intervals):
+        if interval <= len(data):
+            ribbon[row] = backend.ema(data, int(interval))
+
+    return ribbon
+
+
+def calc_crossover_sweep(data, short_intervals, long_intervals, ribbon=calc_simple_moving_average_ribbon):
+    """
+    Percentage difference of every short and long moving average pair, as MAC compares them
+    All averages come from a single ribbon over the union of the intervals
+    First data point is earliest
+    :param ribbon: ribbon function of the moving average, e.g. calc_exponential_moving_average_ribbon
+    :return: numpy 64-float short by long by time array, NaN until the long interval is filled
+    """
+    short_intervals = _as_intervals(short_intervals)
+    long_intervals = _as_intervals(long_intervals)
+
+    intervals = np.union1d(short_intervals, long_intervals)
+    moving_averages = ribbon(data, intervals)
+
+    short_averages = moving_averages[np.searchsorted(intervals, short_intervals)][:, np.newaxis, :]
+    long_averages = moving_averages[np.searchsorted(intervals, long_intervals)][np.newaxis, :, :]
+
+    return 100 * (short_averages - long_averages) / ((short_averages + long_averages) / 2)
@@ -0,0 +1,88 @@
+from collections import deque
+
+from trading.indicators.backends import get_backend
+from trading.indicators.exceptions import TalibIntervalException
+
+
+class RollingExtreme(object):
+    """
+    Rolling maximum or minimum over the last interval data points with amortised O(1) updates
+    A monotonic deque keeps only the points that can still become the extreme of a later window
+    """
+    name = 'Rolling_Extreme'
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.count = 0
+        self.candidates = deque()
+
+    def __repr__(self):
+        representation = '{name} Interval {interval} Count {count}'\
+            .format(name=self.name, interval=self.interval, count=self.count)
+        return representation
+
+    @staticmethod
+    def _replaces(data_point, candidate):
+        raise NotImplementedError
+
+    def update(self, data_point):
+        """
+        :param data_point: newest data point
+        :return: extreme of the last interval data points, None until interval data points were seen
+        """
+        candidates = self.candidates
+
+        while candidates and self._replaces(data_point, candidates[-1][1]):
+            candidates.pop()
+
+        candidates.append((self.count, data_point))
+        self.count += 1
+
+        if candidates[0][0] <= self.count - 1 - self.interval:
+            candidates.popleft()
+
+        return self.value if self.ready else None
+
+    @property
+    def ready(self):
+        return self.count >= self.interval
+
+    @property
+    def value(self):
+        if not self.ready:
+            raise TalibIntervalException
+        return self.candidates[0][1]
+
+
+class RollingMaximum(RollingExtreme):
+    name = 'Rolling_Maximum'
+
+    @staticmethod
+    def _replaces(data_point, candidate):
+        return data_point >= candidate
+
+
+class RollingMinimum(RollingExtreme):
+    name = 'Rolling_Minimum'
+
+    @staticmethod
+    def _replaces(data_point, candidate):
+        return data_point <= candidate
+
+
+def calc_rolling_max_series(data, interval):
+    """
+    Maximum of the last interval data points at every data point, O(n) whatever the interval
+    First data point is earliest
+    :return: numpy 64-float array aligned with data, NaN until interval data points
+    """
+    return get_backend().rolling_max(data, interval)
+
+
+def calc_rolling_min_series(data, interval):
+    """
+    Minimum of the last interval data points at every data point, O(n) whatever the interval
+    First data point is earliest
+    :return: numpy 64-float array aligned with data, NaN until interval data points
+    """
+    return get_backend().rolling_min(data, interval)
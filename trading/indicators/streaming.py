@@ -0,0 +1,598 @@
+import math
+from collections import deque
+
+from trading.indicators.exceptions import TalibIntervalException
+from trading.constants.interval import TRADING_PERIOD_MONTH
+from trading.indicators.cycle_indicators import HILBERT_TRANSFORMATION_PERIOD_LOOKBACK, \
+    HILBERT_TRANSFORMATION_PHASE_LOOKBACK
+from trading.indicators.overlap_studies import MOVING_AVERAGE_TIMEPERIOD
+from trading.indicators.rolling import RollingMaximum, RollingMinimum
+
+HILBERT_TRANSFORMATION_MIN_PERIOD = 6
+HILBERT_TRANSFORMATION_MAX_PERIOD = 50
+HILBERT_TRANSFORMATION_RAD_TO_DEG = 45.0 / math.atan(1)
+HILBERT_TRANSFORMATION_DEG_TO_RAD = 1.0 / HILBERT_TRANSFORMATION_RAD_TO_DEG
+HILBERT_TRANSFORMATION_FULL_CIRCLE = math.atan(1) * 8.0
+
+
+class StreamingIndicator(object):
+    """
+    Indicator updated one data point at a time in constant time
+    Rolling sums are recomputed from the window once per interval updates, so rounding does not accumulate
+    """
+    name = 'Streaming_Indicator'
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.count = 0
+        self._value = None
+
+    def __repr__(self):
+        representation = '{name} Interval {interval} Count {count} Value {value}'\
+            .format(name=self.name, interval=self.interval, count=self.count, value=self._value)
+        return representation
+
+    @property
+    def ready(self):
+        return self._value is not None
+
+    @property
+    def value(self):
+        """
+        Latest indicator value, raises TalibIntervalException until interval data points were seen
+        """
+        if self._value is None:
+            raise TalibIntervalException
+        return self._value
+
+
+class StreamingMovingAverage(StreamingIndicator):
+    """
+    Streaming equivalent of calc_moving_average over the data seen so far
+    """
+    name = 'Streaming_Moving_Average'
+
+    def __init__(self, interval, timeperiod=MOVING_AVERAGE_TIMEPERIOD):
+        super(StreamingMovingAverage, self).__init__(interval)
+        self.timeperiod = min(timeperiod, interval)
+        self.window = deque(maxlen=self.timeperiod)
+        self.window_sum = 0.0
+
+    def update(self, data_point):
+        """
+        :param data_point: newest data point
+        :return: moving average, None until interval data points were seen
+        """
+        data_point = float(data_point)
+
+        if len(self.window) == self.timeperiod:
+            self.window_sum -= self.window[0]
+
+        self.window.append(data_point)
+        self.window_sum += data_point
+        self.count += 1
+
+        if self.count % self.timeperiod == 0:
+            self.window_sum = math.fsum(self.window)
+
+        if self.count >= self.interval:
+            self._value = self.window_sum / self.timeperiod
+
+        return self._value
+
+
+class StreamingStandardDeviation(StreamingIndicator):
+    """
+    Streaming equivalent of calc_standard_deviation, population deviation over the last interval points
+    Mean and squared deviations are updated with Welford's method, replacing the oldest point once the window is full
+    """
+    name = 'Streaming_Standard_Deviation'
+
+    def __init__(self, interval):
+        super(StreamingStandardDeviation, self).__init__(interval)
+        self.window = deque(maxlen=interval)
+        self.mean = 0.0
+        self.squared_deviations = 0.0
+
+    def _resync(self):
+        self.mean = math.fsum(self.window) / len(self.window)
+        self.squared_deviations = math.fsum((data_point - self.mean) ** 2 for data_point in self.window)
+
+    def update(self, data_point):
+        """
+        :param data_point: newest data point
+        :return: standard deviation, None until interval data points were seen
+        """
+        data_point = float(data_point)
+
+        if len(self.window) < self.interval:
+            self.window.append(data_point)
+            delta = data_point - self.mean
+            self.mean += delta / len(self.window)
+            self.squared_deviations += delta * (data_point - self.mean)
+        else:
+            oldest_point = self.window[0]
+            self.window.append(data_point)
+            old_mean = self.mean
+            self.mean += (data_point - oldest_point) / self.interval
+            self.squared_deviations += (data_point - oldest_point) * (data_point - self.mean + oldest_point - old_mean)
+
+        self.count += 1
+
+        if self.count % self.interval == 0:
+            self._resync()
+
+        if self.count >= self.interval:
+            self._value = math.sqrt(max(self.squared_deviations / self.interval, 0.0))
+
+        return self._value
+
+
+class StreamingAverageTrueRange(StreamingIndicator):
+    """
+    Streaming equivalent of calc_average_true_range, the mean true range of the last interval candles
+    With wilder=True the true range is Wilder smoothed over the whole history instead, as talib.ATR
+    """
+    name = 'Streaming_Average_True_Range'
+
+    def __init__(self, interval, wilder=False):
+        super(StreamingAverageTrueRange, self).__init__(interval)
+        self.wilder = wilder
+        self.true_ranges = deque(maxlen=interval)
+        self.true_range_sum = 0.0
+        self.previous_close = None
+
+    def update(self, close, high, low):
+        """
+        :return: average true range, None until interval + 1 candles were seen
+        """
+        close, high, low = float(close), float(high), float(low)
+        previous_close = self.previous_close
+        self.previous_close = close
+        self.count += 1
+
+        if previous_close is None:
+            return self._value
+
+        true_range = max(high, previous_close) - min(low, previous_close)
+
+        if self.wilder and self._value is not None:
+            self._value = (self._value * (self.interval - 1) + true_range) / self.interval
+            return self._value
+
+        if len(self.true_ranges) == self.interval:
+            self.true_range_sum -= self.true_ranges[0]
+
+        self.true_ranges.append(true_range)
+        self.true_range_sum += true_range
+
+        if (self.count - 1) % self.interval == 0:
+            self.true_range_sum = math.fsum(self.true_ranges)
+
+        if len(self.true_ranges) == self.interval:
+            self._value = self.true_range_sum / self.interval
+
+        return self._value
+
+
+class StreamingChandalierExits(StreamingIndicator):
+    """
+    Streaming equivalent of calc_chandalier_exits
+    The period high and low come from monotonic deques, so long lookbacks cost the same per update as short ones
+    """
+    name = 'Streaming_Chandalier_Exits'
+
+    def __init__(self, volatility_threshold=3, target_interval=TRADING_PERIOD_MONTH):
+        super(StreamingChandalierExits, self).__init__(target_interval + 1)
+        self.volatility_threshold = volatility_threshold
+        self.period_high = RollingMaximum(target_interval + 1)
+        self.period_low = RollingMinimum(target_interval + 1)
+        self.average_true_range = StreamingAverageTrueRange(target_interval)
+
+    def update(self, close, high, low):
+        """
+        :return: long exit and short exit, None until target_interval + 1 candles were seen
+        """
+        period_high = self.period_high.update(float(high))
+        period_low = self.period_low.update(float(low))
+        atr = self.average_true_range.update(close, high, low)
+        self.count += 1
+
+        if atr is not None:
+            self._value = (period_high - (atr * self.volatility_threshold),
+                           period_low + (atr * self.volatility_threshold))
+
+        return self._value
+
+
+class HilbertTransformFilter(object):
+    """
+    Hilbert transform FIR filter of the TA-Lib HT_* indicators
+    Odd and even data points run through separate delay lines
+    """
+    a = 0.0962
+    b = 0.5769
+
+    def __init__(self):
+        self.delays = ([0.0] * 3, [0.0] * 3)
+        self.previous = [0.0, 0.0]
+        self.previous_input = [0.0, 0.0]
+
+    def update(self, data_point, parity, delay_index, adjusted_previous_period):
+        """
+        :param parity: 0 on even, 1 on odd data points
+        :param delay_index: shared position in the delay lines, advanced after every even data point
+        """
+        delays = self.delays[parity]
+
+        filtered_point = self.a * data_point
+        value = -delays[delay_index]
+        delays[delay_index] = filtered_point
+        value += filtered_point
+        value -= self.previous[parity]
+        self.previous[parity] = self.b * self.previous_input[parity]
+        value += self.previous[parity]
+        self.previous_input[parity] = data_point
+        value *= adjusted_previous_period
+
+        return value
+
+
+class StreamingHilbertTransform(StreamingIndicator):
+    """
+    Ehlers dominant cycle measurement carried forward one data point at a time, the filter state of talib.HT_DCPERIOD
+    Agrees with TA-Lib over the same history, whose computation also starts at the first data point
+    """
+    name = 'Streaming_Hilbert_Transform'
+
+    # Data points before the first value, and weighted moving average updates before the filters start
+    lookback = HILBERT_TRANSFORMATION_PERIOD_LOOKBACK
+    smoothing_warm_up = 9
+
+    def __init__(self):
+        super(StreamingHilbertTransform, self).__init__(self.lookback + 1)
+        self.prices = deque(maxlen=HILBERT_TRANSFORMATION_MAX_PERIOD)
+
+        self.weighted_sum = 0.0
+        self.weighted_sub = 0.0
+        self.trailing_price = 0.0
+
+        self.detrender = HilbertTransformFilter()
+        self.quadrature = HilbertTransformFilter()
+        self.in_phase_lead = HilbertTransformFilter()
+        self.quadrature_lead = HilbertTransformFilter()
+        self.delay_index = 0
+
+        # In phase components delayed by three data points, for odd and even data points
+        self.in_phase_delays = ([0.0, 0.0], [0.0, 0.0])
+
+        self.in_phase = 0.0
+        self.quadrature_value = 0.0
+        self.previous_in_phase = 0.0
+        self.previous_quadrature = 0.0
+        self.real_part = 0.0
+        self.imaginary_part = 0.0
+        self.period = 0.0
+        self.smooth_period = 0.0
+
+    def _smooth_price(self, data_point):
+        """
+        Four point weighted moving average of the price, as TA-Lib's DO_PRICE_WMA
+        """
+        self.weighted_sub += data_point
+        self.weighted_sub -= self.trailing_price
+        self.weighted_sum += data_point * 4.0
+        self.trailing_price = self.prices[-4]
+        smoothed_price = self.weighted_sum * 0.1
+        self.weighted_sum -= self.weighted_sub
+
+        return smoothed_price
+
+    def _update_period(self, parity, smoothed_price):
+        adjusted_previous_period = (0.075 * self.period) + 0.54
+        delay_index = self.delay_index
+        in_phase_delays = self.in_phase_delays[parity]
+
+        detrender = self.detrender.update(smoothed_price, parity, delay_index, adjusted_previous_period)
+        in_phase = in_phase_delays[0]
+        quadrature = self.quadrature.update(detrender, parity, delay_index, adjusted_previous_period)
+        in_phase_lead = self.in_phase_lead.update(in_phase, parity, delay_index, adjusted_previous_period)
+        quadrature_lead = self.quadrature_lead.update(quadrature, parity, delay_index, adjusted_previous_period)
+
+        if parity == 0:
+            self.delay_index = (delay_index + 1) % 3
+
+        quadrature_2 = (0.2 * (quadrature + in_phase_lead)) + (0.8 * self.previous_quadrature)
+        in_phase_2 = (0.2 * (in_phase - quadrature_lead)) + (0.8 * self.previous_in_phase)
+
+        other_in_phase_delays = self.in_phase_delays[1 - parity]
+        other_in_phase_delays[0] = other_in_phase_delays[1]
+        other_in_phase_delays[1] = detrender
+
+        self.in_phase = in_phase
+        self.quadrature_value = quadrature
+
+        self.real_part = (0.2 * ((in_phase_2 * self.previous_in_phase) + (quadrature_2 * self.previous_quadrature))) \
+            + (0.8 * self.real_part)
+        self.imaginary_part = (0.2 * ((in_phase_2 * self.previous_quadrature) -
+                                      (quadrature_2 * self.previous_in_phase))) + (0.8 * self.imaginary_part)
+        self.previous_quadrature = quadrature_2
+        self.previous_in_phase = in_phase_2
+
+        previous_period = self.period
+        period = previous_period
+        if self.imaginary_part != 0.0 and self.real_part != 0.0:
+            period = 360.0 / (math.atan(self.imaginary_part / self.real_part) * HILBERT_TRANSFORMATION_RAD_TO_DEG)
+
+        period = min(period, 1.5 * previous_period)
+        period = max(period, 0.67 * previous_period)
+        period = min(max(period, HILBERT_TRANSFORMATION_MIN_PERIOD), HILBERT_TRANSFORMATION_MAX_PERIOD)
+
+        self.period = (0.2 * period) + (0.8 * previous_period)
+        self.smooth_period = (0.33 * self.period) + (0.67 * self.smooth_period)
+
+    def _update_cycle(self, data_point, smoothed_price):
+        pass
+
+    def _output(self):
+        return self.smooth_period
+
+    def update(self, data_point):
+        """
+        :param data_point: newest data point
+        :return: indicator value, None until lookback + 1 data points were seen
+        """
+        data_point = float(data_point)
+        today = self.count
+        self.count += 1
+        self.prices.append(data_point)
+
+        if today < 3:
+            self.weighted_sub += data_point
+            self.weighted_sum += data_point * (today + 1)
+            return self._value
+
+        smoothed_price = self._smooth_price(data_point)
+
+        if today < 3 + self.smoothing_warm_up:
+            return self._value
+
+        self._update_period(today % 2, smoothed_price)
+        self._update_cycle(data_point, smoothed_price)
+
+        if today >= self.lookback:
+            self._value = self._output()
+
+        return self._value
+
+
+class StreamingDominantCyclePeriod(StreamingHilbertTransform):
+    """
+    Streaming equivalent of calc_hilbert_transformation_dominant_cycle_period
+    """
+    name = 'Streaming_Dominant_Cycle_Period'
+
+
+class StreamingPhasorComponents(StreamingHilbertTransform):
+    """
+    Streaming equivalent of calc_hilbert_transformation_phasor_components, in phase and quadrature
+    """
+    name = 'Streaming_Phasor_Components'
+
+    def _output(self):
+        return self.in_phase, self.quadrature_value
+
+
+class StreamingDominantCyclePhase(StreamingHilbertTransform):
+    """
+    Streaming equivalent of calc_hilbert_transformation_dominant_cycle_phase, in degrees
+    """
+    name = 'Streaming_Dominant_Cycle_Phase'
+
+    lookback = HILBERT_TRANSFORMATION_PHASE_LOOKBACK
+    smoothing_warm_up = 34
+
+    def __init__(self):
+        super(StreamingDominantCyclePhase, self).__init__()
+        self.smoothed_prices = deque([0.0] * HILBERT_TRANSFORMATION_MAX_PERIOD, maxlen=HILBERT_TRANSFORMATION_MAX_PERIOD)
+        self.phase = 0.0
+
+    def _update_phase(self, smoothed_price):
+        self.smoothed_prices.append(smoothed_price)
+
+        dominant_cycle_period = int(self.smooth_period + 0.5)
+        real_part = 0.0
+        imaginary_part = 0.0
+        for i in range(dominant_cycle_period):
+            angle = (i * HILBERT_TRANSFORMATION_FULL_CIRCLE) / dominant_cycle_period
+            smoothed_price = self.smoothed_prices[-1 - i]
+            real_part += math.sin(angle) * smoothed_price
+            imaginary_part += math.cos(angle) * smoothed_price
+
+        phase = self.phase
+        if abs(imaginary_part) > 0.0:
+            phase = math.atan(real_part / imaginary_part) * HILBERT_TRANSFORMATION_RAD_TO_DEG
+        elif real_part < 0.0:
+            phase -= 90.0
+        elif real_part > 0.0:
+            phase += 90.0
+
+        phase += 90.0
+        # Compensates the one data point lag of the weighted moving average
+        phase += 360.0 / self.smooth_period
+        if imaginary_part < 0.0:
+            phase += 180.0
+        if phase > 315.0:
+            phase -= 360.0
+
+        self.phase = phase
+
+    def _update_cycle(self, data_point, smoothed_price):
+        self._update_phase(smoothed_price)
+
+    def _output(self):
+        return self.phase
+
+
+class StreamingSineWave(StreamingDominantCyclePhase):
+    """
+    Streaming equivalent of calc_hilbert_transformation_sine_wave, sine and lead sine
+    """
+    name = 'Streaming_Sine_Wave'
+
+    def _output(self):
+        return math.sin(self.phase * HILBERT_TRANSFORMATION_DEG_TO_RAD), \
+            math.sin((self.phase + 45.0) * HILBERT_TRANSFORMATION_DEG_TO_RAD)
+
+
+class StreamingTrendVsCycleMode(StreamingDominantCyclePhase):
+    """
+    Streaming equivalent of calc_hilbert_transformation_trend_vs_cycle_mode, 1 trend and 0 cycle mode
+    """
+    name = 'Streaming_Trend_Vs_Cycle_Mode'
+
+    def __init__(self):
+        super(StreamingTrendVsCycleMode, self).__init__()
+        self.sine = 0.0
+        self.lead_sine = 0.0
+        self.instantaneous_trends = [0.0, 0.0, 0.0]
+        self.days_in_trend = 0
+        self.trend = 0
+
+    def _update_cycle(self, data_point, smoothed_price):
+        previous_phase = self.phase
+        self._update_phase(smoothed_price)
+
+        previous_sine = self.sine
+        previous_lead_sine = self.lead_sine
+        self.sine = math.sin(self.phase * HILBERT_TRANSFORMATION_DEG_TO_RAD)
+        self.lead_sine = math.sin((self.phase + 45.0) * HILBERT_TRANSFORMATION_DEG_TO_RAD)
+
+        dominant_cycle_period = int(self.smooth_period + 0.5)
+        mean_price = 0.0
+        for i in range(dominant_cycle_period):
+            mean_price += self.prices[-1 - i]
+        if dominant_cycle_period > 0:
+            mean_price = mean_price / dominant_cycle_period
+
+        instantaneous_trends = self.instantaneous_trends
+        trendline = (4.0 * mean_price + 3.0 * instantaneous_trends[0] + 2.0 * instantaneous_trends[1] +
+                     instantaneous_trends[2]) / 10.0
+        self.instantaneous_trends = [mean_price] + instantaneous_trends[:2]
+
+        trend = 1
+
+        # Days in trend are counted from the last crossing of the sine and lead sine
+        if (self.sine > self.lead_sine and previous_sine <= previous_lead_sine) or \
+                (self.sine < self.lead_sine and previous_sine >= previous_lead_sine):
+            self.days_in_trend = 0
+            trend = 0
+
+        self.days_in_trend += 1
+        if self.days_in_trend < 0.5 * self.smooth_period:
+            trend = 0
+
+        phase_change = self.phase - previous_phase
+        if self.smooth_period != 0.0 and 0.67 * 360.0 / self.smooth_period < phase_change < \
+                1.5 * 360.0 / self.smooth_period:
+            trend = 0
+
+        if trendline != 0.0 and abs((smoothed_price - trendline) / trendline) >= 0.015:
+            trend = 1
+
+        self.trend = trend
+
+    def _output(self):
+        return self.trend
+
+
+class StreamingOnBalanceVolume(StreamingIndicator):
+    """
+    Streaming equivalent of calc_on_balance_volume over the data seen so far
+    """
+    name = 'Streaming_On_Balance_Volume'
+
+    def __init__(self):
+        super(StreamingOnBalanceVolume, self).__init__(1)
+        self.previous_close = None
+
+    def update(self, close, volume):
+        """
+        :return: on balance volume
+        """
+        close, volume = float(close), float(volume)
+        previous_close = self.previous_close
+        self.previous_close = close
+        self.count += 1
+
+        if previous_close is None:
+            self._value = volume
+        elif close > previous_close:
+            self._value += volume
+        elif close < previous_close:
+            self._value -= volume
+
+        return self._value
+
+
+class StreamingChaikinADLine(StreamingIndicator):
+    """
+    Streaming equivalent of calc_chaikin_a_d_line over the data seen so far
+    """
+    name = 'Streaming_Chaikin_A_D_Line'
+
+    def __init__(self):
+        super(StreamingChaikinADLine, self).__init__(1)
+        self.a_d_line = 0.0
+
+    def update(self, close, high, low, volume):
+        """
+        :return: A/D line
+        """
+        close, high, low, volume = float(close), float(high), float(low), float(volume)
+        self.count += 1
+
+        candle_range = high - low
+        if candle_range > 0.0:
+            self.a_d_line += (((close - low) - (high - close)) / candle_range) * volume
+
+        self._value = self.a_d_line
+        return self._value
+
+
+class StreamingChaikinADOscillator(StreamingIndicator):
+    """
+    Streaming equivalent of calc_chaikin_a_d_oscillator over the data seen so far
+    Both exponential moving averages start at the first A/D line value, as in TA-Lib
+    """
+    name = 'Streaming_Chaikin_A_D_Oscillator'
+
+    def __init__(self, fast_interval=3, slow_interval=10):
+        super(StreamingChaikinADOscillator, self).__init__(max(fast_interval, slow_interval))
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.fast_smoothing = 2.0 / (fast_interval + 1)
+        self.slow_smoothing = 2.0 / (slow_interval + 1)
+
+        self.a_d_line = StreamingChaikinADLine()
+        self.fast_average = None
+        self.slow_average = None
+
+    def update(self, close, high, low, volume):
+        """
+        :return: A/D oscillator, None until max(fast_interval, slow_interval) candles were seen
+        """
+        a_d_line = self.a_d_line.update(close, high, low, volume)
+        self.count += 1
+
+        if self.fast_average is None:
+            self.fast_average = a_d_line
+            self.slow_average = a_d_line
+        else:
+            self.fast_average = (self.fast_smoothing * a_d_line) + ((1.0 - self.fast_smoothing) * self.fast_average)
+            self.slow_average = (self.slow_smoothing * a_d_line) + ((1.0 - self.slow_smoothing) * self.slow_average)
+
+        if self.count >= self.interval:
+            self._value = self.fast_average - self.slow_average
+
+        return self._value
@@ -1,6 +1,6 @@
 import numpy as np
-import talib
 
+from trading.indicators.backends import get_backend
 from trading.indicators.exceptions import TalibIntervalException
 
 
@@ -15,14 +15,33 @@ def calc_average_true_range(close, high, low, interval):
     low = low[-required_interval:]
     close = close[-required_interval:]
 
-    high = np.asarray(high)
-    low = np.asarray(low)
-    close = np.asarray(close)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
 
-    atr = talib.ATR(high, low, close, timeperiod=interval)
+    # With interval + 1 candles the Wilder average is its seed, the mean of the interval true ranges
+    backend = get_backend()
+    atr = backend.sma(backend.true_range(high, low, close), interval)
     return atr[-1]
 
 
+def calc_average_true_range_series(close, high, low, interval):
+    """
+    calc_average_true_range at every candle, the mean true range of the last interval candles
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until interval + 1 candles
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    if len(close) < interval + 1:
+        return np.full(len(close), np.nan)
+
+    backend = get_backend()
+    return backend.sma(backend.true_range(high, low, close), interval)
+
+
 def calc_normalized_average_true_range():
     pass
 
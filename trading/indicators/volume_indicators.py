@@ -1,14 +1,54 @@
-import numpy as np
-import talib
+from trading.indicators.backends import talib
+from trading.indicators.momentum_indicators import _as_array, _latest
 
 
-def calc_chaikin_a_d_line():
-    pass
+def calc_chaikin_a_d_line_series(high, low, close, volume):
+    """
+    Cumulative money flow volume, the accumulation starts at the first data point
+    First data point is earliest
+    :return: numpy 64-float array aligned with close
+    """
+    return talib.AD(_as_array(high), _as_array(low), _as_array(close), _as_array(volume))
 
 
-def calc_chaikin_a_d_oscillator():
-    pass
+def calc_chaikin_a_d_line(high, low, close, volume):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_chaikin_a_d_line_series(high, low, close, volume))
 
 
-def calc_on_balance_volume():
-    pass
+def calc_chaikin_a_d_oscillator_series(high, low, close, volume, fast_interval=3, slow_interval=10):
+    """
+    Difference of the fast and slow exponential moving averages of the A/D line
+    First data point is earliest
+    :return: numpy 64-float array aligned with close, NaN until the indicator is defined
+    """
+    return talib.ADOSC(_as_array(high), _as_array(low), _as_array(close), _as_array(volume),
+                       fastperiod=fast_interval, slowperiod=slow_interval)
+
+
+def calc_chaikin_a_d_oscillator(high, low, close, volume, fast_interval=3, slow_interval=10):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_chaikin_a_d_oscillator_series(high, low, close, volume, fast_interval, slow_interval))
+
+
+def calc_on_balance_volume_series(close, volume):
+    """
+    Volume added on up closes and subtracted on down closes, starting from the first volume
+    First data point is earliest
+    :return: numpy 64-float array aligned with close
+    """
+    return talib.OBV(_as_array(close), _as_array(volume))
+
+
+def calc_on_balance_volume(close, volume):
+    """
+    First data point is earliest
+    :return: newest value
+    """
+    return _latest(calc_on_balance_volume_series(close, volume))
@@ -0,0 +1,29 @@
+from argparse import ArgumentParser
+
+from trading.candles.binary import load_candle_file
+from trading.constants.price_data import PRICE_ASK_CLOSE, PRICE_ASK_HIGH, PRICE_ASK_LOW
+from trading.indicators.backends.benchmark import benchmark_backends, get_fastest_backends
+
+
+def main(candle_file, interval, repeats):
+    candle_store = load_candle_file(candle_file)
+
+    results = benchmark_backends(candle_store.column(PRICE_ASK_CLOSE), candle_store.column(PRICE_ASK_HIGH),
+                                 candle_store.column(PRICE_ASK_LOW), interval=interval, repeats=repeats)
+    fastest_backends = get_fastest_backends(results)
+
+    print('Benchmarked', len(candle_store), 'candles of', candle_store.instrument)
+    for result in results:
+        print('{indicator:<12} {backend:<8} max difference {max_difference:.3e} {points_per_second:>14,.0f} points/s{fastest}'
+              .format(fastest=' fastest' if fastest_backends[result['indicator']] == result['backend'] else '',
+                      **result))
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser()
+    parser.add_argument('candle_file')
+    parser.add_argument('--interval', type=int, default=14)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.candle_file, args.interval, args.repeats)
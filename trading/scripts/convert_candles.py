@@ -0,0 +1,22 @@
+import time
+
+from argparse import ArgumentParser
+
+from trading.candles.binary import convert_json_file
+
+
+def main(input_file, output_file, instrument, granularity):
+    start_time = time.time()
+    num_candles = convert_json_file(input_file, output_file, instrument, granularity)
+    print('Converted', num_candles, 'candles in', time.time() - start_time, 'seconds')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser()
+    parser.add_argument('input_file')
+    parser.add_argument('output_file')
+    parser.add_argument('instrument')
+    parser.add_argument('granularity')
+    args = parser.parse_args()
+
+    main(args.input_file, args.output_file, args.instrument, args.granularity)
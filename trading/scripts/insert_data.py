@@ -1,17 +1,12 @@
-import json
-
-import time
-from bson import ObjectId
 from argparse import ArgumentParser
+from trading.candles.collection import ensure_candle_indexes, make_candle_documents, ingest_candle_batches, \
+    upsert_candle_documents
+from trading.candles.stream import iter_json_candle_batches
 from trading.db import get_database
+from trading.util.log import Logger
 
 DATE_FORMAT = 'YYYY-M-D-H-m'
-
-
-def load_json(file_name):
-    with open(file_name) as f:
-        data = json.load(f)
-    return data
+CANDLE_BATCH_SIZE = 10000
 
 
 def _get_default_chart(instrument, granularity, title):
@@ -30,36 +25,66 @@ def _get_default_chart(instrument, granularity, title):
         'title': {
             'text': title
         },
-        'candles': ''
+        'num_candles': 0,
+        'start_time': None,
+        'end_time': None
     }
     return chart_data
 
 
+def _upsert_chart(db, chart):
+    """
+    Charts are keyed by instrument, granularity and title, so re-running an insert updates its chart
+    """
+    db.candle_data.update_one({'instrument': chart['instrument'], 'granularity': chart['granularity'],
+                               'title.text': chart['title']['text']}, {'$set': chart}, upsert=True)
+
+
+def bulk_main(input_file, instrument, granularity, title, batch_size, num_workers):
+    """
+    Streams the file into unordered upserts on the candle time key, re-runs are idempotent
+    """
+    logger = Logger()
+    db = get_database()
+
+    candle_batches = iter_json_candle_batches(input_file, batch_size)
+    ingestion = ingest_candle_batches(db, candle_batches, instrument, granularity, num_workers, logger=logger)
+
+    chart = _get_default_chart(instrument, granularity, title)
+    chart.update(ingestion)
+    chart.pop('candles_per_second')
+    _upsert_chart(db, chart)
+
+    logger.info('Ingested {num_candles} candles at {rate:.0f} candles/sec'
+                .format(num_candles=ingestion['num_candles'], rate=ingestion['candles_per_second']))
+
+
 def main(input_file, instrument, granularity, title):
+    """
+    Upserts the file batch by batch on the candle time key like bulk_main, re-runs are idempotent
+    """
     db = get_database()
-    candle_data = load_json(input_file)
+    ensure_candle_indexes(db)
 
     chart = _get_default_chart(instrument, granularity, title)
 
-    candle_size = len(candle_data)
+    candle_times = []
+    num_candles = 0
 
-    max_candle_slice = 30000
-    print(max_candle_slice, candle_size)
-    if candle_size < max_candle_slice:
-        chart['candles'] = candle_data
-        db.candle_data.insert(chart)
-    else:
-        target_num_pieces = (candle_size / max_candle_slice) + 1
-        for i in range(0, target_num_pieces):
-            start_slice = max_candle_slice * i
-            end_slice = start_slice + max_candle_slice
-            chart['candles'] = candle_data[start_slice:end_slice]
-            old_title = chart['title']['text']
-            chart['title']['text'] = old_title + '_' + str(i)
-            time.sleep(2)
-            chart['_id'] = ObjectId()
-            print('Start:', start_slice, 'End:', end_slice)
-            db.candle_data.insert(chart)
+    for candles in iter_json_candle_batches(input_file, CANDLE_BATCH_SIZE):
+        documents = make_candle_documents(candles, instrument, granularity)
+        upsert_candle_documents(db, documents)
+
+        batch_times = [document['time'] for document in documents]
+        candle_times = [min(candle_times + batch_times), max(candle_times + batch_times)]
+
+        num_candles += len(documents)
+        print('Inserted:', num_candles)
+
+    if num_candles:
+        chart.update({'start_time': candle_times[0], 'end_time': candle_times[1], 'num_candles': num_candles})
+
+    _upsert_chart(db, chart)
 
 
 if __name__ == '__main__':
@@ -68,6 +93,12 @@ if __name__ == '__main__':
     parser.add_argument('instrument')
     parser.add_argument('granularity')
     parser.add_argument('title')
+    parser.add_argument('--bulk', action='store_true')
+    parser.add_argument('--batch-size', type=int, default=CANDLE_BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=1)
     args = parser.parse_args()
 
-    main(args.input_file, args.instrument, args.granularity, args.title)
+    if args.bulk:
+        bulk_main(args.input_file, args.instrument, args.granularity, args.title, args.batch_size, args.workers)
+    else:
+        main(args.input_file, args.instrument, args.granularity, args.title)
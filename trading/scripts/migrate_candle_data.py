@@ -0,0 +1,16 @@
+import time
+
+from trading.candles.collection import migrate_chart_documents
+from trading.db import get_database
+
+
+def main():
+    db = get_database()
+
+    start_time = time.time()
+    num_candles = migrate_chart_documents(db)
+    print('Migrated', num_candles, 'candles in', time.time() - start_time, 'seconds')
+
+
+if __name__ == '__main__':
+    main()
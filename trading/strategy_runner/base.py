@@ -4,6 +4,7 @@ import time
 from abc import abstractmethod, ABCMeta
 
 from trading.algorithms import initialize_strategy
+from trading.candles.store import CandleStore
 from trading.constants.order import SIDE_SELL, SIDE_BUY, SIDE_STAY
 from trading.constants.price_data import PRICE_ASK
 from trading.db import get_database
@@ -34,6 +35,15 @@ class TradingStrategyRunner(object):
         self.interval = self.strategy.interval
         self.instrument = self.strategy.instrument
 
+    def precompute_strategy_indicators(self):
+        """
+        Lets the strategy compute its indicators once over the full broker history, when the broker holds it in memory
+        """
+        candle_store = getattr(self.broker, 'candle_store', None)
+
+        if isinstance(candle_store, CandleStore):
+            self.strategy.precompute_indicators(candle_store)
+
     @abstractmethod
     def tick(self):
         raise NotImplementedError
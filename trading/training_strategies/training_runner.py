@@ -6,9 +6,6 @@ from trading.live.exceptions import LiveTradingException, KeyboardInterruptMessa
 from trading.strategy_runner.base import TradingStrategyRunner
 
 
-TRAINING_PERIOD_PADDING = 1000
-
-
 class TrainingStrategyRunner(TradingStrategyRunner):
     _logger = None
 
@@ -24,8 +21,11 @@ class TrainingStrategyRunner(TradingStrategyRunner):
         self.classifier_name = classifier_name
         self.classifier = CLASSIFIERS[classifier_name](classifier_config)
 
-        broker.get_backtest_price_data(self.instrument, num_training_points + TRAINING_PERIOD_PADDING,
-                                       self.strategy.granularity)
+        # The window of the last training point ends data_window - 1 candles after it
+        broker.get_backtest_price_data(num_training_points + self.strategy.data_window - 1, self.strategy.granularity,
+                                       self.instrument)
+
+        self.precompute_strategy_indicators()
 
     def tick(self):
         while self.tick_num < self.num_training_points:
@@ -37,12 +37,11 @@ class TrainingStrategyRunner(TradingStrategyRunner):
 
                 self.update_strategy_portfolio(order_responses)
 
-                historical_market_data = self.broker.get_historical_price_data(self.instrument,
-                                                                               count=self.strategy.data_window,
+                historical_market_data = self.broker.get_historical_price_data(count=self.strategy.data_window,
                                                                                granularity=self.strategy.granularity,
                                                                                tick=self.tick_num)
 
-                current_market_data = self.broker.get_current_price_data(instrument=self.instrument, tick=self.tick_num)
+                current_market_data = self.broker.get_current_price_data(tick=self.tick_num)
 
                 self.strategy.analyze_data({
                     'historical': historical_market_data,
@@ -2,6 +2,9 @@ from trading.constants.price_data import PRICE_ASK
 
 
 def normalize_price_data(price_data, target_field=PRICE_ASK):
+    if hasattr(price_data, 'column'):
+        return price_data.column(target_field)
+
     prices = [candle_data[target_field] for candle_data in price_data]
     return prices
 